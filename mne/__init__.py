@@ -43,7 +43,8 @@ from .source_space import (read_source_spaces, vertex_to_mni,
                            setup_volume_source_space,
                            add_source_space_distances)
 from .epochs import Epochs, EpochsArray, read_epochs
-from .evoked import Evoked, EvokedArray, read_evokeds, write_evokeds
+from .evoked import (Evoked, EvokedArray, EvokedIndex, read_evokeds,
+                     write_evokeds, grand_average_evokeds)
 from .label import (label_time_courses, read_label, label_sign_flip,
                     write_label, stc_to_label, grow_labels, Label, split_label,
                     BiHemiLabel, read_labels_from_annot, write_labels_to_annot)
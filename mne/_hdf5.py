@@ -13,6 +13,48 @@ from .externals.six import string_types, text_type
 ##############################################################################
 # WRITE
 
+def _open_hdf5(fname, mode='r'):
+    """Helper to open an HDF5 file with any Pytables version"""
+    tb = _check_pytables()
+    o_f = tb.open_file if hasattr(tb, 'open_file') else tb.openFile
+    return o_f(fname, mode=mode)
+
+
+def _create_chunked_array(fid, key, shape, dtype, chunkshape, complevel=5):
+    """Create a chunked array that can be written and read in pieces
+
+    Parameters
+    ----------
+    fid : instance of tables.File
+        The open file.
+    key : str
+        Name of the array node (created under the root).
+    shape : tuple of int
+        Shape of the array.
+    dtype : numpy dtype
+        Data type of the array.
+    chunkshape : tuple of int
+        Shape of each chunk. Only the chunks overlapping a selection are
+        read from disk.
+    complevel : int
+        The zlib compression level (0 disables compression).
+
+    Returns
+    -------
+    node : instance of tables.CArray
+        The array node, which supports slice assignment and indexing.
+    """
+    tb = _check_pytables()
+    c_c_a = (fid.create_carray if hasattr(fid, 'create_carray')
+             else fid.createCArray)
+    filters = None
+    if complevel > 0:
+        filters = tb.Filters(complib='zlib', complevel=complevel)
+    atom = tb.Atom.from_dtype(np.dtype(dtype))
+    return c_c_a(fid.root, key, atom, shape, title='ndarray',
+                 filters=filters, chunkshape=chunkshape)
+
+
 def write_hdf5(fname, data, overwrite=False):
     """Write python object to HDF5 format using Pytables
 
@@ -31,8 +73,7 @@ def write_hdf5(fname, data, overwrite=False):
     if op.isfile(fname) and not overwrite:
         raise IOError('file "%s" exists, use overwrite=True to overwrite'
                       % fname)
-    o_f = tb.open_file if hasattr(tb, 'open_file') else tb.openFile
-    with o_f(fname, mode='w') as fid:
+    with _open_hdf5(fname, mode='w') as fid:
         if hasattr(fid, 'create_group'):
             c_g = fid.create_group
             c_t = fid.create_table
@@ -113,11 +154,9 @@ def read_hdf5(fname):
     data : object
         The loaded data. Can be of any type supported by ``write_hdf5``.
     """
-    tb = _check_pytables()
     if not op.isfile(fname):
         raise IOError('file "%s" not found' % fname)
-    o_f = tb.open_file if hasattr(tb, 'open_file') else tb.openFile
-    with o_f(fname, mode='r') as fid:
+    with _open_hdf5(fname, mode='r') as fid:
         if not hasattr(fid.root, 'mnepython'):
             raise TypeError('no mne-python data found')
         data = _triage_read(fid.root.mnepython)
@@ -22,6 +22,7 @@ from .io.meas_info import read_bad_channels
 from .io.proj import _read_proj, _write_proj
 from .io.tag import find_tag
 from .io.tree import dir_tree_find
+from .io.base import _iter_raw_chunks
 from .io.write import (start_block, end_block, write_int, write_name_list,
                        write_double, write_float_matrix)
 from .epochs import _is_good
@@ -266,11 +267,8 @@ def compute_raw_data_covariance(raw, tmin=None, tmax=None, tstep=0.2,
     idx_by_type = channel_indices_by_type(info)
 
     # Read data in chuncks
-    for first in range(start, stop, step):
-        last = first + step
-        if last >= stop:
-            last = stop
-        raw_segment, times = raw[picks, first:last]
+    for first, last, raw_segment, _ in _iter_raw_chunks(raw, picks, start,
+                                                        stop, step):
         if _is_good(raw_segment, info['ch_names'], idx_by_type, reject, flat,
                     ignore_chs=info['bads']):
             mu += raw_segment.sum(axis=1)
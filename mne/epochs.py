@@ -11,6 +11,7 @@
 from .externals.six import string_types
 
 import copy as cp
+import os.path as op
 import warnings
 import json
 
@@ -20,14 +21,15 @@ from .io.write import (start_file, start_block, end_file, end_block,
                        write_int, write_float_matrix, write_float,
                        write_id, write_string)
 from .io.meas_info import read_meas_info, write_meas_info, _merge_info
-from .io.open import fiff_open
+from .io.open import fiff_open, _fiff_get_fid
 from .io.tree import dir_tree_find
 from .io.tag import read_tag
 from .io.constants import FIFF
 from .io.pick import (pick_types, channel_indices_by_type, channel_type,
                       pick_channels, pick_info)
 from .io.proj import setup_proj, ProjMixin
-from .io.base import _BaseRaw, _time_as_index, _index_as_time
+from .io.base import (_BaseRaw, _time_as_index, _index_as_time,
+                      _get_split_size)
 from .evoked import EvokedArray, aspect_rev
 from .baseline import rescale
 from .utils import (check_random_state, _check_pandas_index_arguments,
@@ -35,12 +37,14 @@ from .utils import (check_random_state, _check_pandas_index_arguments,
 from .channels import ContainsMixin, PickDropChannelsMixin
 from .filter import resample, detrend
 from .event import _read_events_fif
-from .fixes import in1d
+from .fixes import in1d, astype_no_copy
+from .parallel import to_shared_memory
 from .viz import _mutable_defaults, plot_epochs, _drop_log_stats
 from .utils import check_fname, logger, verbose
 from .externals import six
 from .externals.six.moves import zip
-from .utils import deprecated, _check_type_picks
+from .utils import (deprecated, _check_type_picks, _check_dtype,
+                    _check_data_array)
 
 
 class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
@@ -52,10 +56,11 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
     def __init__(self, info, event_id, tmin, tmax, baseline=(None, 0),
                  picks=None, name='Unknown', reject=None, flat=None,
                  decim=1, reject_tmin=None, reject_tmax=None, detrend=None,
-                 add_eeg_ref=True, verbose=None):
+                 add_eeg_ref=True, dtype=None, verbose=None):
 
         self.verbose = verbose
         self.name = name
+        self._dtype = _check_dtype(dtype)
 
         if isinstance(event_id, dict):
             if not all([isinstance(v, int) for v in event_id.values()]):
@@ -153,10 +158,47 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         self.preload = False
         self._data = None
         self._offset = None
+        self._cache = None
 
         # setup epoch rejection
         self._reject_setup()
 
+    def cache_info(self):
+        """Get statistics of the cache of processed epochs
+
+        The cache is enabled with the cache_size parameter of Epochs.
+
+        Returns
+        -------
+        info : dict | None
+            The number of cache hits and misses, the number of cached
+            epochs, their size and the maximum size in bytes ('hits',
+            'misses', 'n_epochs', 'size' and 'max_size'). None if the
+            cache is not enabled.
+        """
+        cache = getattr(self, '_cache', None)
+        return None if cache is None else cache.info()
+
+    def _cache_get(self, idx, proj):
+        """Get epoch idx (and its unprocessed version) from the cache"""
+        cache = getattr(self, '_cache', None)
+        if cache is None:
+            return None
+        cache.check_state((self._projector, self._offset))
+        entry = cache.get((self.selection[idx], proj))
+        if entry is not None:
+            # the epochs are modified in place by the callers
+            entry = [None if e is None else e.copy() for e in entry]
+        return entry
+
+    def _cache_put(self, idx, proj, epoch, epoch_raw):
+        """Store epoch idx (and its unprocessed version) in the cache"""
+        cache = getattr(self, '_cache', None)
+        if cache is not None:
+            cache.put((self.selection[idx], proj),
+                      [None if e is None else e.copy()
+                       for e in (epoch, epoch_raw)])
+
     def _reject_setup(self):
         """Sets self._reject_time and self._channel_type_idx (called from
         __init__)
@@ -209,23 +251,55 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
                             self.reject, self.flat, full_report=True,
                             ignore_chs=self.info['bads'])
 
+    def _is_good_epochs(self, data):
+        """Determine which of several epochs are good
+
+        Parameters
+        ----------
+        data : array, shape (n_epochs, n_channels, n_times) | list
+            The epochs. A list is checked epoch by epoch.
+
+        Returns
+        -------
+        goods : list of tuple
+            The (is_good, offenders) pair of each epoch, as returned by
+            _is_good_epoch.
+        """
+        if not isinstance(data, np.ndarray) or data.ndim != 3:
+            return [self._is_good_epoch(e) for e in data]
+        if data.shape[2] < len(self.times):
+            return [(False, ['TOO_SHORT'])] * len(data)
+        if self.reject is None and self.flat is None:
+            return [(True, None)] * len(data)
+        if self._reject_time is not None:
+            data = data[:, :, self._reject_time]
+        bad_lists = _is_good_batch(data, self.ch_names,
+                                   self._channel_type_idx, self.reject,
+                                   self.flat, ignore_chs=self.info['bads'])
+        return [(True, None) if b is None else (False, b) for b in bad_lists]
+
     @verbose
     def _preprocess(self, epoch, verbose=None):
         """ Aux Function
+
+        epoch can be a single epoch (n_channels, n_times) or several epochs
+        (n_epochs, n_channels, n_times), which are processed at once.
         """
         # Detrend
         if self.detrend is not None:
             picks = pick_types(self.info, meg=True, eeg=True, stim=False,
                                ref_meg=False, eog=False, ecg=False,
                                emg=False, exclude=[])
-            epoch[picks] = detrend(epoch[picks], self.detrend, axis=1)
+            epoch[..., picks, :] = detrend(epoch[..., picks, :],
+                                           self.detrend, axis=-1)
 
         # Baseline correct
         picks = pick_types(self.info, meg=True, eeg=True, stim=False,
                            ref_meg=True, eog=True, ecg=True,
                            emg=True, exclude=[])
-        epoch[picks] = rescale(epoch[picks], self._raw_times, self.baseline,
-                               'mean', copy=False, verbose=verbose)
+        epoch[..., picks, :] = rescale(epoch[..., picks, :], self._raw_times,
+                                       self.baseline, 'mean', copy=False,
+                                       verbose=verbose)
 
         # handle offset
         if self._offset is not None:
@@ -233,7 +307,7 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
 
         # Decimate
         if self.decim > 1:
-            epoch = epoch[:, self._decim_idx]
+            epoch = epoch[..., self._decim_idx]
         return epoch
 
     def get_data(self):
@@ -260,7 +334,8 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
             tmin = self.times[0]
             info = cp.deepcopy(self.info)
 
-            yield EvokedArray(data, info, tmin, comment=str(event_id))
+            yield EvokedArray(data, info, tmin, comment=str(event_id),
+                              dtype=self._dtype)
 
     def subtract_evoked(self, evoked=None):
         """Subtract an evoked response from each epoch
@@ -332,6 +407,9 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
                 self._offset = np.zeros((len(self.ch_names), len(self.times)),
                                         dtype=np.float)
             self._offset[ep_picks] -= evoked.data[picks]
+            if getattr(self, '_cache', None) is not None:
+                # the offset was modified in place
+                self._cache.clear()
         logger.info('[done]')
 
         return self
@@ -392,6 +470,107 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         """
         return self._compute_mean_or_stderr(picks, 'stderr')
 
+    def average_all(self, conditions=None, picks=None, return_std=False):
+        """Compute the average of several conditions in a single pass
+
+        This gives the same result as calling epochs[cond].average() for
+        each condition, but each epoch is only read (or loaded from disk)
+        once. The means and variances are accumulated with Welford's
+        algorithm.
+
+        Parameters
+        ----------
+        conditions : list of str | None
+            The conditions (keys of event_id) to average. If None, all the
+            conditions in event_id are used.
+        picks : array-like of int | None
+            If None only MEG and EEG channels are kept
+            otherwise the channels indices in picks are kept.
+        return_std : bool
+            If True, also return the standard error of each condition.
+
+        Returns
+        -------
+        evokeds : dict of Evoked
+            The average of each condition.
+        stderrs : dict of Evoked
+            The standard error of each condition, as returned by
+            epochs[cond].standard_error(). Only returned if return_std is
+            True.
+        """
+        if conditions is None:
+            conditions = sorted(self.event_id.keys())
+        elif isinstance(conditions, string_types):
+            conditions = [conditions]
+        cond_idx = dict()  # the conditions of each event id
+        for ci, cond in enumerate(conditions):
+            if cond not in self.event_id:
+                raise KeyError('Event "%s" is not in Epochs.' % cond)
+            cond_idx.setdefault(self.event_id[cond], list()).append(ci)
+
+        shape = (len(conditions), len(self.ch_names), len(self.times))
+        counts = np.zeros(len(conditions), dtype=int)
+        means = np.zeros(shape)
+        m2s = np.zeros(shape)
+
+        def _update(ci, block):
+            # merge the mean and variance of a block of epochs (Chan et al.)
+            n_a, n_b = counts[ci], len(block)
+            n = n_a + n_b
+            mean_b = np.mean(block, axis=0, dtype=np.float64)
+            delta = mean_b - means[ci]
+            means[ci] += delta * (float(n_b) / n)
+            if return_std:
+                m2s[ci] += np.sum((block - mean_b) ** 2, axis=0,
+                                  dtype=np.float64)
+                m2s[ci] += delta ** 2 * (float(n_a) * n_b / n)
+            counts[ci] = n
+
+        if self.preload:
+            assert len(self.events) == len(self._data)
+            event_ids = self.events[:, 2]
+            n_block = 64
+            for start in range(0, len(self._data), n_block):
+                block = self._data[start:start + n_block]
+                block_ids = event_ids[start:start + n_block]
+                for event_id in np.unique(block_ids):
+                    if event_id in cond_idx:
+                        sub = block[block_ids == event_id]
+                        for ci in cond_idx[event_id]:
+                            _update(ci, sub)
+        else:
+            self._current = 0
+            while True:
+                try:
+                    e, event_id = self.next(return_event_id=True)
+                except StopIteration:
+                    break
+                for ci in cond_idx.get(event_id, []):
+                    _update(ci, e[np.newaxis])
+
+        evokeds, stderrs = dict(), dict()
+        for ci, cond in enumerate(conditions):
+            # same name as epochs[cond]
+            comment = cond if self.name == 'Unknown' else 'epochs_%s' % cond
+            n_events = counts[ci]
+            if n_events == 0:
+                means[ci].fill(np.nan)
+                m2s[ci].fill(np.nan)
+                n_events_std = 1
+            else:
+                n_events_std = n_events
+            evokeds[cond] = self._make_evoked(means[ci], n_events,
+                                              FIFF.FIFFV_ASPECT_AVERAGE,
+                                              picks, comment)
+            if return_std:
+                data = np.sqrt(m2s[ci] / n_events_std) / np.sqrt(n_events_std)
+                stderrs[cond] = self._make_evoked(data, n_events,
+                                                  FIFF.FIFFV_ASPECT_STD_ERR,
+                                                  picks, comment)
+        if return_std:
+            return evokeds, stderrs
+        return evokeds
+
     def _compute_mean_or_stderr(self, picks, mode='ave'):
         """Compute the mean or std over epochs and return Evoked"""
 
@@ -401,10 +580,12 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         n_times = len(self.times)
         if self.preload:
             n_events = len(self.events)
+            # accumulate in double precision, also for single precision data
+            acc_dtype = np.result_type(self._data.dtype, np.float64)
             if not _do_std:
-                data = np.mean(self._data, axis=0)
+                data = np.mean(self._data, axis=0, dtype=acc_dtype)
             else:
-                data = np.std(self._data, axis=0)
+                data = np.std(self._data, axis=0, dtype=acc_dtype)
             assert len(self.events) == len(self._data)
         else:
             data = np.zeros((n_channels, n_times))
@@ -432,12 +613,17 @@ class _BaseEpochs(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         else:
             _aspect_kind = FIFF.FIFFV_ASPECT_STD_ERR
             data /= np.sqrt(n_events)
+        return self._make_evoked(data, n_events, _aspect_kind, picks,
+                                 self.name)
+
+    def _make_evoked(self, data, n_events, _aspect_kind, picks, comment):
+        """Create the Evoked of an average or a standard error"""
         kind = aspect_rev.get(str(_aspect_kind), 'Unknown')
 
         info = cp.deepcopy(self.info)
         evoked = EvokedArray(data, info, tmin=self.times[0],
-                             comment=self.name, nave=n_events, kind=kind,
-                             verbose=self.verbose)
+                             comment=comment, nave=n_events, kind=kind,
+                             dtype=self._dtype, verbose=self.verbose)
         # XXX: above constructor doesn't recreate the times object precisely
         evoked.times = self.times.copy()
         evoked._aspect_kind = _aspect_kind
@@ -542,10 +728,19 @@ class Epochs(_BaseEpochs):
     picks : array-like of int | None (default)
         Indices of channels to include (if None, all channels
         are used).
-    preload : boolean
+    preload : bool | str
         Load all epochs from disk when creating the object
         or wait before accessing each epoch (more memory
-        efficient but can be slower).
+        efficient but can be slower). If preload is a string, preload is
+        the file name of a memory-mapped file which is used to store the
+        epochs data on the hard drive (slower, requires less memory). The
+        file holds the data of the kept epochs, shape (n_epochs, n_channels,
+        n_times) in C order, and is truncated when bad epochs are dropped
+        while loading. Epochs dropped later (e.g., by drop_epochs) are copied
+        to memory instead. The file is flushed once loaded and closed when
+        the data are no longer referenced. As subsets of the epochs (e.g.,
+        epochs['cond']) can share this file, it is not removed when the
+        Epochs object is deleted.
     reject : dict
         Epoch rejection parameters based on peak to peak amplitude.
         Valid keys are 'grad' | 'mag' | 'eeg' | 'eog' | 'ecg'.
@@ -599,6 +794,16 @@ class Epochs(_BaseEpochs):
         Valid keys are 'error' | 'warning' | 'ignore'
         Default is 'error'. If on_missing is 'warning' it will proceed but
         warn, if 'ignore' it will proceed silently.
+    dtype : str | np.dtype | None
+        The floating point type of the epochs data, 'float32' or 'float64'.
+        If None, the type of the Raw data is used.
+    cache_size : int | None
+        If preload is False, the maximum size in bytes of a cache of the
+        processed epochs. The least recently used epochs are evicted first.
+        This avoids reading the same epochs from disk again when iterating
+        several times over the epochs. Subsets of the epochs (e.g.,
+        epochs['cond']) share the cache. If None (default), no cache is used.
+        See also Epochs.cache_info.
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
         Defaults to raw.verbose.
@@ -659,7 +864,8 @@ class Epochs(_BaseEpochs):
                  picks=None, name='Unknown', preload=False, reject=None,
                  flat=None, proj=True, decim=1, reject_tmin=None,
                  reject_tmax=None, detrend=None, add_eeg_ref=True,
-                 on_missing='error', verbose=None):
+                 on_missing='error', dtype=None, cache_size=None,
+                 verbose=None):
         if raw is None:
             return
         elif not isinstance(raw, _BaseRaw):
@@ -680,6 +886,8 @@ class Epochs(_BaseEpochs):
             event_id = dict((str(e), int(e)) for e in np.unique(events[:, 2]))
 
         proj = proj or raw.proj  # proj is on when applied in Raw
+        if dtype is None:
+            dtype = getattr(raw, '_dtype', None)
 
         # call _BaseEpochs constructor
         super(Epochs, self).__init__(info, event_id, tmin, tmax,
@@ -687,7 +895,8 @@ class Epochs(_BaseEpochs):
                                      reject=reject, flat=flat, decim=decim,
                                      reject_tmin=reject_tmin,
                                      reject_tmax=reject_tmax, detrend=detrend,
-                                     add_eeg_ref=add_eeg_ref, verbose=verbose)
+                                     add_eeg_ref=add_eeg_ref, dtype=dtype,
+                                     verbose=verbose)
 
         # do the rest
         self.raw = raw
@@ -740,12 +949,20 @@ class Epochs(_BaseEpochs):
             else:
                 self.drop_log.append(['IGNORED'])
 
+        if isinstance(preload, string_types):
+            # we will use a memmap: preload is a filename
+            data_buffer = preload
+            preload = True
+        else:
+            data_buffer = None
         self.preload = preload
         if self.preload:
-            self._data = self._get_data_from_disk()
+            self._data = self._get_data_from_disk(data_buffer=data_buffer)
             self.raw = None
         else:
             self._data = None
+            if cache_size is not None:
+                self._cache = _EpochsCache(cache_size)
 
     def drop_bad_epochs(self):
         """Drop bad epochs without retaining the epochs data.
@@ -877,8 +1094,16 @@ class Epochs(_BaseEpochs):
         count = len(indices)
         logger.info('Dropped %d epoch%s' % (count, '' if count == 1 else 's'))
 
+    def _get_epoch_from_disk(self, idx, proj):
+        """Load one epoch from disk, or from the cache"""
+        entry = self._cache_get(idx, proj)
+        if entry is None:
+            entry = self._read_epoch_from_disk(idx, proj)
+            self._cache_put(idx, proj, *entry)
+        return entry
+
     @verbose
-    def _get_epoch_from_disk(self, idx, proj, verbose=None):
+    def _read_epoch_from_disk(self, idx, proj, verbose=None):
         """Load one epoch from disk"""
         if self.raw is None:
             # This should never happen, as raw=None only if preload=True
@@ -901,12 +1126,15 @@ class Epochs(_BaseEpochs):
             return None, None
 
         epoch_raw, _ = self.raw[self.picks, start:stop]
+        if np.isrealobj(epoch_raw):
+            epoch_raw = astype_no_copy(epoch_raw, self._dtype)
 
         # setup list of epochs to handle delayed SSP
         epochs = []
         # whenever requested, the first epoch is being projected.
         if self._projector is not None and proj is True:
-            epochs += [np.dot(self._projector, epoch_raw)]
+            epochs += [astype_no_copy(np.dot(self._projector, epoch_raw),
+                                      epoch_raw.dtype)]
         else:
             epochs += [epoch_raw]
 
@@ -926,8 +1154,99 @@ class Epochs(_BaseEpochs):
 
         return epochs
 
+    def _iter_epochs_from_disk(self, proj):
+        """Read all epochs from disk using few large reads
+
+        The epochs are sorted by their position in the raw data, and epochs
+        that are close to each other are read together. The projection and
+        the preprocessing are applied to all epochs of a read at once.
+
+        Parameters
+        ----------
+        proj : bool
+            Apply the projection (see _get_epoch_from_disk).
+
+        Yields
+        ------
+        idx : array of int
+            The indices of the events.
+        epochs : array, shape (n_epochs, n_channels, n_times) | list
+            The epochs, as returned by _get_epoch_from_disk.
+        epochs_raw : array, shape (n_epochs, n_channels, n_times) | list
+            The unprocessed epochs (delayed SSP) or a list of None.
+        """
+        sfreq = self.raw.info['sfreq']
+        first_samp = self.raw.first_samp
+        n_times = self.raw.n_times
+        ep_len = self._epoch_stop
+        starts = np.array([int(round(event_samp + self.tmin * sfreq)) -
+                           first_samp for event_samp
+                           in np.atleast_2d(self.events)[:, 0]], dtype=int)
+        if self.events.ndim == 1:
+            starts = starts[[0] * len(self.events)]
+        # merge windows separated by less than one epoch, but keep the
+        # size of a single read bounded
+        max_gap = ep_len
+        max_span = max(ep_len, int(1e7) // len(self.picks))
+
+        group = list()
+        g_start = g_stop = 0
+        for ii in np.argsort(starts, kind='mergesort'):
+            start = starts[ii]
+            entry = self._cache_get(ii, proj)
+            if entry is None and (start < 0 or start + ep_len > n_times):
+                # epochs at the edges of the data are handled one by one
+                entry = self._read_epoch_from_disk(ii, proj=proj)
+                self._cache_put(ii, proj, *entry)
+            if entry is not None:
+                yield np.array([ii]), [entry[0]], [entry[1]]
+                continue
+            if len(group) > 0 and (start - g_stop > max_gap or
+                                   start + ep_len - g_start > max_span):
+                yield self._read_epochs_group(group, starts, g_start, g_stop,
+                                              proj)
+                group = list()
+            if len(group) == 0:
+                g_start = start
+            group.append(ii)
+            g_stop = start + ep_len
+        if len(group) > 0:
+            yield self._read_epochs_group(group, starts, g_start, g_stop,
+                                          proj)
+
+    def _read_epochs_group(self, group, starts, g_start, g_stop, proj):
+        """Read the epochs in one contiguous segment of raw data"""
+        idx = np.array(group)
+        block, _ = self.raw[self.picks, g_start:g_stop]
+        if np.isrealobj(block):
+            block = astype_no_copy(block, self._dtype)
+        ep_len = self._epoch_stop
+
+        # unprojected copy for delayed SSP
+        epochs_raw = [None] * len(idx)
+        if self.proj != proj:
+            epochs_raw = np.empty((len(idx), block.shape[0], ep_len),
+                                  dtype=block.dtype)
+            for k, ii in enumerate(idx):
+                offset = starts[ii] - g_start
+                epochs_raw[k] = block[:, offset:offset + ep_len]
+
+        if self._projector is not None and proj is True:
+            block = astype_no_copy(np.dot(self._projector, block),
+                                   block.dtype)
+        epochs = np.empty((len(idx), block.shape[0], ep_len),
+                          dtype=block.dtype)
+        for k, ii in enumerate(idx):
+            offset = starts[ii] - g_start
+            epochs[k] = block[:, offset:offset + ep_len]
+        del block
+        epochs = self._preprocess(epochs)
+        for k, ii in enumerate(idx):
+            self._cache_put(ii, proj, epochs[k], epochs_raw[k])
+        return idx, epochs, epochs_raw
+
     @verbose
-    def _get_data_from_disk(self, out=True, verbose=None):
+    def _get_data_from_disk(self, out=True, data_buffer=None, verbose=None):
         """Load all data from disk
 
         Parameters
@@ -935,47 +1254,48 @@ class Epochs(_BaseEpochs):
         out : bool
             Return the data. Setting this to False is used to reject bad
             epochs without caching all the data, which saves memory.
+        data_buffer : str | None
+            If str, the data are stored in a np.memmap created with this
+            file name.
         verbose : bool, str, int, or None
             If not None, override default verbose level (see mne.verbose).
             Defaults to self.verbose.
         """
         n_events = len(self.events)
-        data = np.array([])
+        delayed = self._check_delayed()
         if self._bad_dropped:
-            proj = False if self._check_delayed() else self.proj
             if not out:
                 return
-            for ii in range(n_events):
-                # faster to pre-allocate memory here
-                epoch, epoch_raw = self._get_epoch_from_disk(ii, proj=proj)
-                if ii == 0:
-                    data = np.empty((n_events, epoch.shape[0],
-                                     epoch.shape[1]), dtype=epoch.dtype)
-                if self._check_delayed():
-                    epoch = epoch_raw
-                data[ii] = epoch
+            proj = False if delayed else self.proj
         else:
-            proj = True if self._check_delayed() else self.proj
-            good_events = []
-            n_out = 0
-            for idx, sel in zip(range(n_events), self.selection):
-                epoch, epoch_raw = self._get_epoch_from_disk(idx, proj=proj)
-                is_good, offenders = self._is_good_epoch(epoch)
-                if is_good:
-                    good_events.append(idx)
-                    if self._check_delayed():
+            proj = True if delayed else self.proj
+
+        data = None
+        good = np.zeros(n_events, dtype=bool)
+        for idx, epochs, epochs_raw in self._iter_epochs_from_disk(proj):
+            if self._bad_dropped:
+                goods = [(True, None)] * len(idx)
+            else:
+                goods = self._is_good_epochs(epochs)
+            for ii, epoch, epoch_raw, (is_good, offenders) in \
+                    zip(idx, epochs, epochs_raw, goods):
+                if not self._bad_dropped:
+                    if not is_good:
+                        self.drop_log[self.selection[ii]] += offenders
+                        continue
+                good[ii] = True
+                if out:
+                    if delayed:
                         epoch = epoch_raw
-                    if out:
+                    if data is None:
                         # faster to pre-allocate, then trim as necessary
-                        if n_out == 0:
-                            data = np.empty((n_events, epoch.shape[0],
-                                             epoch.shape[1]),
-                                            dtype=epoch.dtype, order='C')
-                        data[n_out] = epoch
-                        n_out += 1
-                else:
-                    self.drop_log[sel] += offenders
+                        data = _allocate_epochs(data_buffer,
+                                                (n_events,) + epoch.shape,
+                                                epoch.dtype)
+                    data[ii] = epoch
 
+        if not self._bad_dropped:
+            good_events = np.where(good)[0]
             self.selection = self.selection[good_events]
             self.events = np.atleast_2d(self.events[good_events])
             self._bad_dropped = True
@@ -983,13 +1303,29 @@ class Epochs(_BaseEpochs):
                         % (n_events - len(good_events)))
             if not out:
                 return
-            # just take the good events
-            assert len(good_events) == n_out
-            if n_out > 0:
-                # slicing won't free the space, so we resize
-                # we have ensured the C-contiguity of the array in allocation
-                # so this operation will be safe unless np is very broken
-                data.resize((n_out,) + data.shape[1:], refcheck=False)
+            if data is not None:
+                # move the good epochs to the front, in order
+                for n_out, ii in enumerate(good_events):
+                    if n_out != ii:
+                        data[n_out] = data[ii]
+                if isinstance(data, np.memmap):
+                    # map the file again without the dropped epochs
+                    data.flush()
+                    fname, dtype = data.filename, data.dtype
+                    shape = (len(good_events),) + data.shape[1:]
+                    del data  # unmap the file before truncating it
+                    data = _truncate_memmap(fname, dtype, shape)
+                else:
+                    # slicing won't free the space, so we resize
+                    # we have ensured the C-contiguity of the array in
+                    # allocation so this operation will be safe unless np
+                    # is very broken
+                    data.resize((len(good_events),) + data.shape[1:],
+                                refcheck=False)
+        if data is None:
+            data = np.array([])
+        elif isinstance(data, np.memmap):
+            data.flush()
         return data
 
     @verbose
@@ -1139,10 +1475,12 @@ class Epochs(_BaseEpochs):
     def __getitem__(self, key):
         """Return an Epochs object with a subset of epochs
         """
-        data = self._data
+        data, cache = self._data, getattr(self, '_cache', None)
         del self._data
+        self._cache = None
         epochs = self.copy()
         self._data, epochs._data = data, data
+        self._cache, epochs._cache = cache, cache
 
         if isinstance(key, string_types):
             key = [key]
@@ -1217,7 +1555,11 @@ class Epochs(_BaseEpochs):
         this_epochs.tmin = this_epochs.times[tidx[0]]
         this_epochs.tmax = this_epochs.times[tidx[-1]]
         this_epochs.times = this_epochs.times[tmask]
-        this_epochs._data = this_epochs._data[:, :, tmask]
+        if isinstance(this_epochs._data, np.memmap):
+            # slice to keep the data on disk
+            this_epochs._data = this_epochs._data[:, :, tidx[0]:tidx[-1] + 1]
+        else:
+            this_epochs._data = this_epochs._data[:, :, tmask]
         return this_epochs
 
     @verbose
@@ -1255,6 +1597,27 @@ class Epochs(_BaseEpochs):
         else:
             raise RuntimeError('Can only resample preloaded data')
 
+    def share_memory(self):
+        """Move the data to shared memory for parallel processing
+
+        Afterwards, the epochs data (or a subset of it) passed to functions
+        run in parallel are accessed directly by the worker processes
+        instead of being copied. See ``mne.parallel.to_shared_memory`` for
+        details.
+
+        Returns
+        -------
+        epochs : instance of Epochs
+            The epochs object with the data in shared memory (the same
+            object).
+        """
+        if not self.preload:
+            raise RuntimeError('Epochs data needs to be preloaded to be '
+                               'moved to shared memory. Use preload=True '
+                               'in the constructor.')
+        self._data = to_shared_memory(self._data)
+        return self
+
     def copy(self):
         """Return copy of Epochs instance"""
         raw = self.raw
@@ -1265,7 +1628,7 @@ class Epochs(_BaseEpochs):
 
         return new
 
-    def save(self, fname):
+    def save(self, fname, split_size='2GB'):
         """Save epochs in a fif file
 
         Parameters
@@ -1273,71 +1636,115 @@ class Epochs(_BaseEpochs):
         fname : str
             The name of the file, which should end with -epo.fif or
             -epo.fif.gz.
+        split_size : string | int
+            Large epochs files are automatically split into multiple pieces.
+            This parameter specifies the maximum size of each piece. If the
+            parameter is an integer, it specifies the size in Bytes. It is
+            also possible to pass a human-readable string, e.g., 100MB.
+            Note: Due to FIFF file limitations, the maximum split size is 2GB.
+            The pieces are read back by calling read_epochs with the name of
+            the first file.
         """
         check_fname(fname, 'epochs', ('-epo.fif', '-epo.fif.gz'))
-
-        # Create the file and save the essentials
-        fid = start_file(fname)
-
-        start_block(fid, FIFF.FIFFB_MEAS)
-        write_id(fid, FIFF.FIFF_BLOCK_ID)
-        if self.info['meas_id'] is not None:
-            write_id(fid, FIFF.FIFF_PARENT_BLOCK_ID, self.info['meas_id'])
-
-        # Write measurement info
-        write_meas_info(fid, self.info)
-
-        # One or more evoked data sets
-        start_block(fid, FIFF.FIFFB_PROCESSED_DATA)
-        start_block(fid, FIFF.FIFFB_EPOCHS)
+        split_size = _get_split_size(split_size)
 
         # write events out after getting data to ensure bad events are dropped
         data = self.get_data()
-        start_block(fid, FIFF.FIFFB_MNE_EVENTS)
-        write_int(fid, FIFF.FIFF_MNE_EVENT_LIST, self.events.T)
-        mapping_ = ';'.join([k + ':' + str(v) for k, v in
-                             self.event_id.items()])
-        write_string(fid, FIFF.FIFF_DESCRIPTION, mapping_)
-        end_block(fid, FIFF.FIFFB_MNE_EVENTS)
-
-        # First and last sample
-        first = int(self.times[0] * self.info['sfreq'])
-        last = first + len(self.times) - 1
-        write_int(fid, FIFF.FIFF_FIRST_SAMPLE, first)
-        write_int(fid, FIFF.FIFF_LAST_SAMPLE, last)
-
-        # save baseline
-        if self.baseline is not None:
-            bmin, bmax = self.baseline
-            bmin = self.times[0] if bmin is None else bmin
-            bmax = self.times[-1] if bmax is None else bmax
-            write_float(fid, FIFF.FIFF_MNE_BASELINE_MIN, bmin)
-            write_float(fid, FIFF.FIFF_MNE_BASELINE_MAX, bmax)
-
-        # The epochs itself
+        n_epochs = len(self.events)
+        drop_log = json.dumps(self.drop_log)
+        epoch_size = 4 * data[0].size if len(data) > 0 else 0
         decal = np.empty(self.info['nchan'])
         for k in range(self.info['nchan']):
             decal[k] = 1.0 / (self.info['chs'][k]['cal']
                               * self.info['chs'][k].get('scale', 1.0))
 
-        data *= decal[np.newaxis, :, np.newaxis]
-
-        write_float_matrix(fid, FIFF.FIFF_EPOCH, data)
-
-        # undo modifications to data
-        data /= decal[np.newaxis, :, np.newaxis]
-
-        write_string(fid, FIFF.FIFFB_MNE_EPOCHS_DROP_LOG,
-                     json.dumps(self.drop_log))
-
-        write_int(fid, FIFF.FIFFB_MNE_EPOCHS_SELECTION,
-                  self.selection)
-
-        end_block(fid, FIFF.FIFFB_EPOCHS)
-
-        end_block(fid, FIFF.FIFFB_PROCESSED_DATA)
-        end_block(fid, FIFF.FIFFB_MEAS)
-        end_file(fid)
+        part_idx, start = 0, 0
+        while True:
+            use_fname = _split_fname(fname, part_idx)
+            # Create the file and save the essentials
+            fid = start_file(use_fname)
+
+            start_block(fid, FIFF.FIFFB_MEAS)
+            write_id(fid, FIFF.FIFF_BLOCK_ID)
+            if self.info['meas_id'] is not None:
+                write_id(fid, FIFF.FIFF_PARENT_BLOCK_ID, self.info['meas_id'])
+
+            # Write measurement info
+            write_meas_info(fid, self.info)
+
+            # Number of epochs in this file, leave some space for the events,
+            # the drop log, the selection and the next file info
+            stop = n_epochs
+            if epoch_size > 0:
+                n_part = ((split_size - fid.tell() - 2 ** 20 -
+                           16 * n_epochs - len(drop_log)) // epoch_size)
+                if n_part < 1:
+                    fid.close()
+                    raise ValueError('split_size is too small to save a '
+                                     'single epoch')
+                stop = min(start + n_part, n_epochs)
+
+            # One or more evoked data sets
+            start_block(fid, FIFF.FIFFB_PROCESSED_DATA)
+            start_block(fid, FIFF.FIFFB_EPOCHS)
+
+            start_block(fid, FIFF.FIFFB_MNE_EVENTS)
+            write_int(fid, FIFF.FIFF_MNE_EVENT_LIST,
+                      self.events[start:stop].T)
+            mapping_ = ';'.join([k + ':' + str(v) for k, v in
+                                 self.event_id.items()])
+            write_string(fid, FIFF.FIFF_DESCRIPTION, mapping_)
+            end_block(fid, FIFF.FIFFB_MNE_EVENTS)
+
+            # First and last sample
+            first = int(self.times[0] * self.info['sfreq'])
+            last = first + len(self.times) - 1
+            write_int(fid, FIFF.FIFF_FIRST_SAMPLE, first)
+            write_int(fid, FIFF.FIFF_LAST_SAMPLE, last)
+
+            # save baseline
+            if self.baseline is not None:
+                bmin, bmax = self.baseline
+                bmin = self.times[0] if bmin is None else bmin
+                bmax = self.times[-1] if bmax is None else bmax
+                write_float(fid, FIFF.FIFF_MNE_BASELINE_MIN, bmin)
+                write_float(fid, FIFF.FIFF_MNE_BASELINE_MAX, bmax)
+
+            # The epochs itself
+            this_data = data[start:stop]
+            this_data *= decal[np.newaxis, :, np.newaxis]
+
+            write_float_matrix(fid, FIFF.FIFF_EPOCH, this_data)
+
+            # undo modifications to data
+            this_data /= decal[np.newaxis, :, np.newaxis]
+
+            write_string(fid, FIFF.FIFFB_MNE_EPOCHS_DROP_LOG, drop_log)
+
+            write_int(fid, FIFF.FIFFB_MNE_EPOCHS_SELECTION,
+                      self.selection[start:stop])
+
+            end_block(fid, FIFF.FIFFB_EPOCHS)
+
+            end_block(fid, FIFF.FIFFB_PROCESSED_DATA)
+
+            # next file name and id
+            if stop < n_epochs:
+                next_fname = _split_fname(fname, part_idx + 1)
+                start_block(fid, FIFF.FIFFB_REF)
+                write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
+                write_string(fid, FIFF.FIFF_REF_FILE_NAME,
+                             op.basename(next_fname))
+                if self.info['meas_id'] is not None:
+                    write_id(fid, FIFF.FIFF_REF_FILE_ID, self.info['meas_id'])
+                write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
+                end_block(fid, FIFF.FIFFB_REF)
+
+            end_block(fid, FIFF.FIFFB_MEAS)
+            end_file(fid)
+            if stop >= n_epochs:
+                break
+            part_idx, start = part_idx + 1, stop
 
     def as_data_frame(self, picks=None, index=None, scale_time=1e3,
                       scalings=None, copy=True):
@@ -1605,6 +2012,17 @@ class EpochsArray(Epochs):
     reject_tmax : scalar | None
         End of the time window used to reject epochs (with the default None,
         the window will end with tmax).
+    dtype : str | np.dtype | None
+        The floating point type used to store the data, 'float32' or
+        'float64'. If None, the MNE_DATA_DTYPE config value is used
+        (defaults to 'float64'). Must match the type of ``data`` if
+        ``copy`` is False.
+    copy : bool
+        If True (default), the data are copied. If False, ``data`` must be
+        a C-contiguous ndarray (or np.memmap) of type float32, float64,
+        complex64 or complex128, which is used as is without any copy. The
+        epochs then share their memory with ``data``, so in-place
+        operations also modify ``data``.
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
         Defaults to raw.verbose.
@@ -1613,10 +2031,10 @@ class EpochsArray(Epochs):
     @verbose
     def __init__(self, data, info, events, tmin=0, event_id=None,
                  reject=None, flat=None, reject_tmin=None,
-                 reject_tmax=None, verbose=None):
+                 reject_tmax=None, dtype=None, copy=True, verbose=None):
 
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
-        data = np.asanyarray(data, dtype=dtype)
+        data = _check_data_array(data, dtype, copy)
+        self._dtype = _check_dtype(data.real.dtype)
 
         if data.ndim != 3:
             raise ValueError('Data must be a 3D array of shape (n_epochs, '
@@ -1665,9 +2083,8 @@ class EpochsArray(Epochs):
         self._reject_setup()
         drop_inds = list()
         if self.reject is not None or self.flat is not None:
-            for i_epoch, epoch in enumerate(self):
-                is_good, chan = self._is_good_epoch(epoch,
-                                                    verbose=self.verbose)
+            goods = self._is_good_epochs(self.get_data())
+            for i_epoch, (is_good, chan) in enumerate(goods):
                 if not is_good:
                     drop_inds.append(i_epoch)
                     self.drop_log[i_epoch].extend(chan)
@@ -1676,7 +2093,103 @@ class EpochsArray(Epochs):
             select[drop_inds] = False
             self.events = self.events[select]
             self._data = self._data[select]
-            self.selection[select]
+            self.selection = self.selection[select]
+
+
+def _state_equal(a, b):
+    """Helper to compare arrays which are often the same object"""
+    if a is b:
+        return True
+    if a is None or b is None:
+        return False
+    return a.shape == b.shape and np.array_equal(a, b)
+
+
+class _EpochsCache(object):
+    """Bounded least recently used cache of processed epochs
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum size of the cached arrays in bytes.
+    """
+    def __init__(self, max_size):
+        self.max_size = int(max_size)
+        if self.max_size < 0:
+            raise ValueError('cache_size must be positive, got %s'
+                             % max_size)
+        self.hits = 0
+        self.misses = 0
+        self.clear()
+
+    def clear(self):
+        """Remove all epochs"""
+        self._entries = dict()
+        self._order = list()  # least recently used first
+        self._state = None
+        self.size = 0
+
+    def check_state(self, state):
+        """Clear the cache if the epochs processing state changed"""
+        if self._state is not None and not all(
+                _state_equal(a, b) for a, b in zip(self._state, state)):
+            self.clear()
+        self._state = state
+
+    def get(self, key):
+        """Get an entry and mark it as recently used"""
+        entry = self._entries.get(key, None)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._order.remove(key)
+            self._order.append(key)
+        return entry
+
+    def put(self, key, entry):
+        """Add an entry, evicting the least recently used ones if needed"""
+        nbytes = sum(e.nbytes for e in entry if e is not None)
+        if nbytes > self.max_size:
+            return
+        if key in self._entries:
+            self._remove(key)
+        while self.size + nbytes > self.max_size:
+            self._remove(self._order[0])
+        self._entries[key] = entry
+        self._order.append(key)
+        self.size += nbytes
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._order.remove(key)
+        self.size -= sum(e.nbytes for e in entry if e is not None)
+
+    def info(self):
+        return dict(hits=self.hits, misses=self.misses,
+                    n_epochs=len(self._entries), size=self.size,
+                    max_size=self.max_size)
+
+
+def _allocate_epochs(data_buffer, data_shape, dtype):
+    """Allocate the epochs data, in a memmap if data_buffer is a str"""
+    if isinstance(data_buffer, string_types):
+        # use a memmap
+        data = np.memmap(data_buffer, mode='w+', dtype=dtype,
+                         shape=data_shape)
+    else:
+        data = np.empty(data_shape, dtype=dtype, order='C')
+    return data
+
+
+def _truncate_memmap(fname, dtype, shape):
+    """Truncate the file of a memmap of epochs and map it again"""
+    with open(fname, 'r+b') as fid:
+        fid.truncate(int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    if shape[0] == 0:
+        # an empty file cannot be mapped
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(fname, mode='r+', dtype=dtype, shape=shape)
 
 
 def combine_event_ids(epochs, old_event_ids, new_event_id, copy=True):
@@ -1861,40 +2374,71 @@ def _is_good(e, ch_names, channel_type_idx, reject, flat, full_report=False,
 
 
 @verbose
-def read_epochs(fname, proj=True, add_eeg_ref=True, verbose=None):
-    """Read epochs from a fif file
+def _is_good_batch(data, ch_names, channel_type_idx, reject, flat,
+                   ignore_chs=[], verbose=None):
+    """Test several data segments at once, see _is_good
 
     Parameters
     ----------
-    fname : str
-        The name of the file, which should end with -epo.fif or -epo.fif.gz.
-    proj : bool | 'delayed'
-        Apply SSP projection vectors. If proj is 'delayed' and reject is not
-        None the single epochs will be projected before the rejection
-        decision, but used in unprojected state if they are kept.
-        This way deciding which projection vectors are good can be postponed
-        to the evoked stage without resulting in lower epoch counts and
-        without producing results different from early SSP application
-        given comparable parameters. Note that in this case baselining,
-        detrending and temporal decimation will be postponed.
-        If proj is False no projections will be applied which is the
-        recommended value if SSPs are not used for cleaning the data.
-    add_eeg_ref : bool
-        If True, an EEG average reference will be added (unless one
-        already exists).
-    verbose : bool, str, int, or None
-        If not None, override default verbose level (see mne.verbose).
-        Defaults to raw.verbose.
+    data : array, shape (n_epochs, n_channels, n_times)
+        The data segments.
 
     Returns
     -------
-    epochs : instance of Epochs
-        The epochs
+    bad_lists : list
+        For each segment, None if it is good, otherwise the list of all
+        offending channels in the order _is_good(full_report=True) reports
+        them.
     """
-    check_fname(fname, 'epochs', ('-epo.fif', '-epo.fif.gz'))
-
-    epochs = Epochs(None, None, None, None, None)
-
+    n_epochs = len(data)
+    checkable = np.ones(len(ch_names), dtype=bool)
+    checkable[np.array([c in ignore_chs
+                        for c in ch_names], dtype=bool)] = False
+    # evaluate every criterion on all segments at once
+    checks = list()
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ['', 'flat']):
+        if refl is not None:
+            for key, thresh in six.iteritems(refl):
+                idx = np.asarray(channel_type_idx[key], dtype=int)
+                if len(idx) > 0:
+                    e_idx = data[:, idx]
+                    deltas = np.max(e_idx, axis=2) - np.min(e_idx, axis=2)
+                    bad = np.logical_and(f(deltas, thresh),
+                                         checkable[idx][np.newaxis])
+                    checks.append((t, key.upper(), idx, bad))
+
+    bad_lists = [None] * n_epochs
+    if len(checks) == 0:
+        return bad_lists
+    any_bad = np.zeros(n_epochs, dtype=bool)
+    for _, _, _, bad in checks:
+        any_bad |= np.any(bad, axis=1)
+    for ei in np.where(any_bad)[0]:
+        bad_list = list()
+        for t, name, idx, bad in checks:
+            idx_deltas = np.where(bad[ei])[0]
+            if len(idx_deltas) > 0:
+                ch_name = [ch_names[idx[i]] for i in idx_deltas]
+                if len(bad_list) == 0:
+                    logger.info('    Rejecting %s epoch based on %s : '
+                                '%s' % (t, name, ch_name))
+                bad_list.extend(ch_name)
+        bad_lists[ei] = bad_list
+    return bad_lists
+
+
+def _split_fname(fname, part_idx):
+    """Get the name of a piece of a split file"""
+    if part_idx == 0:
+        return fname
+    # insert index in filename
+    path, base = op.split(fname)
+    idx = base.find('.')
+    return op.join(path, '%s-%d.%s' % (base[:idx], part_idx, base[idx + 1:]))
+
+
+def _read_epochs_part(fname):
+    """Read the header of an epochs file (one piece of a split file)"""
     logger.info('Reading %s ...' % fname)
     fid, tree, _ = fiff_open(fname)
 
@@ -1918,103 +2462,304 @@ def read_epochs(fname, proj=True, add_eeg_ref=True, verbose=None):
     my_epochs = epochs_node[0]
 
     # Now find the data in the block
-    comment = None
-    data = None
-    bmin, bmax = None, None
-    baseline = None
-    selection = None
-    drop_log = []
+    part = dict(fname=fname, info=info, events=events, mappings=mappings,
+                comment=None, data_pos=None, bmin=None, bmax=None,
+                selection=None, drop_log=[], next_fname=None)
     for k in range(my_epochs['nent']):
         kind = my_epochs['directory'][k].kind
         pos = my_epochs['directory'][k].pos
         if kind == FIFF.FIFF_FIRST_SAMPLE:
             tag = read_tag(fid, pos)
-            first = int(tag.data)
+            part['first'] = int(tag.data)
         elif kind == FIFF.FIFF_LAST_SAMPLE:
             tag = read_tag(fid, pos)
-            last = int(tag.data)
+            part['last'] = int(tag.data)
         elif kind == FIFF.FIFF_COMMENT:
             tag = read_tag(fid, pos)
-            comment = tag.data
+            part['comment'] = tag.data
         elif kind == FIFF.FIFF_EPOCH:
-            tag = read_tag(fid, pos)
-            data = tag.data.astype(np.float)
+            # the data are only read when needed
+            part['data_pos'] = pos
         elif kind == FIFF.FIFF_MNE_BASELINE_MIN:
             tag = read_tag(fid, pos)
-            bmin = float(tag.data)
+            part['bmin'] = float(tag.data)
         elif kind == FIFF.FIFF_MNE_BASELINE_MAX:
             tag = read_tag(fid, pos)
-            bmax = float(tag.data)
+            part['bmax'] = float(tag.data)
         elif kind == FIFF.FIFFB_MNE_EPOCHS_SELECTION:
             tag = read_tag(fid, pos)
-            selection = np.array(tag.data)
+            part['selection'] = np.array(tag.data)
         elif kind == FIFF.FIFFB_MNE_EPOCHS_DROP_LOG:
             tag = read_tag(fid, pos)
-            drop_log = json.loads(tag.data)
-
-    if bmin is not None or bmax is not None:
-        baseline = (bmin, bmax)
-
-    nsamp = last - first + 1
-    logger.info('    Found the data of interest:')
-    logger.info('        t = %10.2f ... %10.2f ms (%s)'
-                % (1000 * first / info['sfreq'],
-                   1000 * last / info['sfreq'], comment))
-    if info['comps'] is not None:
-        logger.info('        %d CTF compensation matrices available'
-                    % len(info['comps']))
+            part['drop_log'] = json.loads(tag.data)
+
+    # Get the name of the next file for split files
+    for node in dir_tree_find(tree, FIFF.FIFFB_REF):
+        role, next_fname = None, None
+        for ent in node['directory']:
+            if ent.kind == FIFF.FIFF_REF_ROLE:
+                role = int(read_tag(fid, ent.pos).data)
+            elif ent.kind == FIFF.FIFF_REF_FILE_NAME:
+                next_fname = op.join(op.dirname(fname),
+                                     read_tag(fid, ent.pos).data)
+        if role == FIFF.FIFFV_ROLE_NEXT_FILE and next_fname is not None:
+            part['next_fname'] = next_fname
+    fid.close()
 
     # Read the data
-    if data is None:
+    if part['data_pos'] is None:
         raise ValueError('Epochs data not found')
+    return part
 
-    if data.shape[2] != nsamp:
-        fid.close()
-        raise ValueError('Incorrect number of samples (%d instead of %d)'
-                         % (data.shape[2], nsamp))
 
-    # Calibrate
-    cals = np.array([info['chs'][k]['cal'] * info['chs'][k].get('scale', 1.0)
-                     for k in range(info['nchan'])])
-    data *= cals[np.newaxis, :, np.newaxis]
+class EpochsFIF(Epochs):
+    """Epochs read from a fif file
 
-    times = np.arange(first, last + 1, dtype=np.float) / info['sfreq']
-    tmin = times[0]
-    tmax = times[-1]
+    See read_epochs for a description of the parameters.
+    """
+    @verbose
+    def __init__(self, fname, proj=True, add_eeg_ref=True, preload=True,
+                 dtype=None, verbose=None):
+        check_fname(fname, 'epochs', ('-epo.fif', '-epo.fif.gz'))
+        dtype = _check_dtype(dtype)
+
+        # read the headers of all the pieces of split files
+        parts = [_read_epochs_part(fname)]
+        while parts[-1]['next_fname'] is not None:
+            next_fname = parts[-1]['next_fname']
+            if not op.exists(next_fname):
+                logger.warning('Split epochs file detected but next file %s '
+                               'does not exist.' % next_fname)
+                break
+            parts.append(_read_epochs_part(next_fname))
+        info = parts[0]['info']
+        first, last = parts[0]['first'], parts[0]['last']
+        comment = parts[0]['comment']
+        bmin, bmax = parts[0]['bmin'], parts[0]['bmax']
+        baseline = None
+        if bmin is not None or bmax is not None:
+            baseline = (bmin, bmax)
+
+        nsamp = last - first + 1
+        logger.info('    Found the data of interest:')
+        logger.info('        t = %10.2f ... %10.2f ms (%s)'
+                    % (1000 * first / info['sfreq'],
+                       1000 * last / info['sfreq'], comment))
+        if info['comps'] is not None:
+            logger.info('        %d CTF compensation matrices available'
+                        % len(info['comps']))
+
+        # position of each epoch in the files
+        events = np.concatenate([part['events'] for part in parts])
+        self._fif_parts = [(part['fname'], part['data_pos'])
+                           for part in parts]
+        self._fif_rows = np.concatenate(
+            [np.array([(pi, row) for row in range(len(part['events']))],
+                      dtype=int).reshape(-1, 2)
+             for pi, part in enumerate(parts)])
+        if any(part['selection'] is None for part in parts):
+            # In case epochs didn't have a FIFF.FIFFB_MNE_EPOCHS_SELECTION
+            # tag (version < 0.8):
+            selection = np.arange(len(events))
+        else:
+            selection = np.concatenate([part['selection'] for part in parts])
 
-    # Put it all together
-    epochs.preload = True
-    epochs.raw = None
-    epochs.picks = np.arange(data.shape[1])
-    epochs._bad_dropped = True
-    epochs.events = events
-    epochs._data = data
-    epochs.info = info
-    epochs.tmin = tmin
-    epochs.tmax = tmax
-    epochs.name = comment
-    epochs.times = times
-    epochs._data = data
-    epochs.proj = proj
-    activate = False if epochs._check_delayed() else proj
-    epochs._projector, epochs.info = setup_proj(info, add_eeg_ref,
+        # Calibrate
+        self._cals = np.array([info['chs'][k]['cal'] *
+                               info['chs'][k].get('scale', 1.0)
+                               for k in range(info['nchan'])])
+        times = np.arange(first, last + 1, dtype=np.float) / info['sfreq']
+
+        # Put it all together
+        self.preload = False
+        self.raw = None
+        self._data = None
+        self._dtype = dtype
+        self.picks = np.arange(info['nchan'])
+        self._bad_dropped = True
+        self.events = events
+        self.tmin = times[0]
+        self.tmax = times[-1]
+        self.name = comment
+        self.times = times
+        self._raw_times = times
+        self._epoch_stop = nsamp
+        self.decim = 1
+        self._decim_idx = slice(0, nsamp)
+        self.detrend = None
+        self.reject = None
+        self.flat = None
+        self.reject_tmin = None
+        self.reject_tmax = None
+        self._reject_time = None
+        self._offset = None
+        self._cache = None
+        self.proj = proj
+        activate = False if self._check_delayed() else proj
+        self._projector, self.info = setup_proj(info, add_eeg_ref,
                                                 activate=activate)
+        # the projector matching the data as stored, see _project_fif_data
+        self._fif_projector = self._projector
 
-    epochs.baseline = baseline
-    epochs.event_id = (dict((str(e), e) for e in np.unique(events[:, 2]))
-                       if mappings is None else mappings)
-    epochs.verbose = verbose
+        self.baseline = baseline
+        mappings = parts[0]['mappings']
+        self.event_id = (dict((str(e), e) for e in np.unique(events[:, 2]))
+                         if mappings is None else mappings)
+        self.verbose = verbose
+        self.selection = selection
+        self.drop_log = parts[0]['drop_log']
+        # epochs are identified by their original event index
+        self._fif_index = dict((sel, k) for k, sel in enumerate(selection))
+        if len(self._fif_index) < len(selection) and not preload:
+            # e.g., bootstrapped epochs
+            logger.info('Some epochs are repeated in the file, '
+                        'reading them with preload=True.')
+            preload = True
+
+        # check the data dimensions
+        if len(events) > 0:
+            data = self._read_fif_rows(0, 0, 1)
+            if data.shape[1:] != (info['nchan'], nsamp):
+                raise ValueError('Incorrect data dimensions %s (expected %s)'
+                                 % (data.shape[1:], (info['nchan'], nsamp)))
+
+        if preload:
+            self._data = self._read_fif_data(preload)
+            self.preload = True
+
+    def _read_fif_rows(self, part_idx, start, stop):
+        """Read the calibrated epochs start:stop of one file"""
+        fname, pos = self._fif_parts[part_idx]
+        fid = _fiff_get_fid(fname)
+        try:
+            tag = read_tag(fid, pos, rlims=(start, stop))
+        finally:
+            fid.close()
+        data = tag.data.astype(self._dtype)
+        data *= self._cals[np.newaxis, :, np.newaxis]
+        return data
 
-    # In case epochs didn't have a FIFF.FIFFB_MNE_EPOCHS_SELECTION tag
-    # (version < 0.8):
-    if selection is None:
-        selection = range(len(epochs))
+    def _read_fif_data(self, preload):
+        """Read all epochs, in blocks of bounded size"""
+        data_buffer = preload if isinstance(preload, string_types) else None
+        n_epochs = len(self.events)
+        data = _allocate_epochs(data_buffer, (n_epochs, self.info['nchan'],
+                                              len(self.times)), self._dtype)
+        max_rows = max(1, int(1e7) // (self.info['nchan'] * len(self.times)))
+        for start in range(0, n_epochs, max_rows):
+            stop = min(start + max_rows, n_epochs)
+            # rows of a block are contiguous unless the block spans files
+            for part_idx in np.unique(self._fif_rows[start:stop, 0]):
+                mask = self._fif_rows[start:stop, 0] == part_idx
+                rows = self._fif_rows[start:stop][mask, 1]
+                data[start:stop][mask] = self._read_fif_rows(
+                    part_idx, rows[0], rows[-1] + 1)
+        if isinstance(data, np.memmap):
+            data.flush()
+        return data
 
-    epochs.selection = selection
-    epochs.drop_log = drop_log
-    fid.close()
+    @verbose
+    def _read_epoch_from_disk(self, idx, proj, verbose=None):
+        """Load one epoch from the file"""
+        part_idx, row = self._fif_rows[self._fif_index[self.selection[idx]]]
+        epoch = self._read_fif_rows(part_idx, row, row + 1)
+        # unprojected copy for delayed SSP
+        epoch_raw = epoch[0].copy() if self.proj != proj else None
+        return self._project_fif_data(epoch, proj)[0], epoch_raw
+
+    def _iter_epochs_from_disk(self, proj):
+        """Read all epochs from the file, see Epochs._iter_epochs_from_disk
+
+        Epochs stored next to each other in the same file are read together.
+        """
+        pos = np.array([self._fif_index[sel] for sel in self.selection],
+                       dtype=int)
+        rows = self._fif_rows[pos]
+        max_rows = max(1, int(1e7) // (self.info['nchan'] * len(self.times)))
+        order = np.lexsort((rows[:, 1], rows[:, 0]))
+        group = list()
+        for ii in order:
+            if len(group) > 0 and (
+                    rows[ii, 0] != rows[group[0], 0] or
+                    rows[ii, 1] - rows[group[-1], 1] > 1 or
+                    rows[ii, 1] - rows[group[0], 1] >= max_rows):
+                yield self._read_fif_group(group, rows, proj)
+                group = list()
+            group.append(ii)
+        if len(group) > 0:
+            yield self._read_fif_group(group, rows, proj)
+
+    def _read_fif_group(self, group, rows, proj):
+        """Read epochs which are stored next to each other"""
+        idx = np.array(group)
+        part_idx, start = rows[idx[0]]
+        epochs = self._read_fif_rows(part_idx, start, rows[idx[-1], 1] + 1)
+        # the same epoch can be selected several times
+        epochs = epochs[rows[idx, 1] - start]
+        epochs_raw = epochs.copy() if self.proj != proj else [None] * len(idx)
+        return idx, self._project_fif_data(epochs, proj), epochs_raw
+
+    def _project_fif_data(self, epochs, proj):
+        """Apply the projections activated after the file was read
+
+        The stored data are used as they are, like with preload=True, so
+        only a projector set afterwards (e.g., by apply_proj) is applied,
+        in the same way as apply_proj does it for preloaded data.
+        """
+        if (proj is not True or self._projector is None or
+                self._projector is self._fif_projector):
+            return epochs
+        for ii, epoch in enumerate(epochs):
+            epochs[ii] = np.dot(self._projector, epoch)
+        return self._preprocess(epochs)
 
-    return epochs
+
+@verbose
+def read_epochs(fname, proj=True, add_eeg_ref=True, preload=True, dtype=None,
+                verbose=None):
+    """Read epochs from a fif file
+
+    Parameters
+    ----------
+    fname : str
+        The name of the file, which should end with -epo.fif or -epo.fif.gz.
+        For epochs saved in several files (see Epochs.save), this is the
+        name of the first file.
+    proj : bool | 'delayed'
+        Apply SSP projection vectors. If proj is 'delayed' and reject is not
+        None the single epochs will be projected before the rejection
+        decision, but used in unprojected state if they are kept.
+        This way deciding which projection vectors are good can be postponed
+        to the evoked stage without resulting in lower epoch counts and
+        without producing results different from early SSP application
+        given comparable parameters. Note that in this case baselining,
+        detrending and temporal decimation will be postponed.
+        If proj is False no projections will be applied which is the
+        recommended value if SSPs are not used for cleaning the data.
+    add_eeg_ref : bool
+        If True, an EEG average reference will be added (unless one
+        already exists).
+    preload : bool | str
+        If True (default), all epochs are read into memory. If False, the
+        epochs are read from the file when they are accessed, which allows
+        working with files larger than the memory. If preload is a string,
+        preload is the file name of a memory-mapped file which is used to
+        store the epochs data on the hard drive.
+    dtype : str | np.dtype | None
+        The floating point type of the epochs data, 'float32' or 'float64'.
+        If None, the MNE_DATA_DTYPE config value is used (defaults to
+        'float64').
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
+        Defaults to raw.verbose.
+
+    Returns
+    -------
+    epochs : instance of Epochs
+        The epochs
+    """
+    return EpochsFIF(fname, proj=proj, add_eeg_ref=add_eeg_ref,
+                     preload=preload, dtype=dtype, verbose=verbose)
 
 
 def bootstrap(epochs, random_state=None):
@@ -12,16 +12,17 @@ import warnings
 from .baseline import rescale
 from .channels import ContainsMixin, PickDropChannelsMixin
 from .filter import resample, detrend
+from .parallel import parallel_func
 from .fixes import in1d
 from .utils import (_check_pandas_installed, check_fname, logger, verbose,
-                    deprecated, object_hash)
+                    deprecated, object_hash, _check_dtype)
 from .viz import plot_evoked, plot_evoked_topomap, _mutable_defaults
 from .viz import plot_evoked_field
 from .viz import plot_evoked_image
 from .externals.six import string_types
 
 from .io.constants import FIFF
-from .io.open import fiff_open
+from .io.open import fiff_open, _fiff_get_fid
 from .io.tag import read_tag
 from .io.tree import dir_tree_find
 from .io.pick import channel_type, pick_types
@@ -42,9 +43,9 @@ class Evoked(ProjMixin, ContainsMixin, PickDropChannelsMixin):
 
     Parameters
     ----------
-    fname : string
-        Name of evoked/average FIF file to load.
-        If None no data is loaded.
+    fname : string | instance of EvokedIndex
+        Name of evoked/average FIF file to load, or the index of such a
+        file, in which case the file headers are not parsed again.
     condition : int, or str
         Dataset ID number (int) or comment/name (str). Optional if there is
         only one data set in file.
@@ -93,188 +94,16 @@ class Evoked(ProjMixin, ContainsMixin, PickDropChannelsMixin):
 
         if fname is None:
             raise ValueError('No evoked filename specified')
-
-        self.verbose = verbose
-        logger.info('Reading %s ...' % fname)
-        fid, tree, _ = fiff_open(fname)
         if not isinstance(proj, bool):
             raise ValueError(r"'proj' must be 'True' or 'False'")
 
-        #   Read the measurement info
-        info, meas = read_meas_info(fid, tree)
-        info['filename'] = fname
-
-        #   Locate the data of interest
-        processed = dir_tree_find(meas, FIFF.FIFFB_PROCESSED_DATA)
-        if len(processed) == 0:
-            fid.close()
-            raise ValueError('Could not find processed data')
-
-        evoked_node = dir_tree_find(meas, FIFF.FIFFB_EVOKED)
-        if len(evoked_node) == 0:
-            fid.close()
-            raise ValueError('Could not find evoked data')
-
-        # find string-based entry
-        if isinstance(condition, string_types):
-            if not kind in aspect_dict.keys():
-                fid.close()
-                raise ValueError('kind must be "average" or '
-                                 '"standard_error"')
-
-            comments, aspect_kinds, t = _get_entries(fid, evoked_node)
-            goods = np.logical_and(in1d(comments, [condition]),
-                                   in1d(aspect_kinds, [aspect_dict[kind]]))
-            found_cond = np.where(goods)[0]
-            if len(found_cond) != 1:
-                fid.close()
-                raise ValueError('condition "%s" (%s) not found, out of found '
-                                 'datasets:\n  %s' % (condition, kind, t))
-            condition = found_cond[0]
-
-        if condition >= len(evoked_node) or condition < 0:
-            fid.close()
-            raise ValueError('Data set selector out of range')
-
-        my_evoked = evoked_node[condition]
-
-        # Identify the aspects
-        aspects = dir_tree_find(my_evoked, FIFF.FIFFB_ASPECT)
-        if len(aspects) > 1:
-            logger.info('Multiple aspects found. Taking first one.')
-        my_aspect = aspects[0]
-
-        # Now find the data in the evoked block
-        nchan = 0
-        sfreq = -1
-        chs = []
-        comment = None
-        for k in range(my_evoked['nent']):
-            my_kind = my_evoked['directory'][k].kind
-            pos = my_evoked['directory'][k].pos
-            if my_kind == FIFF.FIFF_COMMENT:
-                tag = read_tag(fid, pos)
-                comment = tag.data
-            elif my_kind == FIFF.FIFF_FIRST_SAMPLE:
-                tag = read_tag(fid, pos)
-                first = int(tag.data)
-            elif my_kind == FIFF.FIFF_LAST_SAMPLE:
-                tag = read_tag(fid, pos)
-                last = int(tag.data)
-            elif my_kind == FIFF.FIFF_NCHAN:
-                tag = read_tag(fid, pos)
-                nchan = int(tag.data)
-            elif my_kind == FIFF.FIFF_SFREQ:
-                tag = read_tag(fid, pos)
-                sfreq = float(tag.data)
-            elif my_kind == FIFF.FIFF_CH_INFO:
-                tag = read_tag(fid, pos)
-                chs.append(tag.data)
-
-        if comment is None:
-            comment = 'No comment'
-
-        #   Local channel information?
-        if nchan > 0:
-            if chs is None:
-                fid.close()
-                raise ValueError('Local channel information was not found '
-                                 'when it was expected.')
-
-            if len(chs) != nchan:
-                fid.close()
-                raise ValueError('Number of channels and number of '
-                                 'channel definitions are different')
-
-            info['chs'] = chs
-            info['nchan'] = nchan
-            logger.info('    Found channel information in evoked data. '
-                        'nchan = %d' % nchan)
-            if sfreq > 0:
-                info['sfreq'] = sfreq
-
-        nsamp = last - first + 1
-        logger.info('    Found the data of interest:')
-        logger.info('        t = %10.2f ... %10.2f ms (%s)'
-                    % (1000 * first / info['sfreq'],
-                       1000 * last / info['sfreq'], comment))
-        if info['comps'] is not None:
-            logger.info('        %d CTF compensation matrices available'
-                        % len(info['comps']))
-
-        # Read the data in the aspect block
-        nave = 1
-        epoch = []
-        for k in range(my_aspect['nent']):
-            kind = my_aspect['directory'][k].kind
-            pos = my_aspect['directory'][k].pos
-            if kind == FIFF.FIFF_COMMENT:
-                tag = read_tag(fid, pos)
-                comment = tag.data
-            elif kind == FIFF.FIFF_ASPECT_KIND:
-                tag = read_tag(fid, pos)
-                aspect_kind = int(tag.data)
-            elif kind == FIFF.FIFF_NAVE:
-                tag = read_tag(fid, pos)
-                nave = int(tag.data)
-            elif kind == FIFF.FIFF_EPOCH:
-                tag = read_tag(fid, pos)
-                epoch.append(tag)
-
-        logger.info('        nave = %d - aspect type = %d'
-                    % (nave, aspect_kind))
-
-        nepoch = len(epoch)
-        if nepoch != 1 and nepoch != info['nchan']:
-            fid.close()
-            raise ValueError('Number of epoch tags is unreasonable '
-                             '(nepoch = %d nchan = %d)'
-                             % (nepoch, info['nchan']))
-
-        if nepoch == 1:
-            # Only one epoch
-            all_data = epoch[0].data.astype(np.float)
-            # May need a transpose if the number of channels is one
-            if all_data.shape[1] == 1 and info['nchan'] == 1:
-                all_data = all_data.T.astype(np.float)
+        self.verbose = verbose
+        if isinstance(fname, EvokedIndex):
+            index = fname
         else:
-            # Put the old style epochs together
-            all_data = np.concatenate([e.data[None, :] for e in epoch],
-                                      axis=0).astype(np.float)
-
-        if all_data.shape[1] != nsamp:
-            fid.close()
-            raise ValueError('Incorrect number of samples (%d instead of %d)'
-                             % (all_data.shape[1], nsamp))
-
-        # Calibrate
-        cals = np.array([info['chs'][k]['cal']
-                         * info['chs'][k].get('scale', 1.0)
-                         for k in range(info['nchan'])])
-        all_data *= cals[:, np.newaxis]
-
-        times = np.arange(first, last + 1, dtype=np.float) / info['sfreq']
-        self.info = info
-
-        # Put the rest together all together
-        self.nave = nave
-        self._aspect_kind = aspect_kind
-        self.kind = aspect_rev.get(str(self._aspect_kind), 'Unknown')
-        self.first = first
-        self.last = last
-        self.comment = comment
-        self.times = times
-        self.data = all_data
-
-        # bind info, proj, data to self so apply_proj can be used
-        self.data = all_data
-        self.proj = False
-        if proj:
-            self.apply_proj()
-        # Run baseline correction
-        self.data = rescale(self.data, times, baseline, 'mean', copy=False)
-
-        fid.close()
+            index = EvokedIndex(fname)
+        index._read_evoked(self, index._get_condition(condition, kind),
+                           baseline, proj)
 
     def save(self, fname):
         """Save dataset to file.
@@ -817,6 +646,10 @@ class EvokedArray(Evoked):
         Number of averaged epochs. Defaults to 1.
     kind : str
         Type of data, either average or standard_error. Defaults to 'average'.
+    dtype : str | np.dtype | None
+        The floating point type used to store the data, 'float32' or
+        'float64'. If None, the MNE_DATA_DTYPE config value is used
+        (defaults to 'float64').
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
         Defaults to raw.verbose.
@@ -824,9 +657,11 @@ class EvokedArray(Evoked):
 
     @verbose
     def __init__(self, data, info, tmin, comment='', nave=1, kind='average',
-                 verbose=None):
+                 dtype=None, verbose=None):
 
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        dtype = _check_dtype(dtype)
+        if np.any(np.iscomplex(data)):
+            dtype = np.result_type(dtype, np.complex64)
         data = np.asanyarray(data, dtype=dtype)
 
         if data.ndim != 2:
@@ -859,49 +694,283 @@ class EvokedArray(Evoked):
             self._aspect_kind = aspect_dict['standard_error']
 
 
-def _get_entries(fid, evoked_node):
-    """Helper to get all evoked entries"""
-    comments = list()
-    aspect_kinds = list()
-    for ev in evoked_node:
-        for k in range(ev['nent']):
-            my_kind = ev['directory'][k].kind
-            pos = ev['directory'][k].pos
-            if my_kind == FIFF.FIFF_COMMENT:
-                tag = read_tag(fid, pos)
-                comments.append(tag.data)
-        my_aspect = dir_tree_find(ev, FIFF.FIFFB_ASPECT)[0]
-        for k in range(my_aspect['nent']):
-            my_kind = my_aspect['directory'][k].kind
-            pos = my_aspect['directory'][k].pos
-            if my_kind == FIFF.FIFF_ASPECT_KIND:
-                tag = read_tag(fid, pos)
-                aspect_kinds.append(int(tag.data))
-    comments = np.atleast_1d(comments)
-    aspect_kinds = np.atleast_1d(aspect_kinds)
-    if len(comments) != len(aspect_kinds) or len(comments) == 0:
-        fid.close()
-        raise ValueError('Dataset names in FIF file '
-                         'could not be found.')
-    t = [aspect_rev.get(str(a), 'Unknown') for a in aspect_kinds]
-    t = ['"' + c + '" (' + tt + ')' for tt, c in zip(t, comments)]
-    t = '  ' + '\n  '.join(t)
-    return comments, aspect_kinds, t
-
-
-def _get_evoked_node(fname):
-    """Helper to get info in evoked file"""
-    f, tree, _ = fiff_open(fname)
-    with f as fid:
-        _, meas = read_meas_info(fid, tree)
-        evoked_node = dir_tree_find(meas, FIFF.FIFFB_EVOKED)
-    return evoked_node
+class EvokedIndex(object):
+    """Index of the evoked datasets stored in a FIF file
+
+    The measurement info and the headers of all evoked datasets are read
+    once. The datasets can then be read on demand without parsing the
+    file again.
+
+    Parameters
+    ----------
+    fname : string
+        The file name, which should end with -ave.fif or -ave.fif.gz.
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
+
+    Attributes
+    ----------
+    info : dict
+        Measurement info, shared by all datasets of the file.
+    comments : list of str
+        The comment (condition name) of each dataset.
+    kinds : list of str
+        The type of each dataset, 'average' or 'standard_error'.
+    naves : list of int
+        The number of averaged epochs of each dataset.
+    """
+    @verbose
+    def __init__(self, fname, verbose=None):
+        if fname is None:
+            raise ValueError('No evoked filename specified')
+
+        self.fname = fname
+        self.verbose = verbose
+        logger.info('Reading %s ...' % fname)
+        fid, tree, _ = fiff_open(fname)
+        with fid:
+            #   Read the measurement info
+            info, meas = read_meas_info(fid, tree)
+            info['filename'] = fname
+
+            #   Locate the data of interest
+            processed = dir_tree_find(meas, FIFF.FIFFB_PROCESSED_DATA)
+            if len(processed) == 0:
+                raise ValueError('Could not find processed data')
+
+            evoked_node = dir_tree_find(meas, FIFF.FIFFB_EVOKED)
+            if len(evoked_node) == 0:
+                raise ValueError('Could not find evoked data')
+
+            self._entries = [_read_evoked_header(fid, node)
+                             for node in evoked_node]
+        self.info = info
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        s = '%s, %d datasets' % (self.fname, len(self))
+        return '<EvokedIndex  |  %s>' % s
+
+    @property
+    def comments(self):
+        return [e['comment'] for e in self._entries]
+
+    @property
+    def kinds(self):
+        return [aspect_rev.get(str(e['aspect_kind']), 'Unknown')
+                for e in self._entries]
+
+    @property
+    def naves(self):
+        return [e['nave'] for e in self._entries]
+
+    @verbose
+    def read(self, condition=None, baseline=None, kind='average', proj=True,
+             verbose=None):
+        """Read evoked dataset(s)
+
+        Parameters
+        ----------
+        condition : int or str | list of int or str | None
+            The index or list of indices of the evoked dataset to read. If
+            None, all datasets are returned as a list.
+        baseline : None (default) or tuple of length 2
+            The time interval to apply baseline correction. If None do not
+            apply it. If baseline is (a, b) the interval is between "a (s)"
+            and "b (s)". If a is None the beginning of the data is used and
+            if b is None then b is set to the end of the interval. If
+            baseline is equal to (None, None) all the time interval is used.
+        kind : str
+            Either 'average' or 'standard_error', the type of data to read.
+        proj : bool
+            If False, available projectors won't be applied to the data.
+        verbose : bool, str, int, or None
+            If not None, override default verbose level (see mne.verbose).
+
+        Returns
+        -------
+        evoked : Evoked (if condition is int or str) or list of Evoked (if
+            condition is None or list)
+            The evoked dataset(s).
+        """
+        return_list = True
+        if condition is None:
+            condition = range(len(self))
+        elif not isinstance(condition, list):
+            condition = [condition]
+            return_list = False
+
+        out = [Evoked(self, c, baseline=baseline, kind=kind, proj=proj,
+                      verbose=verbose) for c in condition]
+
+        return out if return_list else out[0]
+
+    def _get_condition(self, condition, kind):
+        """Helper to get the index of a dataset"""
+        # find string-based entry
+        if isinstance(condition, string_types):
+            if not kind in aspect_dict.keys():
+                raise ValueError('kind must be "average" or '
+                                 '"standard_error"')
+            comments = self.comments
+            if any(c is None for c in comments):
+                raise ValueError('Dataset names in FIF file '
+                                 'could not be found.')
+            found_cond = [k for k, e in enumerate(self._entries)
+                          if e['comment'] == condition and
+                          e['aspect_kind'] == aspect_dict[kind]]
+            if len(found_cond) != 1:
+                t = ['"%s" (%s)' % (c, k) for c, k in zip(comments,
+                                                          self.kinds)]
+                t = '  ' + '\n  '.join(t)
+                raise ValueError('condition "%s" (%s) not found, out of found '
+                                 'datasets:\n  %s' % (condition, kind, t))
+            condition = found_cond[0]
+
+        if condition >= len(self) or condition < 0:
+            raise ValueError('Data set selector out of range')
+        return condition
+
+    def _read_evoked(self, evoked, condition, baseline, proj):
+        """Helper to read a dataset into an Evoked instance"""
+        entry = self._entries[condition]
+        info = deepcopy(self.info)
+        first, last = entry['first'], entry['last']
+        comment = entry['comment']
+        if comment is None:
+            comment = 'No comment'
+
+        with _fiff_get_fid(self.fname) as fid:
+            #   Local channel information?
+            nchan = entry['nchan']
+            if nchan > 0:
+                chs = [read_tag(fid, pos).data for pos in entry['chs']]
+                if len(chs) != nchan:
+                    raise ValueError('Number of channels and number of '
+                                     'channel definitions are different')
+
+                info['chs'] = chs
+                info['nchan'] = nchan
+                logger.info('    Found channel information in evoked data. '
+                            'nchan = %d' % nchan)
+                if entry['sfreq'] > 0:
+                    info['sfreq'] = entry['sfreq']
+
+            nsamp = last - first + 1
+            logger.info('    Found the data of interest:')
+            logger.info('        t = %10.2f ... %10.2f ms (%s)'
+                        % (1000 * first / info['sfreq'],
+                           1000 * last / info['sfreq'], comment))
+            if info['comps'] is not None:
+                logger.info('        %d CTF compensation matrices available'
+                            % len(info['comps']))
+
+            # Read the data in the aspect block
+            if entry['aspect_comment'] is not None:
+                comment = entry['aspect_comment']
+            nave = entry['nave']
+            aspect_kind = entry['aspect_kind']
+            logger.info('        nave = %d - aspect type = %d'
+                        % (nave, aspect_kind))
+
+            nepoch = len(entry['epoch'])
+            if nepoch != 1 and nepoch != info['nchan']:
+                raise ValueError('Number of epoch tags is unreasonable '
+                                 '(nepoch = %d nchan = %d)'
+                                 % (nepoch, info['nchan']))
+            epoch = [read_tag(fid, pos) for pos in entry['epoch']]
+
+        dtype = _check_dtype(None)
+        if nepoch == 1:
+            # Only one epoch
+            all_data = epoch[0].data.astype(dtype)
+            # May need a transpose if the number of channels is one
+            if all_data.shape[1] == 1 and info['nchan'] == 1:
+                all_data = all_data.T.astype(dtype)
+        else:
+            # Put the old style epochs together
+            all_data = np.concatenate([e.data[None, :] for e in epoch],
+                                      axis=0).astype(dtype)
+
+        if all_data.shape[1] != nsamp:
+            raise ValueError('Incorrect number of samples (%d instead of %d)'
+                             % (all_data.shape[1], nsamp))
+
+        # Calibrate
+        cals = np.array([info['chs'][k]['cal']
+                         * info['chs'][k].get('scale', 1.0)
+                         for k in range(info['nchan'])])
+        all_data *= cals[:, np.newaxis]
+
+        times = np.arange(first, last + 1, dtype=np.float) / info['sfreq']
+        evoked.info = info
+
+        # Put the rest together all together
+        evoked.nave = nave
+        evoked._aspect_kind = aspect_kind
+        evoked.kind = aspect_rev.get(str(evoked._aspect_kind), 'Unknown')
+        evoked.first = first
+        evoked.last = last
+        evoked.comment = comment
+        evoked.times = times
+
+        # bind info, proj, data to evoked so apply_proj can be used
+        evoked.data = all_data
+        evoked.proj = False
+        if proj:
+            evoked.apply_proj()
+        # Run baseline correction
+        evoked.data = rescale(evoked.data, times, baseline, 'mean', copy=False)
+
+
+def _read_evoked_header(fid, evoked_node):
+    """Helper to read the header of an evoked dataset and its tag positions
+    """
+    entry = dict(comment=None, first=None, last=None, nchan=0, sfreq=-1,
+                 chs=list(), aspect_comment=None, aspect_kind=None, nave=1,
+                 epoch=list())
+    for k in range(evoked_node['nent']):
+        my_kind = evoked_node['directory'][k].kind
+        pos = evoked_node['directory'][k].pos
+        if my_kind == FIFF.FIFF_COMMENT:
+            entry['comment'] = read_tag(fid, pos).data
+        elif my_kind == FIFF.FIFF_FIRST_SAMPLE:
+            entry['first'] = int(read_tag(fid, pos).data)
+        elif my_kind == FIFF.FIFF_LAST_SAMPLE:
+            entry['last'] = int(read_tag(fid, pos).data)
+        elif my_kind == FIFF.FIFF_NCHAN:
+            entry['nchan'] = int(read_tag(fid, pos).data)
+        elif my_kind == FIFF.FIFF_SFREQ:
+            entry['sfreq'] = float(read_tag(fid, pos).data)
+        elif my_kind == FIFF.FIFF_CH_INFO:
+            entry['chs'].append(pos)
+
+    # Identify the aspects
+    aspects = dir_tree_find(evoked_node, FIFF.FIFFB_ASPECT)
+    if len(aspects) > 1:
+        logger.info('Multiple aspects found. Taking first one.')
+    my_aspect = aspects[0]
+    for k in range(my_aspect['nent']):
+        my_kind = my_aspect['directory'][k].kind
+        pos = my_aspect['directory'][k].pos
+        if my_kind == FIFF.FIFF_COMMENT:
+            entry['aspect_comment'] = read_tag(fid, pos).data
+        elif my_kind == FIFF.FIFF_ASPECT_KIND:
+            entry['aspect_kind'] = int(read_tag(fid, pos).data)
+        elif my_kind == FIFF.FIFF_NAVE:
+            entry['nave'] = int(read_tag(fid, pos).data)
+        elif my_kind == FIFF.FIFF_EPOCH:
+            entry['epoch'].append(pos)
+    return entry
 
 
 def merge_evoked(all_evoked):
     """Merge/concat evoked data
 
-    Data should have the same channels and the same time instants.
+    Data should have the same channels and the same time instants. The
+    channels are matched by name.
 
     Parameters
     ----------
@@ -914,15 +983,7 @@ def merge_evoked(all_evoked):
         The merged evoked data
     """
     evoked = deepcopy(all_evoked[0])
-
-    ch_names = evoked.ch_names
-    for e in all_evoked[1:]:
-        assert e.ch_names == ch_names, ValueError("%s and %s do not contain "
-                                                  "the same channels"
-                                                  % (evoked, e))
-        assert np.max(np.abs(e.times - evoked.times)) < 1e-7, \
-            ValueError("%s and %s do not contain the same time "
-                       "instants" % (evoked, e))
+    acc = _EvokedAccumulator(evoked.ch_names, evoked.times)
 
     # use union of bad channels
     bads = list(set(evoked.info['bads']).union(*(ev.info['bads']
@@ -930,11 +991,191 @@ def merge_evoked(all_evoked):
     evoked.info['bads'] = bads
 
     all_nave = sum(e.nave for e in all_evoked)
-    evoked.data = sum(e.nave * e.data for e in all_evoked) / all_nave
+    evoked.data = sum(e.nave * acc._get_data(e)
+                      for e in all_evoked) / all_nave
     evoked.nave = all_nave
     return evoked
 
 
+@verbose
+def grand_average_evokeds(fnames, condition=0, baseline=None, kind='average',
+                          proj=True, return_std=False, n_jobs=1,
+                          verbose=None):
+    """Compute the grand average of evoked datasets stored in many files
+
+    The files are read one at a time (or one at a time per job) and the
+    nave-weighted mean and variance are accumulated on the fly, so the
+    datasets are never all in memory at once. The channels and time
+    instants of each dataset are checked against those of the first file,
+    the channels being matched by name.
+
+    Parameters
+    ----------
+    fnames : list of str
+        The file names, which should end with -ave.fif or -ave.fif.gz.
+    condition : int | str
+        The index or comment of the dataset to read in each file.
+    baseline : None (default) or tuple of length 2
+        The time interval to apply baseline correction to each dataset. If
+        None do not apply it. If baseline is (a, b) the interval is between
+        "a (s)" and "b (s)". If a is None the beginning of the data is used
+        and if b is None then b is set to the end of the interval. If
+        baseline is equal to (None, None) all the time interval is used.
+    kind : str
+        Either 'average' or 'standard_error', the type of data to read.
+    proj : bool
+        If False, available projectors won't be applied to the data.
+    return_std : bool
+        If True, also return the standard error of the grand average.
+    n_jobs : int
+        Number of jobs to run in parallel. Each job reads its share of the
+        files one at a time.
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
+
+    Returns
+    -------
+    evoked : Evoked
+        The nave-weighted grand average. Its nave is the total number of
+        averaged epochs and its bads the union of all bad channels.
+    stderr : Evoked
+        The per-channel standard error of the weighted mean, using the
+        effective number of datasets given the nave weights. Only returned
+        if return_std is True.
+    """
+    if isinstance(fnames, string_types):
+        fnames = [fnames]
+    if len(fnames) == 0:
+        raise ValueError('No evoked files given')
+    if condition is None or isinstance(condition, list):
+        raise ValueError('condition must be an int or a str, got %s'
+                         % (condition,))
+
+    evoked = read_evokeds(fnames[0], condition, baseline=baseline,
+                          kind=kind, proj=proj)
+    acc = _EvokedAccumulator(evoked.ch_names, evoked.times)
+    acc.add(evoked)
+
+    fnames = fnames[1:]
+    parallel, my_func, n_jobs = parallel_func(_accumulate_evoked_files,
+                                              n_jobs)
+    n_chunks = min(n_jobs, len(fnames))
+    if n_chunks > 0:
+        chunks = np.array_split(np.arange(len(fnames)), n_chunks)
+        out = parallel(my_func([fnames[k] for k in chunk], acc.ch_names,
+                               acc.times, condition, baseline, kind, proj)
+                       for chunk in chunks)
+        for this_acc in out:
+            acc.merge(this_acc)
+    logger.info('Grand average of %d datasets (nave = %d)'
+                % (acc.n_evoked, acc.nave))
+
+    stderr = evoked.copy() if return_std else None
+    acc.apply(evoked)
+    if return_std:
+        acc.apply(stderr, stderr=True)
+        return evoked, stderr
+    return evoked
+
+
+def _accumulate_evoked_files(fnames, ch_names, times, condition, baseline,
+                             kind, proj):
+    """Helper to accumulate the datasets of several files (for parallel)"""
+    acc = _EvokedAccumulator(ch_names, times)
+    for fname in fnames:
+        acc.add(read_evokeds(fname, condition, baseline=baseline, kind=kind,
+                             proj=proj))
+    return acc
+
+
+class _EvokedAccumulator(object):
+    """Helper to accumulate the nave-weighted mean and variance of evokeds
+
+    The mean is the weighted sum divided by the total nave, as in
+    merge_evoked. The variance is accumulated with the weighted incremental
+    algorithm of West (1979), and partial results are merged as in Chan et
+    al. (1979).
+    """
+    def __init__(self, ch_names, times):
+        self.ch_names = list(ch_names)
+        self.times = times
+        self.n_evoked = 0
+        self.nave = 0
+        self.weight_sq = 0.
+        self.sum = np.zeros((len(ch_names), len(times)))
+        self.mean = np.zeros((len(ch_names), len(times)))
+        self.m2 = np.zeros((len(ch_names), len(times)))
+        self.bads = set()
+
+    def _get_data(self, evoked):
+        """Get the data of an evoked in the accumulator channel order"""
+        if (len(evoked.times) != len(self.times) or
+                np.max(np.abs(evoked.times - self.times)) >= 1e-7):
+            raise ValueError('%s does not contain the same time instants as '
+                             'the first dataset' % evoked)
+        if evoked.ch_names == self.ch_names:
+            return evoked.data
+        idx = dict((ch, k) for k, ch in enumerate(evoked.ch_names))
+        missing = [ch for ch in self.ch_names if ch not in idx]
+        if len(missing) > 0:
+            raise ValueError('%s does not contain the channels %s of the '
+                             'first dataset' % (evoked, missing))
+        return evoked.data[[idx[ch] for ch in self.ch_names]]
+
+    def add(self, evoked):
+        """Add an evoked dataset"""
+        data = self._get_data(evoked)
+        self.n_evoked += 1
+        self.bads.update(evoked.info['bads'])
+        if evoked.nave <= 0:
+            return
+        weight = float(evoked.nave)
+        self.nave += evoked.nave
+        self.weight_sq += weight ** 2
+        self.sum += evoked.nave * data
+        delta = data - self.mean
+        self.mean += delta * (weight / self.nave)
+        self.m2 += weight * delta * (data - self.mean)
+
+    def merge(self, other):
+        """Merge the datasets accumulated by another instance"""
+        if other.ch_names != self.ch_names:
+            raise ValueError('Cannot merge accumulators with different '
+                             'channels')
+        self.n_evoked += other.n_evoked
+        self.bads.update(other.bads)
+        if other.nave <= 0:
+            return
+        nave = self.nave + other.nave
+        delta = other.mean - self.mean
+        self.mean += delta * (float(other.nave) / nave)
+        self.m2 += other.m2 + delta ** 2 * (float(self.nave) * other.nave /
+                                            nave)
+        self.nave = nave
+        self.weight_sq += other.weight_sq
+        self.sum += other.sum
+
+    def apply(self, evoked, stderr=False):
+        """Put the mean (or its standard error) in an evoked instance"""
+        if stderr:
+            if self.nave > 0:
+                # effective number of datasets given the weights
+                n_eff = self.nave ** 2 / self.weight_sq
+                data = np.sqrt(self.m2 / self.nave / n_eff)
+            else:
+                data = np.zeros_like(self.m2)
+            evoked.kind = 'standard_error'
+            evoked._aspect_kind = aspect_dict['standard_error']
+        elif self.nave > 0:
+            data = self.sum / self.nave
+        else:
+            data = self.sum
+        evoked.data = data.astype(evoked.data.dtype)
+        evoked.nave = self.nave
+        evoked.info['bads'] = list(self.bads)
+        return evoked
+
+
 @verbose
 def read_evokeds(fname, condition=None, baseline=None, kind='average',
                  proj=True, verbose=None):
@@ -969,18 +1210,9 @@ def read_evokeds(fname, condition=None, baseline=None, kind='average',
     """
     check_fname(fname, 'evoked', ('-ave.fif', '-ave.fif.gz'))
 
-    return_list = True
-    if condition is None:
-        evoked_node = _get_evoked_node(fname)
-        condition = range(len(evoked_node))
-    elif not isinstance(condition, list):
-        condition = [condition]
-        return_list = False
-
-    out = [Evoked(fname, c, baseline=baseline, kind=kind, proj=proj,
-           verbose=verbose) for c in condition]
-
-    return out if return_list else out[0]
+    index = EvokedIndex(fname)
+    return index.read(condition, baseline=baseline, kind=kind, proj=proj,
+                      verbose=verbose)
 
 
 def write_evokeds(fname, evoked):
@@ -1277,7 +1277,7 @@ def resample(x, up, down, npad=100, axis=-1, window='boxcar', n_jobs=1,
         parallel, p_fun, _ = parallel_func(fft_resample, n_jobs)
         y = parallel(p_fun(x_, W, new_len, npad, to_remove, cuda_dict)
                      for x_ in x_flat)
-        y = np.array(y)
+        y = np.array(y, dtype=x.dtype)
 
     # Restore the original array shape (modified for resampling)
     y.shape = orig_shape[:-1] + (y.shape[1],)
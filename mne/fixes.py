@@ -283,6 +283,14 @@ else:
     safe_copy = np.copy
 
 
+def astype_no_copy(X, dtype):
+    """Cast X to dtype, without a copy if it already has this type"""
+    # ndarray.astype has a 'copy' keyword argument only from numpy 1.7
+    if X.dtype == np.dtype(dtype):
+        return X
+    return X.astype(dtype)
+
+
 # wrap filtfilt, excluding padding arguments
 def _filtfilt(*args, **kwargs):
     # cut out filter args
@@ -17,6 +17,7 @@ from . import constants
 from . import edf
 from . import egi
 from . import fiff
+from . import hdf5
 from . import kit
 from . import pick
 
@@ -25,9 +26,11 @@ from .brainvision import read_raw_brainvision
 from .bti import read_raw_bti
 from .edf import read_raw_edf
 from .egi import read_raw_egi
+from .hdf5 import read_raw_hdf5, write_raw_hdf5
 from .kit import read_raw_kit
 
 # for backward compatibility
 from .fiff import RawFIFF
 from .fiff import RawFIFF as Raw
-from .base import concatenate_raws, get_chpi_positions, set_eeg_reference
+from .base import (concatenate_raws, get_chpi_positions, set_eeg_reference,
+                   ConcatenatedRaw)
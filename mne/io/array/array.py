@@ -10,7 +10,7 @@ import numpy as np
 from ..constants import FIFF
 from ..meas_info import Info
 from ..base import _BaseRaw
-from ...utils import verbose, logger
+from ...utils import verbose, logger, _check_dtype, _check_data_array
 from ...externals.six import string_types
 
 
@@ -24,18 +24,31 @@ class RawArray(_BaseRaw):
     info : instance of Info
         Info dictionary. Consider using ``create_info`` to populate
         this structure.
+    dtype : str | np.dtype | None
+        The floating point type used to store the data, 'float32' or
+        'float64'. If None, the MNE_DATA_DTYPE config value is used
+        (defaults to 'float64'). Complex data are stored with the
+        corresponding complex type. Must match the type of ``data`` if
+        ``copy`` is False.
+    copy : bool
+        If True (default), the data are copied. If False, ``data`` must be
+        a C-contiguous ndarray (or np.memmap) of type float32, float64,
+        complex64 or complex128, which is used as is without any copy. The
+        RawArray then shares its memory with ``data``, so in-place
+        operations such as filtering also modify ``data``.
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
     """
     @verbose
-    def __init__(self, data, info, verbose=None):
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
-        data = np.asanyarray(data, dtype=dtype)
+    def __init__(self, data, info, dtype=None, copy=True, verbose=None):
+        data = _check_data_array(data, dtype, copy)
 
         if data.ndim != 2:
             raise ValueError('Data must be a 2D array of shape (n_channels, '
                              'n_samples')
 
         logger.info('Creating RawArray with %s data, n_channels=%s, n_times=%s'
-                    % (dtype.__name__, data.shape[0], data.shape[1]))
+                    % (data.dtype.name, data.shape[0], data.shape[1]))
 
         if len(data) != len(info['ch_names']):
             raise ValueError('len(data) does not match len(info["ch_names"])')
@@ -54,6 +67,7 @@ class RawArray(_BaseRaw):
         self.preload = True
         self.info = info
         self._data = data
+        self._dtype = _check_dtype(data.real.dtype)
         self.first_samp, self.last_samp = 0, self._data.shape[1] - 1
         self._times = np.arange(self.first_samp,
                                 self.last_samp + 1) / info['sfreq']
@@ -7,6 +7,7 @@ from __future__ import print_function
 import os.path as op
 import warnings
 
+import numpy as np
 from numpy.testing import (assert_array_almost_equal, assert_allclose,
                            assert_array_equal)
 from nose.tools import assert_equal, assert_raises, assert_true
@@ -102,3 +103,31 @@ def test_array_raw():
     epochs.plot()
     evoked = epochs.average()
     evoked.plot()
+
+
+def test_array_raw_no_copy():
+    """Test creating raw from array without copying the data
+    """
+    raw = Raw(fif_fname).crop(2, 5, copy=False)
+    data, _ = raw[:, :]
+    info = raw.info.copy()
+    raw2 = RawArray(data, info, copy=False)
+    assert_true(raw2._data is data)
+    raw2 = RawArray(data, info)
+    assert_true(raw2._data is not data)
+    assert_array_equal(raw2._data, data)
+
+    data_mmap = np.memmap(op.join(tempdir, 'raw.dat'), dtype=np.float32,
+                          mode='w+', shape=data.shape)
+    data_mmap[:] = data
+    raw2 = RawArray(data_mmap, info, copy=False)
+    assert_true(raw2._data is data_mmap)
+    assert_equal(raw2._dtype, np.float32)
+    assert_allclose(raw2[:, :][0], data_mmap)
+
+    assert_raises(ValueError, RawArray, data_mmap, info, dtype='float64',
+                  copy=False)
+    assert_raises(ValueError, RawArray, np.asfortranarray(data), info,
+                  copy=False)
+    assert_raises(ValueError, RawArray, data.astype(int), info, copy=False)
+    assert_raises(TypeError, RawArray, data.tolist(), info, copy=False)
@@ -11,6 +11,8 @@ from copy import deepcopy
 import warnings
 import os
 import os.path as op
+import time
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 from scipy.signal import hilbert
@@ -30,7 +32,7 @@ from .write import (start_file, end_file, start_block, end_block,
 
 from ..filter import (low_pass_filter, high_pass_filter, band_pass_filter,
                       notch_filter, band_stop_filter, resample)
-from ..parallel import parallel_func
+from ..parallel import parallel_func, to_shared_memory, _SharedMemmap
 from ..utils import (_check_fname, estimate_rank, _check_pandas_installed,
                      check_fname, _get_stim_channel, object_hash,
                      logger, verbose)
@@ -49,8 +51,9 @@ class _BaseRaw(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         raise NotImplementedError
 
     def __del__(self):
-        # remove file for memmap
-        if hasattr(self, '_data') and hasattr(self._data, 'filename'):
+        # remove file for memmap (shared memory is removed on its own)
+        if (hasattr(self, '_data') and hasattr(self._data, 'filename') and
+                not isinstance(self._data, _SharedMemmap)):
             # First, close the file out; happens automatically on del
             filename = self._data.filename
             del self._data
@@ -643,7 +646,8 @@ class _BaseRaw(ProjMixin, ContainsMixin, PickDropChannelsMixin):
     @verbose
     def save(self, fname, picks=None, tmin=0, tmax=None, buffer_size_sec=10,
              drop_small_buffer=False, proj=False, format='single',
-             overwrite=False, split_size='2GB', verbose=None):
+             overwrite=False, split_size='2GB', pipeline=False,
+             verbose=None):
         """Save raw data to file
 
         Parameters
@@ -690,6 +694,10 @@ class _BaseRaw(ProjMixin, ContainsMixin, PickDropChannelsMixin):
             parameter is an integer, it specifies the size in Bytes. It is
             also possible to pass a human-readable string, e.g., 100MB.
             Note: Due to FIFF file limitations, the maximum split size is 2GB.
+        pipeline : bool
+            If True, each data buffer is written to disk in a background
+            thread while the next buffer is read, projected and calibrated.
+            This speeds up saving when writing to disk is a bottleneck.
         verbose : bool, str, int, or None
             If not None, override default verbose level (see mne.verbose).
             Defaults to self.verbose.
@@ -707,15 +715,7 @@ class _BaseRaw(ProjMixin, ContainsMixin, PickDropChannelsMixin):
                                    'raw.fif.gz', 'raw_sss.fif.gz',
                                    'raw_tsss.fif.gz'))
 
-        if isinstance(split_size, string_types):
-            exp = dict(MB=20, GB=30).get(split_size[-2:], None)
-            if exp is None:
-                raise ValueError('split_size has to end with either'
-                                 '"MB" or "GB"')
-            split_size = int(float(split_size[:-2]) * 2 ** exp)
-
-        if split_size > 2147483648:
-            raise ValueError('split_size cannot be larger than 2GB')
+        split_size = _get_split_size(split_size)
 
         fname = op.realpath(fname)
         if not self.preload and fname in self._filenames:
@@ -782,7 +782,7 @@ class _BaseRaw(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         # write the raw file
         _write_raw(fname, self, info, picks, format, data_type, reset_range,
                    start, stop, buffer_size, projector, inv_comp,
-                   drop_small_buffer, split_size, 0, None)
+                   drop_small_buffer, split_size, 0, None, pipeline)
 
     def plot(raw, events=None, duration=10.0, start=0.0, n_channels=20,
              bgcolor='w', color=None, bad_color=(0.8, 0.8, 0.8),
@@ -933,6 +933,56 @@ class _BaseRaw(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         return _index_as_time(index, self.info['sfreq'], self.first_samp,
                               use_first_samp)
 
+    def iter_chunks(self, chunk_duration=10., overlap=0., picks=None,
+                    tmin=None, tmax=None, prefetch=True):
+        """Iterate over consecutive chunks of data
+
+        When the data are not preloaded, the next chunk is read in a
+        background thread while the current one is being processed.
+
+        Parameters
+        ----------
+        chunk_duration : float
+            Duration of each chunk in seconds. The last chunk can be shorter.
+        overlap : float
+            Overlap between consecutive chunks in seconds. Must be smaller
+            than chunk_duration.
+        picks : array-like of int | None
+            Indices of channels to include. If None all channels are used.
+        tmin : float | None
+            Time in seconds of the first sample to use. If None the first
+            sample is used.
+        tmax : float | None
+            Time in seconds of the last sample to use. If None the last
+            sample is used.
+        prefetch : bool
+            If True (default), read the next chunk in a background thread
+            while the current one is used.
+
+        Returns
+        -------
+        chunks : generator
+            Generator yielding the data (array, shape (n_channels,
+            n_samples)) and times (array, shape (n_samples,)) of each chunk.
+        """
+        sfreq = self.info['sfreq']
+        step = int(round(chunk_duration * sfreq))
+        n_overlap = int(round(overlap * sfreq))
+        if step < 1:
+            raise ValueError('chunk_duration must be at least one sample')
+        if not 0 <= n_overlap < step:
+            raise ValueError('overlap must be non-negative and smaller than '
+                             'chunk_duration')
+        start = 0 if tmin is None else int(self.time_as_index(tmin)[0])
+        stop = (self.n_times if tmax is None else
+                min(int(self.time_as_index(tmax)[0]) + 1, self.n_times))
+        if not 0 <= start < stop:
+            raise ValueError('No data in this range')
+        # validation above happens on call, the reading is done lazily
+        chunks = _iter_raw_chunks(self, picks, start, stop, step, n_overlap,
+                                  prefetch)
+        return ((data, times) for _, _, data, times in chunks)
+
     def estimate_rank(self, tstart=0.0, tstop=30.0, tol=1e-4,
                       return_singular=False, picks=None):
         """Estimate rank of the raw data
@@ -1137,6 +1187,26 @@ class _BaseRaw(ProjMixin, ContainsMixin, PickDropChannelsMixin):
         """
         pass
 
+    def share_memory(self):
+        """Move the data to shared memory for parallel processing
+
+        Afterwards, functions run in parallel (e.g., ``filter`` or
+        ``apply_function`` with n_jobs > 1) access the data directly instead
+        of receiving a copy of it in each worker process. See
+        ``mne.parallel.to_shared_memory`` for details.
+
+        Returns
+        -------
+        raw : instance of Raw
+            The raw object with the data in shared memory (the same object).
+        """
+        if not self.preload:
+            raise RuntimeError('Raw data needs to be preloaded to be moved '
+                               'to shared memory. Use preload=True (or '
+                               'string) in the constructor.')
+        self._data = to_shared_memory(self._data)
+        return self
+
     def copy(self):
         """ Return copy of Raw instance
         """
@@ -1370,6 +1440,46 @@ def _allocate_data(data, data_buffer, data_shape, dtype):
     return data
 
 
+def _iter_raw_chunks(raw, picks, start, stop, step, n_overlap=0,
+                     prefetch=True):
+    """Helper to read raw data in chunks, reading ahead in a thread
+
+    Yields the first and last (excluded) sample, the data and the times
+    of each chunk.
+    """
+    bounds = list()
+    first = start
+    while first < stop:
+        last = min(first + step, stop)
+        bounds.append((first, last))
+        if last == stop:
+            break
+        first = last - n_overlap
+
+    sel = slice(None) if picks is None else picks
+
+    def _read(first_last):
+        return raw[sel, first_last[0]:first_last[1]]
+
+    if not prefetch or raw.preload or len(bounds) < 2:
+        for first, last in bounds:
+            data, times = _read((first, last))
+            yield first, last, data, times
+        return
+
+    pool = ThreadPool(1)
+    try:
+        pending = pool.apply_async(_read, (bounds[0],))
+        for ii, (first, last) in enumerate(bounds):
+            data, times = pending.get()
+            if ii + 1 < len(bounds):
+                pending = pool.apply_async(_read, (bounds[ii + 1],))
+            yield first, last, data, times
+    finally:
+        pool.close()
+        pool.join()
+
+
 def _time_as_index(times, sfreq, first_samp=0, use_first_samp=False):
     """Convert time to indices
 
@@ -1428,9 +1538,23 @@ class _RawShell():
 
 ###############################################################################
 # Writing
+def _get_split_size(split_size):
+    """Convert human-readable bytes to machine-readable bytes"""
+    if isinstance(split_size, string_types):
+        exp = dict(MB=20, GB=30).get(split_size[-2:], None)
+        if exp is None:
+            raise ValueError('split_size has to end with either'
+                             '"MB" or "GB"')
+        split_size = int(float(split_size[:-2]) * 2 ** exp)
+
+    if split_size > 2147483648:
+        raise ValueError('split_size cannot be larger than 2GB')
+    return split_size
+
+
 def _write_raw(fname, raw, info, picks, format, data_type, reset_range, start,
                stop, buffer_size, projector, inv_comp, drop_small_buffer,
-               split_size, part_idx, prev_fname):
+               split_size, part_idx, prev_fname, pipeline=False):
     """Write raw file with splitting
     """
 
@@ -1464,58 +1588,65 @@ def _write_raw(fname, raw, info, picks, format, data_type, reset_range, start,
         write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx - 1)
         end_block(fid, FIFF.FIFFB_REF)
 
-    pos_prev = None
-    for first in range(start, stop, buffer_size):
-        last = first + buffer_size
-        if last >= stop:
-            last = stop + 1
-
-        if picks is None:
-            data, times = raw[:, first:last]
-        else:
-            data, times = raw[picks, first:last]
-
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if ((drop_small_buffer and (first > start)
-             and (len(times) < buffer_size))):
-            logger.info('Skipping data chunk due to small buffer ... '
-                        '[done]')
-            break
-        logger.info('Writing ...')
-
-        if pos_prev is None:
-            pos_prev = fid.tell()
-
-        _write_raw_buffer(fid, data, cals, format, inv_comp)
-
-        pos = fid.tell()
-        this_buff_size_bytes = pos - pos_prev
-        if this_buff_size_bytes > split_size / 2:
-            raise ValueError('buffer size is too large for the given split'
-                             'size: decrease "buffer_size_sec" or increase'
-                             '"split_size".')
-        if pos > split_size:
-            raise logger.warning('file is larger than "split_size"')
-
-        # Split files if necessary, leave some space for next file info
-        if pos >= split_size - this_buff_size_bytes - 2 ** 20:
-            next_fname, next_idx = _write_raw(fname, raw, info, picks, format,
-                data_type, reset_range, first + buffer_size, stop, buffer_size,
-                projector, inv_comp, drop_small_buffer, split_size,
-                part_idx + 1, use_fname)
-
-            start_block(fid, FIFF.FIFFB_REF)
-            write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
-            write_string(fid, FIFF.FIFF_REF_FILE_NAME, op.basename(next_fname))
-            write_id(fid, FIFF.FIFF_REF_FILE_ID, meas_id)
-            write_int(fid, FIFF.FIFF_REF_FILE_NUM, next_idx)
-            end_block(fid, FIFF.FIFFB_REF)
-            break
-
-        pos_prev = pos
+    writer = _RawBufferWriter(fid, pipeline)
+    try:
+        pos_prev = None
+        for first in range(start, stop, buffer_size):
+            last = first + buffer_size
+            if last >= stop:
+                last = stop + 1
 
+            if picks is None:
+                data, times = raw[:, first:last]
+            else:
+                data, times = raw[picks, first:last]
+
+            if projector is not None:
+                data = np.dot(projector, data)
+
+            if ((drop_small_buffer and (first > start)
+                 and (len(times) < buffer_size))):
+                logger.info('Skipping data chunk due to small buffer ... '
+                            '[done]')
+                break
+            logger.info('Writing ...')
+
+            if pos_prev is None:
+                pos_prev = writer.tell()
+
+            writer.write(*_prepare_raw_buffer(data, cals, format, inv_comp))
+
+            pos = writer.tell()
+            this_buff_size_bytes = pos - pos_prev
+            if this_buff_size_bytes > split_size / 2:
+                raise ValueError('buffer size is too large for the given split'
+                                 'size: decrease "buffer_size_sec" or increase'
+                                 '"split_size".')
+            if pos > split_size:
+                raise logger.warning('file is larger than "split_size"')
+
+            # Split files if necessary, leave some space for next file info
+            if pos >= split_size - this_buff_size_bytes - 2 ** 20:
+                writer.close()
+                next_fname, next_idx = _write_raw(
+                    fname, raw, info, picks, format, data_type, reset_range,
+                    first + buffer_size, stop, buffer_size, projector,
+                    inv_comp, drop_small_buffer, split_size, part_idx + 1,
+                    use_fname, pipeline)
+
+                start_block(fid, FIFF.FIFFB_REF)
+                write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
+                write_string(fid, FIFF.FIFF_REF_FILE_NAME,
+                             op.basename(next_fname))
+                write_id(fid, FIFF.FIFF_REF_FILE_ID, meas_id)
+                write_int(fid, FIFF.FIFF_REF_FILE_NUM, next_idx)
+                end_block(fid, FIFF.FIFFB_REF)
+                break
+
+            pos_prev = pos
+    finally:
+        # also stop the writing thread if the loop fails
+        writer.close()
     logger.info('Closing %s [done]' % use_fname)
     _finish_writing_raw(fid)
 
@@ -1617,6 +1748,24 @@ def _write_raw_buffer(fid, buf, cals, format, inv_comp):
         The CTF compensation matrix used to revert compensation
         change when reading.
     """
+    write_function, buf, _ = _prepare_raw_buffer(buf, cals, format, inv_comp)
+    write_function(fid, FIFF.FIFF_DATA_BUFFER, buf)
+
+
+def _prepare_raw_buffer(buf, cals, format, inv_comp):
+    """Calibrate a raw buffer for writing
+
+    See _write_raw_buffer for a description of the parameters.
+
+    Returns
+    -------
+    write_function : callable
+        The function to use to write the buffer.
+    buf : array
+        The calibrated buffer.
+    n_bytes : int
+        The number of bytes the buffer tag will occupy in the file.
+    """
     if buf.shape[0] != len(cals):
         raise ValueError('buffer and calibration sizes do not match')
 
@@ -1646,7 +1795,77 @@ def _write_raw_buffer(fid, buf, cals, format, inv_comp):
     else:
         buf = buf / np.ravel(cals)[:, None]
 
-    write_function(fid, FIFF.FIFF_DATA_BUFFER, buf)
+    # tag header (kind, type, size, next) followed by the data
+    item_size = dict(short=2, int=4, single=4, double=8)[format]
+    if np.iscomplexobj(buf):
+        item_size *= 2
+    n_bytes = 16 + buf.size * item_size
+    return write_function, buf, n_bytes
+
+
+class _RawBufferWriter(object):
+    """Helper to write raw data buffers, optionally in a background thread
+
+    With ``pipeline=True`` at most one buffer is being written while the
+    caller prepares the next one. The file position is then tracked from
+    the known tag sizes so that split decisions do not wait for the disk.
+    """
+    def __init__(self, fid, pipeline=False):
+        self.fid = fid
+        self._pool = ThreadPool(1) if pipeline else None
+        self._pending = None
+        self._pos = None
+        self._n_bytes = 0
+        self._write_time = 0.
+        self._t0 = time.time()
+
+    def _write(self, write_function, buf, n_bytes):
+        t0 = time.time()
+        write_function(self.fid, FIFF.FIFF_DATA_BUFFER, buf)
+        self._write_time += time.time() - t0
+        self._n_bytes += n_bytes
+
+    def write(self, write_function, buf, n_bytes):
+        """Write a buffer, waiting for the previous one if necessary"""
+        if self._pool is None:
+            self._write(write_function, buf, n_bytes)
+            return
+        self.wait()
+        if self._pos is None:
+            self._pos = self.fid.tell()
+        self._pos += n_bytes
+        self._pending = self._pool.apply_async(self._write,
+                                               (write_function, buf, n_bytes))
+
+    def tell(self):
+        """File position once all submitted buffers have been written"""
+        if self._pool is None or self._pos is None:
+            self.wait()
+            return self.fid.tell()
+        return self._pos
+
+    def wait(self):
+        """Wait for the pending write to finish (re-raises its errors)"""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.get()
+
+    def close(self):
+        """Flush pending writes and log the throughput"""
+        try:
+            self.wait()
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+        if self._n_bytes > 0:
+            mb = self._n_bytes / float(2 ** 20)
+            elapsed = max(time.time() - self._t0, 1e-6)
+            logger.info('    Wrote %0.1f MB in %0.2f sec (%0.1f MB/s, %0.2f '
+                        'sec spent writing)' % (mb, elapsed, mb / elapsed,
+                                                self._write_time))
+            self._n_bytes = 0
 
 
 def _finish_writing_raw(fid):
@@ -1729,6 +1948,196 @@ def concatenate_raws(raws, preload=None, events_list=None):
         return raws[0], events
 
 
+class ConcatenatedRaw(_BaseRaw):
+    """Virtual concatenation of raw instances
+
+    The data of the raw instances are not copied: reading a segment reads
+    the corresponding pieces from the underlying instances. Unlike
+    concatenate_raws, the instances are not modified and they can be
+    read by different readers (e.g., FIF, EDF and BrainVision).
+
+    Parameters
+    ----------
+    raws : list
+        List of Raw instances to concatenate (in order). They must have the
+        same channels (in any order) and sampling frequency.
+    preload : bool or str (default False)
+        Preload data into memory for data manipulation and faster indexing.
+        If True, the data will be preloaded into memory (fast, requires
+        large amount of memory). If preload is a string, preload is the
+        file name of a memory-mapped file which is used to store the data
+        on the hard drive (slower, requires less memory).
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
+
+    Attributes & Methods
+    --------------------
+    See documentation for mne.io.Raw
+    """
+    @verbose
+    def __init__(self, raws, preload=False, verbose=None):
+        if not isinstance(raws, (list, tuple)) or len(raws) == 0:
+            raise ValueError('raws must be a non-empty list of Raw '
+                             'instances')
+        self.info = deepcopy(raws[0].info)
+        self.verbose = verbose
+        self.preload = False
+        self._data = None
+        self._dtype = getattr(raws[0], '_dtype', np.dtype(np.float64))
+        self._projector = None
+        self.proj = False
+        self.comp = None
+        # not all readers define cals and orig_format
+        self.cals = np.array([ch['range'] * ch['cal']
+                              for ch in self.info['chs']])
+        orig_formats = set(getattr(raw, 'orig_format', 'unknown')
+                           for raw in raws)
+        self.orig_format = (orig_formats.pop() if len(orig_formats) == 1
+                            else 'unknown')
+        self._filenames = list()
+        # one piece per instance, with the order of its channels; like the
+        # FIF directories of RawFIFF, the pieces are selected by crop
+        self.rawdirs = list()
+        self._first_samps = np.array([], dtype=int)
+        self._last_samps = np.array([], dtype=int)
+        self.first_samp = raws[0].first_samp
+        self._add_pieces(raws)
+
+        if preload:
+            data_buffer = preload if isinstance(preload,
+                                                string_types) else None
+            self._data, self._times = self._read_segment(
+                data_buffer=data_buffer)
+            self.preload = True
+
+    def __repr__(self):
+        s = ('%d raw instances' % len(self.rawdirs),
+             'n_channels x n_times : %s x %s' % (self.info['nchan'],
+                                                 self.n_times))
+        return '<ConcatenatedRaw  |  %s>' % ', '.join(s)
+
+    @verbose
+    def _read_segment(self, start=0, stop=None, sel=None, data_buffer=None,
+                      projector=None, verbose=None):
+        """Read a chunk of raw data from the underlying instances
+
+        Parameters
+        ----------
+        start : int, (optional)
+            first sample to include (first is 0). If omitted, defaults to the
+            first sample in data.
+        stop : int, (optional)
+            First sample to not include.
+            If omitted, data is included to the end.
+        sel : array, optional
+            Indices of channels to select.
+        data_buffer : array or str, optional
+            numpy array to fill with data read, must have the correct shape.
+            If str, a np.memmap with the correct data type will be used
+            to store the data.
+        projector : array
+            SSP operator to apply to the data.
+        verbose : bool, str, int, or None
+            If not None, override default verbose level (see mne.verbose).
+
+        Returns
+        -------
+        data : array, [channels x samples]
+           the data matrix (channels x samples).
+        times : array, [samples]
+            returns the time values corresponding to the samples.
+        """
+        if stop is None or stop > self.n_times:
+            stop = self.n_times
+        start, stop = int(start), int(stop)
+        if start >= stop:
+            raise ValueError('No data in this range')
+        nchan = self.info['nchan']
+        sel = np.arange(nchan) if sel is None else np.atleast_1d(sel)
+        # the projection needs all the channels
+        read_sel = np.arange(nchan) if projector is not None else sel
+        data_shape = (len(sel), stop - start)
+        if isinstance(data_buffer, np.ndarray):
+            if data_buffer.shape != data_shape:
+                raise ValueError('data_buffer has incorrect shape')
+            data = data_buffer
+        else:
+            data = _allocate_data(None, data_buffer, data_shape, self._dtype)
+        if projector is not None:
+            out = np.empty((nchan, stop - start), dtype=data.dtype)
+        else:
+            out = data
+
+        offsets = np.concatenate(([0], np.cumsum(self._raw_lengths)))
+        for ri, (raw, ch_order) in enumerate(self.rawdirs):
+            first, last = max(start, offsets[ri]), min(stop, offsets[ri + 1])
+            if first >= last:
+                continue
+            # the beginning of the instance may have been cropped
+            r_start = (self._first_samps[ri] - raw.first_samp +
+                       first - offsets[ri])
+            r_stop = r_start + last - first
+            r_sel = ch_order[read_sel]
+            if raw.preload:
+                this_data = raw._data[r_sel, r_start:r_stop]
+            else:
+                this_data = raw._read_segment(start=r_start, stop=r_stop,
+                                              sel=r_sel,
+                                              projector=raw._projector)[0]
+            out[:, first - start:last - start] = this_data
+
+        if projector is not None:
+            data[:] = np.dot(projector, out)[sel]
+        times = np.arange(start, stop) / self.info['sfreq']
+        return data, times
+
+    def append(self, raws, preload=None):
+        """Concatenate raw instances, without reading their data
+
+        Parameters
+        ----------
+        raws : list, or Raw instance
+            list of Raw instances to concatenate to the current instance
+            (in order), or a single raw instance to concatenate.
+        preload : None | False
+            The data cannot be preloaded. Use ConcatenatedRaw(raws,
+            preload=True) instead.
+        """
+        if preload:
+            raise ValueError('ConcatenatedRaw.append cannot preload the '
+                             'data')
+        if self.preload:
+            raise RuntimeError('Cannot append to preloaded ConcatenatedRaw')
+        if not isinstance(raws, list):
+            raws = [raws]
+        self._add_pieces(raws)
+
+    def _add_pieces(self, raws):
+        """Add raw instances at the end"""
+        for ri, raw in enumerate(raws):
+            if raw.info['sfreq'] != self.info['sfreq']:
+                raise ValueError('raws[%d].info[\'sfreq\'] must match' % ri)
+            if set(raw.ch_names) != set(self.ch_names):
+                raise ValueError('raws[%d].info[\'ch_names\'] must match'
+                                 % ri)
+            if len(raw.info['projs']) != len(self.info['projs']) or not all(
+                    proj_equal(p1, p2) for p1, p2 in
+                    zip(raw.info['projs'], self.info['projs'])):
+                raise ValueError('SSP projectors in raw files must be the '
+                                 'same')
+        for raw in raws:
+            ch_order = np.array([raw.ch_names.index(name)
+                                 for name in self.ch_names])
+            self.rawdirs.append((raw, ch_order))
+            self._filenames += getattr(raw, '_filenames', [])
+        self._first_samps = np.r_[self._first_samps,
+                                  [raw.first_samp for raw in raws]]
+        self._last_samps = np.r_[self._last_samps,
+                                 [raw.last_samp for raw in raws]]
+        self._raw_lengths = self._last_samps - self._first_samps + 1
+        self.last_samp = self.first_samp + sum(self._raw_lengths) - 1
+
+
 def get_chpi_positions(raw, t_step=None):
     """Extract head positions
 
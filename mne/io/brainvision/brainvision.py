@@ -14,7 +14,7 @@ import numpy as np
 
 from ...coreg import get_ras_to_neuromag_trans, read_elp
 from ...transforms import als_ras_trans, apply_trans
-from ...utils import verbose, logger
+from ...utils import verbose, logger, _check_dtype
 from ..constants import FIFF
 from ..meas_info import Info
 from ..base import _BaseRaw
@@ -50,6 +50,10 @@ class RawBrainVision(_BaseRaw):
     eog : list of str
         Names of channels that should be designated EOG channels. Names should
         correspond to the vhdr file (default: ['HEOGL', 'HEOGR', 'VEOGb']).
+    dtype : str | np.dtype | None
+        The data type of the data read from the file, 'float64' or
+        'float32' to halve the memory needed. If None, the MNE_DATA_DTYPE
+        config value is used (defaults to 'float64').
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
 
@@ -60,11 +64,13 @@ class RawBrainVision(_BaseRaw):
     @verbose
     def __init__(self, vhdr_fname, elp_fname=None, elp_names=None,
                  preload=False, reference=None,
-                 eog=['HEOGL', 'HEOGR', 'VEOGb'], verbose=None):
+                 eog=['HEOGL', 'HEOGR', 'VEOGb'], dtype=None,
+                 verbose=None):
 
         # Preliminary Raw attributes
         self._events = np.empty((0, 3))
         self.preload = False
+        self._dtype = _check_dtype(dtype)
 
         # Channel info and events
         logger.info('Extracting eeg Parameters from %s...' % vhdr_fname)
@@ -171,36 +177,34 @@ class RawBrainVision(_BaseRaw):
                     (start, stop - 1, start / float(sfreq),
                      (stop - 1) / float(sfreq)))
 
-        # read data
+        # map the data, the channels are stored as columns (MULTIPLEXED)
+        # or as rows (VECTORIZED) of a matrix
         dtype = np.dtype(eeg_info['dtype'])
-        buffer_size = (stop - start)
-        pointer = start * n_eeg * dtype.itemsize
-        with open(self.info['file_id'], 'rb') as f:
-            f.seek(pointer)
-            # extract data
-            data = np.fromfile(f, dtype=dtype, count=buffer_size * n_eeg)
+        n_samples = os.path.getsize(self.info['file_id']) // (dtype.itemsize *
+                                                             n_eeg)
         if eeg_info['data_orientation'] == 'MULTIPLEXED':
-            data = data.reshape((n_eeg, -1), order='F')
+            raw_data = np.memmap(self.info['file_id'], dtype, mode='r',
+                                 shape=(n_samples, n_eeg)).T
         elif eeg_info['data_orientation'] == 'VECTORIZED':
-            data = data.reshape((n_eeg, -1), order='C')
-
-        gains = cals * mults
-        data = data * gains.T
-
-        # add reference channel and stim channel (if applicable)
-        data_segments = [data]
-        if self._reference:
-            shape = (1, data.shape[1])
-            ref_channel = np.zeros(shape)
-            data_segments.append(ref_channel)
+            raw_data = np.memmap(self.info['file_id'], dtype, mode='r',
+                                 shape=(n_eeg, n_samples))
+        raw_data = raw_data[:, start:stop]
+
+        # only read and convert the selected channels, the reference and
+        # stim channels (if present) come after the EEG channels
+        sel = np.arange(self.info['nchan']) if sel is None else np.asarray(sel)
+        gains = (cals * mults).ravel()
+        is_eeg = sel < n_eeg
+        data = np.zeros((len(sel), raw_data.shape[1]), self._dtype)
+        data[is_eeg] = raw_data[sel[is_eeg]]
+        data[is_eeg] *= gains[sel[is_eeg]][:, np.newaxis]
+        del raw_data
         if len(self._events):
-            stim_channel = _synthesize_stim_channel(self._events, start, stop)
-            data_segments.append(stim_channel)
-        if len(data_segments) > 1:
-            data = np.vstack(data_segments)
-
-        if sel is not None:
-            data = data[sel]
+            is_stim = sel == self.info['nchan'] - 1
+            if np.any(is_stim):
+                stim_channel = _synthesize_stim_channel(self._events, start,
+                                                        stop)
+                data[is_stim] = stim_channel
 
         logger.info('[done]')
         times = np.arange(start, stop, dtype=float) / sfreq
@@ -261,7 +265,8 @@ class RawBrainVision(_BaseRaw):
             self.info['chs'].append(chan_info)
             if self.preload:
                 shape = (1, self._data.shape[1])
-                self._data = np.vstack((self._data, np.empty(shape)))
+                self._data = np.vstack((self._data,
+                                        np.zeros(shape, self._dtype)))
 
         # update events
         self._events = events
@@ -634,7 +639,8 @@ def _get_eeg_info(vhdr_fname, elp_fname, elp_names, reference, eog):
 
 def read_raw_brainvision(vhdr_fname, elp_fname=None, elp_names=None,
                          preload=False, reference=None,
-                         eog=['HEOGL', 'HEOGR', 'VEOGb'], verbose=None):
+                         eog=['HEOGL', 'HEOGR', 'VEOGb'], dtype=None,
+                         verbose=None):
     """Reader for Brain Vision EEG file
 
     Parameters
@@ -661,6 +667,10 @@ def read_raw_brainvision(vhdr_fname, elp_fname=None, elp_names=None,
     eog : list of str
         Names of channels that should be designated EOG channels. Names should
         correspond to the vhdr file (default: ['HEOGL', 'HEOGR', 'VEOGb']).
+    dtype : str | np.dtype | None
+        The data type of the data read from the file, 'float64' or
+        'float32' to halve the memory needed. If None, the MNE_DATA_DTYPE
+        config value is used (defaults to 'float64').
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
 
@@ -669,5 +679,5 @@ def read_raw_brainvision(vhdr_fname, elp_fname=None, elp_names=None,
     mne.io.Raw : Documentation of attribute and methods.
     """
     raw = RawBrainVision(vhdr_fname, elp_fname, elp_names, preload,
-                         reference, eog, verbose)
+                         reference, eog, dtype, verbose)
     return raw
@@ -7,8 +7,9 @@ from __future__ import print_function
 
 import os.path as op
 import inspect
+from copy import deepcopy
 
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_raises
 import numpy as np
 from numpy.testing import assert_array_almost_equal, assert_array_equal
 
@@ -16,7 +17,7 @@ import mne
 from mne.utils import _TempDir
 from mne import pick_types
 from mne.io.constants import FIFF
-from mne.io import Raw
+from mne.io import Raw, RawArray, ConcatenatedRaw
 from mne.io import read_raw_brainvision
 
 FILE = inspect.getfile(inspect.currentframe())
@@ -69,6 +70,22 @@ def test_brainvision_data():
             raise RuntimeError("Unknown Channel: %s" % ch['ch_name'])
 
 
+def test_brainvision_concatenated():
+    """Test virtual concatenation of Brain Vision and other raw instances
+    """
+    raw_py = read_raw_brainvision(vhdr_path, elp_path, elp_names)
+    data, _ = raw_py[:, :]
+    raw_array = RawArray(data[::-1].copy(), deepcopy(raw_py.info))
+    raw_virt = ConcatenatedRaw([raw_py, raw_array, raw_py])
+    assert_equal(raw_virt.n_times, 3 * raw_py.n_times)
+    data_virt, _ = raw_virt[:, :]
+    assert_array_equal(data_virt, np.concatenate([data, data[::-1], data],
+                                                 axis=1))
+    n_times = raw_py.n_times
+    assert_array_equal(raw_virt[[2, 3], n_times - 5:n_times + 5][0],
+                       data_virt[[2, 3], n_times - 5:n_times + 5])
+
+
 def test_events():
     """Test reading and modifying events"""
     raw = read_raw_brainvision(vhdr_path, preload=True)
@@ -155,3 +172,13 @@ def test_read_segment():
     assert_equal(len(raw4._data), len(raw1._data) + 1)
     ref_data, _ = raw4[ref_idx]
     assert_array_equal(ref_data, 0)
+
+    # read only some channels and samples, as single precision
+    raw5 = read_raw_brainvision(vhdr_path, dtype=np.float32)
+    picks = [0, 5, raw5.info['nchan'] - 1]
+    data5, _ = raw5[picks, 100:1500]
+    assert_equal(data5.dtype, np.float32)
+    assert_array_almost_equal(data5, raw1[picks, 100:1500][0], 8)
+    raw5 = read_raw_brainvision(vhdr_path, preload=True, dtype=np.float32)
+    assert_equal(raw5._data.dtype, np.float32)
+    assert_raises(ValueError, read_raw_brainvision, vhdr_path, dtype=int)
@@ -875,6 +875,11 @@ def _read_bti_header(pdf_fname, config_fname):
     info['chs'] = [chans[pos] for pos in by_name]
     info['order'] = by_name
 
+    # calibration of each column of the data
+    info['cals'] = np.zeros(info['total_chans'], np.float32)
+    for ch in info['chs']:
+        info['cals'][ch['index']] = ch['cal']
+
     # finally add some important fields from the config
     info['e_table'] = cfg['user_blocks'][BTI.UB_B_E_TABLE_USED]
     info['weights'] = cfg['user_blocks'][BTI.UB_B_WEIGHTS_USED]
@@ -882,7 +887,7 @@ def _read_bti_header(pdf_fname, config_fname):
     return info
 
 
-def _read_data(info, start=None, stop=None):
+def _read_data(info, start=None, stop=None, sel=None):
     """ Helper function: read Bti processed data file (PDF)
 
     Parameters
@@ -895,8 +900,8 @@ def _read_data(info, start=None, stop=None):
     stop : int | None
         The number of the last time slice to read. If None, all data will
         be read to the end.
-    dtype : str | dtype object
-        The type the data are casted to.
+    sel : array of int | None
+        The channels to read. If None, all channels are read.
 
     Returns
     -------
@@ -914,17 +919,16 @@ def _read_data(info, start=None, stop=None):
         raise RuntimeError('Invalid data range supplied:'
                            ' %d, %d' % (start, stop))
 
-    with open(info['pdf_fname'], 'rb') as fid:
-        fid.seek(info['bytes_per_slice'] * start, 0)
-        cnt = (stop - start) * info['total_chans']
-        shape = [stop - start, info['total_chans']]
-        data = np.fromfile(fid, dtype=info['dtype'],
-                           count=cnt).astype('f4').reshape(shape)
-
-    for ch in info['chs']:
-        data[:, ch['index']] *= ch['cal']
-
-    return data[:, info['order']].T
+    # the time slices are stored as rows, only convert the needed columns
+    cols = np.asarray(info['order'])
+    if sel is not None:
+        cols = cols[sel]
+    data = np.memmap(info['pdf_fname'], dtype=info['dtype'], mode='r',
+                     shape=(total_slices, info['total_chans']))
+    out = np.array(data[start:stop, cols].T, dtype='f4')
+    del data
+    out *= info['cals'][cols][:, np.newaxis]
+    return out
 
 
 class RawBTi(_BaseRaw):
@@ -952,6 +956,10 @@ class RawBTi(_BaseRaw):
     eog_ch: tuple of str | None
       The 4D names of the EOG channels. If None, the channels will be treated
       as regular EEG channels.
+    preload : bool
+        If True (default), all data are loaded at initialization.
+        If False, data are not read until needed, and only the time slices
+        and channels requested are read from disk.
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
 
@@ -964,7 +972,7 @@ class RawBTi(_BaseRaw):
     def __init__(self, pdf_fname, config_fname='config',
                  head_shape_fname='hs_file', rotation_x=None,
                  translation=(0.0, 0.02, 0.11), ecg_ch='E31',
-                 eog_ch=('E63', 'E64'), verbose=None):
+                 eog_ch=('E63', 'E64'), preload=True, verbose=None):
 
         if not op.isabs(pdf_fname):
             pdf_fname = op.abspath(pdf_fname)
@@ -1159,22 +1167,24 @@ class RawBTi(_BaseRaw):
         self.proj = None
         self.comp = None
         self._filenames = list()
-        self.preload = True
+        self.preload = False
+        self._projector = None
         self._projector_hashes = [None]
         self.info = info
+        self._bti_info = bti_info
 
-        logger.info('Reading raw data from %s...' % pdf_fname)
-        self._data = _read_data(bti_info)
-        self.first_samp, self.last_samp = 0, self._data.shape[1] - 1
-        self._raw_lengths = np.array([self._data.shape[1]])
+        n_times = bti_info['total_slices']
+        self.first_samp, self.last_samp = 0, n_times - 1
+        self._raw_lengths = np.array([n_times])
         self._first_samps = np.array([0])
         self._last_samps = self._raw_lengths - 1
         self.rawdirs = [[]]
-
-        assert len(self._data) == len(self.info['ch_names'])
-        self._times = np.arange(self.first_samp,
-                                self.last_samp + 1) / info['sfreq']
         self._projectors = [None]
+        if preload:
+            self.preload = preload
+            logger.info('Reading raw data from %s...' % pdf_fname)
+            self._data, self._times = self._read_segment()
+            assert len(self._data) == len(self.info['ch_names'])
         logger.info('    Range : %d ... %d =  %9.3f ... %9.3f secs' % (
                     self.first_samp, self.last_samp,
                     float(self.first_samp) / info['sfreq'],
@@ -1182,12 +1192,63 @@ class RawBTi(_BaseRaw):
 
         logger.info('Ready.')
 
+    @verbose
+    def _read_segment(self, start=0, stop=None, sel=None, verbose=None,
+                      projector=None):
+        """Read a chunk of raw data
+
+        Parameters
+        ----------
+        start : int, (optional)
+            first sample to include (first is 0). If omitted, defaults to the
+            first sample in data.
+        stop : int, (optional)
+            First sample to not include.
+            If omitted, data is included to the end.
+        sel : array, optional
+            Indices of channels to select.
+        projector : array
+            SSP operator to apply to the data.
+        verbose : bool, str, int, or None
+            If not None, override default verbose level (see mne.verbose).
+
+        Returns
+        -------
+        data : array, shape (n_channels, n_samples)
+           The data.
+        times : array, shape (n_samples,)
+            returns the time values corresponding to the samples.
+        """
+        if stop is None or stop > self.n_times:
+            stop = self.n_times
+        start = int(start)
+        stop = int(stop)
+        if start >= stop:
+            raise ValueError('No data in this range')
+
+        sfreq = self.info['sfreq']
+        logger.info('Reading %d ... %d  =  %9.3f ... %9.3f secs...' %
+                    (start, stop - 1, start / float(sfreq),
+                     (stop - 1) / float(sfreq)))
+        # the raw data may have been cropped, the projection needs all the
+        # channels
+        data = _read_data(self._bti_info, start + self.first_samp,
+                          stop + self.first_samp,
+                          sel if projector is None else None)
+        if projector is not None:
+            data = np.dot(projector, data)
+            if sel is not None:
+                data = data[sel]
+        logger.info('[done]')
+        times = np.arange(start, stop) / sfreq
+        return data, times
+
 
 @verbose
 def read_raw_bti(pdf_fname, config_fname='config',
                  head_shape_fname='hs_file', rotation_x=None,
                  translation=(0.0, 0.02, 0.11), ecg_ch='E31',
-                 eog_ch=('E63', 'E64'), verbose=True):
+                 eog_ch=('E63', 'E64'), preload=True, verbose=True):
     """ Raw object from 4D Neuroimaging MagnesWH3600 data
 
     Note.
@@ -1222,10 +1283,14 @@ def read_raw_bti(pdf_fname, config_fname='config',
     eog_ch: tuple of str | None
       The 4D names of the EOG channels. If None, the channels will be treated
       as regular EEG channels.
+    preload : bool
+        If True (default), all data are loaded at initialization.
+        If False, data are not read until needed, and only the time slices
+        and channels requested are read from disk.
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
     """
     return RawBTi(pdf_fname, config_fname=config_fname,
                   head_shape_fname=head_shape_fname,
                   rotation_x=rotation_x, translation=translation,
-                  verbose=verbose)
+                  preload=preload, verbose=verbose)
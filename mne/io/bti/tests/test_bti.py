@@ -47,6 +47,9 @@ def test_read_pdf():
         data = _read_data(info)
         shape = (info['total_chans'], info['total_slices'])
         assert_true(data.shape == shape)
+        # parts of the data
+        data_ = _read_data(info, 10, 50, [0, 7, 3])
+        assert_array_equal(data_, data[[0, 7, 3], 10:50])
 
 
 def test_crop():
@@ -93,6 +96,15 @@ def test_raw():
                 assert_array_equal(ra._data[:NCH], ex._data[:NCH])
                 assert_array_equal(ra.cals[:NCH], ex.cals[:NCH])
                 ra.save(tmp_raw_fname)
+            # reading from disk
+            ra_ = read_raw_bti(pdf, config, hs, preload=False)
+            assert_array_equal(ra_[:, :][0], ra._data)
+            assert_array_equal(ra_[[5, 1], 20:100][0],
+                               ra._data[[5, 1], 20:100])
+            projector = np.eye(len(ra.ch_names))[::-1]
+            assert_array_equal(ra_._read_segment(20, 100, [5, 1],
+                                                 projector=projector)[0],
+                               ra._data[::-1][[5, 1], 20:100])
             with Raw(tmp_raw_fname) as r:
                 print(r)
         os.remove(tmp_raw_fname)
@@ -12,13 +12,14 @@ import calendar
 import datetime
 import re
 import warnings
-from math import ceil, floor
+from math import ceil
 
 import numpy as np
 from scipy.interpolate import interp1d
 
 from ...transforms import als_ras_trans_mm, apply_trans
-from ...utils import verbose, logger
+from ...utils import verbose, logger, _check_dtype
+from ...fixes import astype_no_copy
 from ..base import _BaseRaw
 from ..meas_info import Info
 from ..constants import FIFF
@@ -98,6 +99,7 @@ class RawEDF(_BaseRaw):
         # Raw attributes
         self.verbose = verbose
         self.preload = False
+        self._dtype = _check_dtype(None)
         self._filenames = list()
         self._projector = None
         self.first_samp = 0
@@ -183,16 +185,12 @@ class RawEDF(_BaseRaw):
 
         sfreq = self.info['sfreq']
         n_chan = self.info['nchan']
-        data_size = self._edf_info['data_size']
-        data_offset = self._edf_info['data_offset']
+        n_samps = self._edf_info['n_samps']
         stim_channel = self._edf_info['stim_channel']
         tal_channel = self._edf_info['tal_channel']
         annot = self._edf_info['annot']
         annotmap = self._edf_info['annotmap']
 
-        blockstart = int(floor(float(start) / sfreq) * sfreq)
-        blockstop = int(ceil(float(stop) / sfreq) * sfreq)
-
         if start >= stop:
             raise ValueError('No data in this range')
 
@@ -200,119 +198,90 @@ class RawEDF(_BaseRaw):
                     (start, stop - 1, start / float(sfreq),
                      (stop - 1) / float(sfreq)))
 
-        gains = []
-        for chan in range(n_chan):
-            # gain constructor
-            physical_range = self.info['chs'][chan]['range']
-            cal = float(self.info['chs'][chan]['cal'])
-            unit_mul = 10 ** self.info['chs'][chan]['unit_mul']
-            gains.append(unit_mul * (physical_range / cal))
-
-        with open(self.info['file_id'], 'rb') as fid:
-            # extract data
-            fid.seek(data_offset)
-            buffer_size = blockstop - blockstart
-            pointer = blockstart * n_chan * data_size
-            fid.seek(data_offset + pointer)
-
-            if 'n_samps' in self._edf_info:
-                n_samps = self._edf_info['n_samps']
-                max_samp = float(np.max(n_samps))
-                blocks = int(buffer_size / max_samp)
-            else:
-                blocks = int(ceil(float(buffer_size) / sfreq))
-            datas = []
-            # bdf data: 24bit data
-            if self._edf_info['subtype'] == '24BIT':
-                data = fid.read(buffer_size * n_chan * data_size)
-                data = np.fromstring(data, np.uint8)
-                data = data.reshape(-1, 3).astype(np.int32)
-                # this converts to 24-bit little endian integer
-                # # no support in numpy
-                data = (data[:, 0] + (data[:, 1] << 8) + (data[:, 2] << 16))
-                # 24th bit determines the sign
-                data[data >= (1 << 23)] -= (1 << 24)
-                data = data.reshape((int(sfreq), n_chan, blocks), order='F')
-                for i in range(blocks):
-                    datas.append(data[:, :, i].T)
-            else:
-                if 'n_samps' in self._edf_info:
-                    data = []
-                    for _ in range(blocks):
-                        for samp in n_samps:
-                            chan_data = np.fromfile(fid, dtype='<i2',
-                                                    count=samp)
-                            data.append(chan_data)
-                    for i, samp in enumerate(n_samps):
-                        chan_data = data[i::n_chan]
-                        chan_data = np.hstack(chan_data)
-                        if i == tal_channel:
-                            # don't resample tal_channel,
-                            # pad with zeros instead.
-                            n_missing = int(max_samp - samp) * blocks
-                            chan_data = np.hstack([chan_data, [0] * n_missing])
-                        elif i == stim_channel and samp < max_samp:
-                            if annot and annotmap or tal_channel is not None:
-                                # don't bother with resampling the stim channel
-                                # because it gets overwritten later on.
-                                chan_data = np.zeros(max_samp)
-                            else:
-                                warnings.warn('Interpolating stim channel. '
-                                              'Events may jitter.')
-                                oldrange = np.linspace(0, 1, samp + 1, True)
-                                newrange = np.linspace(0, 1, max_samp, False)
-                                chan_data = interp1d(oldrange,
-                                                     np.append(chan_data, 0),
-                                                     kind='zero')(newrange)
-                        elif samp != max_samp:
-                            mult = max_samp / samp
-                            chan_data = resample(x=chan_data, up=mult,
-                                                 down=1, npad=0)
-                        datas.append(chan_data)
-                else:
-                    data = np.fromfile(fid, dtype='<i2',
-                                       count=buffer_size * n_chan)
-                    data = data.reshape((int(sfreq), n_chan, blocks),
-                                        order='F')
-                    for i in range(blocks):
-                        datas.append(data[:, :, i].T)
-        if 'n_samps' in self._edf_info:
-            data = np.vstack(datas)
-        else:
-            data = np.hstack(datas)
-        gains = np.array([gains])
-        data = gains.T * data
-        if stim_channel is not None:
+        # only whole data records can be read
+        max_samp = int(np.max(n_samps))
+        first_rec = start // max_samp
+        last_rec = min(int(ceil(float(stop) / max_samp)),
+                       self._edf_info['n_records'])
+        blockstart = first_rec * max_samp
+
+        # only decode the selected channels (and those needed to create the
+        # stim channel)
+        sel = np.arange(n_chan)[sel]
+        read_chs = [sel]
+        if stim_channel is not None and not (annot and annotmap):
+            if tal_channel is not None:
+                read_chs.append([tal_channel])
+            elif stim_channel in sel:
+                read_chs.append([stim_channel])
+        read_chs = np.unique(np.concatenate(read_chs))
+        data = _read_edf_records(self.info['file_id'], self._edf_info,
+                                 first_rec, last_rec, read_chs)
+        if not isinstance(data, np.ndarray):
+            # different sampling rates, bring all channels to max_samp
+            n_rec = last_rec - first_rec
+            for ii, (chan, chan_data) in enumerate(zip(read_chs, data)):
+                samp = n_samps[chan]
+                if chan == tal_channel:
+                    # don't resample tal_channel,
+                    # pad with zeros instead.
+                    n_missing = (max_samp - samp) * n_rec
+                    chan_data = np.hstack([chan_data, [0] * n_missing])
+                elif chan == stim_channel and samp < max_samp:
+                    if annot and annotmap or tal_channel is not None:
+                        # don't bother with resampling the stim channel
+                        # because it gets overwritten later on.
+                        chan_data = np.zeros(max_samp * n_rec)
+                    else:
+                        warnings.warn('Interpolating stim channel. '
+                                      'Events may jitter.')
+                        oldrange = np.linspace(0, 1, samp * n_rec + 1, True)
+                        newrange = np.linspace(0, 1, max_samp * n_rec, False)
+                        chan_data = interp1d(oldrange,
+                                             np.append(chan_data, 0),
+                                             kind='zero')(newrange)
+                elif samp != max_samp:
+                    mult = max_samp / float(samp)
+                    chan_data = resample(x=chan_data, up=mult,
+                                         down=1, npad=0)
+                data[ii] = chan_data
+            data = np.array(data)
+
+        if stim_channel is not None and stim_channel in read_chs:
+            stim_row = np.searchsorted(read_chs, stim_channel)
             if annot and annotmap:
-                data[stim_channel] = 0
+                data[stim_row] = 0
                 evts = _read_annot(annot, annotmap, sfreq, self.last_samp)
-                data[stim_channel, :evts.size] = evts[start:stop]
+                evts = evts[blockstart:blockstart + data.shape[1]]
+                data[stim_row, :evts.size] = evts
             elif tal_channel is not None:
-                evts = _parse_tal_channel(data[tal_channel])
+                tal_row = np.searchsorted(read_chs, tal_channel)
+                evts = _parse_tal_channel(data[tal_row])
                 self._edf_info['events'] = evts
 
                 unique_annots = sorted(set([e[2] for e in evts]))
                 mapping = dict((a, n + 1) for n, a in enumerate(unique_annots))
 
-                data[stim_channel] = 0
+                data[stim_row] = 0
                 for t_start, t_duration, annotation in evts:
                     evid = mapping[annotation]
                     n_start = int(t_start * sfreq)
                     n_stop = int(t_duration * sfreq) + n_start - 1
                     # make sure events without duration get one sample
                     n_stop = n_stop if n_stop > n_start else n_start+1
-                    if any(data[stim_channel][n_start:n_stop]):
+                    n_start = max(n_start - blockstart, 0)
+                    n_stop = max(n_stop - blockstart, 0)
+                    if any(data[stim_row][n_start:n_stop]):
                         raise NotImplementedError('EDF+ with overlapping '
                                                   'events not supported.')
-                    data[stim_channel][n_start:n_stop] = evid
+                    data[stim_row][n_start:n_stop] = evid
             else:
-                stim = np.array(data[stim_channel], int)
-                mask = 255 * np.ones(stim.shape, int)
-                stim = np.bitwise_and(stim, mask)
-                data[stim_channel] = stim
+                stim = np.array(data[stim_row], int)
+                data[stim_row] = np.bitwise_and(stim, 255)
         datastart = start - blockstart
         datastop = stop - blockstart
-        data = data[sel, datastart:datastop]
+        data = data[np.searchsorted(read_chs, sel), datastart:datastop]
+        data = astype_no_copy(data, self._dtype)
 
         logger.info('[done]')
         times = np.arange(start, stop, dtype=float) / self.info['sfreq']
@@ -320,6 +289,88 @@ class RawEDF(_BaseRaw):
         return data, times
 
 
+def _decode_edf_ints(data, data_size):
+    """Helper to decode little-endian 16- or 24-bit integers
+
+    Parameters
+    ----------
+    data : array of uint8, shape (..., n_bytes)
+        The raw bytes, the last dimension holds n_bytes / data_size samples.
+    data_size : int
+        The number of bytes per sample (2 for EDF, 3 for BDF).
+
+    Returns
+    -------
+    ints : array of int16 | int32, shape (..., n_bytes / data_size)
+        The decoded samples.
+    """
+    if data_size == 2:
+        return np.ascontiguousarray(data).view('<i2')
+    # put the three bytes into the upper bytes of 32-bit integers, the
+    # arithmetic right shift then restores the value and the sign
+    shape = data.shape[:-1] + (data.shape[-1] // 3,)
+    ints = np.zeros(shape + (4,), np.uint8)
+    ints[..., 1:] = data.reshape(shape + (3,))
+    return ints.view('<i4')[..., 0] >> 8
+
+
+def _read_edf_records(fname, edf_info, first_rec, last_rec, chs):
+    """Helper to read calibrated channels from a range of data records
+
+    The data records are memory-mapped, and the samples of the requested
+    channels are decoded and calibrated for many records at once.
+
+    Parameters
+    ----------
+    fname : str
+        The EDF+,BDF file.
+    edf_info : dict
+        The EDF+,BDF specific parameters.
+    first_rec : int
+        The first record to read.
+    last_rec : int
+        The record after the last one to read.
+    chs : array of int
+        The channels to read.
+
+    Returns
+    -------
+    data : array, shape (n_chs, n_samples) | list of array
+        The data of the channels in chs. If the channels have different
+        numbers of samples per record, a list with the data of each channel
+        is returned instead.
+    """
+    n_samps = edf_info['n_samps']
+    data_size = edf_info['data_size']
+    gains = edf_info['gains'][chs]
+    offsets = np.concatenate([[0], np.cumsum(n_samps)]) * data_size
+    n_rec = last_rec - first_rec
+    records = np.memmap(fname, np.uint8, mode='r', shape=(n_rec, offsets[-1]),
+                        offset=edf_info['data_offset'] +
+                        first_rec * offsets[-1])
+    if np.unique(n_samps).size == 1:
+        n_samp = n_samps[0]
+        records = records.reshape(n_rec, len(n_samps), n_samp * data_size)
+        data = np.empty((len(chs), n_rec, n_samp))
+        # decode ~10 MB of data at a time to limit the memory overhead
+        n_batch = max(int(1e7) // (len(chs) * n_samp * data_size), 1)
+        for first in range(0, n_rec, n_batch):
+            ints = _decode_edf_ints(records[first:first + n_batch, chs],
+                                    data_size)
+            np.multiply(gains[:, np.newaxis, np.newaxis],
+                        ints.transpose(1, 0, 2),
+                        out=data[:, first:first + n_batch])
+        data = data.reshape(len(chs), n_rec * n_samp)
+    else:
+        data = list()
+        for chan, gain in zip(chs, gains):
+            ints = _decode_edf_ints(records[:, offsets[chan]:
+                                            offsets[chan + 1]], data_size)
+            data.append(gain * ints.ravel())
+    del records
+    return data
+
+
 def _parse_tal_channel(tal_channel_data):
     """Parse time-stamped annotation lists (TALs) in stim_channel
     and return list of events.
@@ -504,8 +555,8 @@ def _get_edf_info(fname, n_eeg, stim_channel, annot, annotmap, tal_channel,
             warnings.warn('%s' % ('Channels contain different lowpass filters.'
                                   ' Lowest filter setting will be stored.'))
         n_samples_per_record = [int(fid.read(8)) for _ in channels]
+        edf_info['n_samps'] = np.array(n_samples_per_record)
         if np.unique(n_samples_per_record).size != 1:
-            edf_info['n_samps'] = np.array(n_samples_per_record)
             if not preload:
                 raise RuntimeError('%s' % ('Channels contain different'
                                            'sampling rates. '
@@ -624,6 +675,10 @@ def _get_edf_info(fname, n_eeg, stim_channel, annot, annotmap, tal_channel,
             if isinstance(stim_channel, str):
                 stim_channel = idx
         info['chs'].append(chan_info)
+    # calibration of the data, which are stored as integers
+    edf_info['gains'] = np.array([10 ** ch['unit_mul'] *
+                                  (ch['range'] / float(ch['cal']))
+                                  for ch in info['chs']])
     if stim_channel is None:
         edf_info['stim_channel'] = stim_channel
     else:
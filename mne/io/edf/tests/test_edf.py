@@ -111,6 +111,27 @@ def test_read_segment():
     assert_array_equal(data1, data2)
     assert_array_equal(times1, times2)
 
+    # only some of the channels, spanning several data records
+    for path in (edf_path, bdf_path):
+        raw1 = read_raw_edf(path, preload=False)
+        raw2 = read_raw_edf(path, preload=True)
+        picks = [len(raw1.ch_names) - 1, 0, 7]
+        assert_array_equal(raw1[picks, 500:1700][0], raw2[picks, 500:1700][0])
+        assert_array_equal(raw1[5, 1000][0], raw2[5, 1000][0])
+
+
+def test_decode_ints():
+    """Test decoding of 16- and 24-bit integers
+    """
+    ints = np.array([[0, 1, -1], [2 ** 23 - 1, -2 ** 23, 1000]])
+    data = ints.astype('<i4').view(np.uint8).reshape(2, 3, 4)
+    assert_array_equal(edfmodule._decode_edf_ints(
+        data[:, :, :3].reshape(2, 9), 3), ints)
+    ints[1, :2] = [2 ** 15 - 1, -2 ** 15]
+    data = ints.astype('<i4').view(np.uint8).reshape(2, 3, 4)
+    assert_array_equal(edfmodule._decode_edf_ints(
+        data[:, :, :2].reshape(2, 6), 2), ints)
+
 
 def test_append():
     """Test appending raw edf objects using Raw.append
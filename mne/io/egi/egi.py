@@ -11,7 +11,7 @@ import numpy as np
 from ..base import _BaseRaw
 from ..meas_info import Info
 from ..constants import FIFF
-from ...utils import verbose, logger
+from ...utils import verbose, logger, _check_dtype
 
 _other_fields = [
     'lowpass', 'buffer_size_sec', 'dev_ctf_t',
@@ -70,7 +70,8 @@ def _read_header(fid):
     else:
         raise NotImplementedError('Only continous files are supported')
 
-    info.update(dict(precision=precision, unsegmented=unsegmented))
+    info.update(dict(precision=precision, unsegmented=unsegmented,
+                     data_offset=fid.tell()))
 
     return info
 
@@ -94,18 +95,31 @@ def _read_events(fid, info):
     return events
 
 
-def _read_data(fid, info):
-    """Aux function"""
+def _read_data(fid, info, start=0, stop=None):
+    """Aux function to read samples start to stop (channels x samples)"""
     if not info['unsegmented']:
         raise NotImplementedError('Only continous files are supported')
 
-    fid.seek(36 + info['n_events'] * 4, 0)  # skip header
-    readsize = (info['n_channels'] + info['n_events']) * info['n_samples']
-    final_shape = (info['n_samples'], info['n_channels'] + info['n_events'])
+    n_samples = info['n_samples'] if stop is None else stop
+    n_rows = info['n_channels'] + info['n_events']
+    fid.seek(info['data_offset'] + start * n_rows * info['bytesize'], 0)
+    readsize = n_rows * (n_samples - start)
+    final_shape = (n_samples - start, n_rows)
     data = np.fromfile(fid, info['dtype'], readsize).reshape(final_shape).T
     return data
 
 
+def _read_event_channels(fname, info):
+    """Aux function to read only the event channels (events x samples)"""
+    n_rows = info['n_channels'] + info['n_events']
+    data = np.memmap(fname, info['dtype'], mode='r',
+                     offset=info['data_offset'],
+                     shape=(info['n_samples'], n_rows))
+    events = np.array(data[:, info['n_channels']:].T, np.float64)
+    del data
+    return events
+
+
 def _combine_triggers(data, remapping=None):
     """Combine binary triggers"""
     new_trigger = np.zeros(data[0].shape)
@@ -126,7 +140,8 @@ def _combine_triggers(data, remapping=None):
 
 
 @verbose
-def read_raw_egi(input_fname, include=None, exclude=None, verbose=None):
+def read_raw_egi(input_fname, include=None, exclude=None, preload=True,
+                 verbose=None):
     """Read EGI simple binary as raw object
 
     Note. The trigger channel names are based on the
@@ -155,6 +170,10 @@ def read_raw_egi(input_fname, include=None, exclude=None, verbose=None):
        trigger. Defaults to None. If None, channels that have more than
        one event and the ``sync`` and ``TREV`` channels will be
        ignored.
+    preload : bool
+        If True (default), all data are loaded at initialization.
+        If False, data are not read until needed, and only the segments
+        and channels requested are read from disk.
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
 
@@ -163,7 +182,7 @@ def read_raw_egi(input_fname, include=None, exclude=None, verbose=None):
     raw : instance of mne.io.Raw
         A raw object containing EGI data.
     """
-    return _RawEGI(input_fname, include, exclude, verbose)
+    return _RawEGI(input_fname, include, exclude, preload, verbose)
 
 
 class _RawEGI(_BaseRaw):
@@ -171,26 +190,24 @@ class _RawEGI(_BaseRaw):
     """
     @verbose
     def __init__(self, input_fname, include=None, exclude=None,
-                 verbose=None):
+                 preload=True, verbose=None):
         """docstring for __init__"""
+        input_fname = os.path.abspath(input_fname)
         with open(input_fname, 'rb') as fid:  # 'rb' important for py3k
             logger.info('Reading EGI header from %s...' % input_fname)
             egi_info = _read_header(fid)
             logger.info('    Reading events ...')
             _ = _read_events(fid, egi_info)  # update info + jump
-            logger.info('    Reading data ...')
-            # reads events as well
-            data = _read_data(fid, egi_info).astype(np.float64)
-            if egi_info['value_range'] and egi_info['bits']:
-                mv = egi_info['value_range'] / 2 ** egi_info['bits']
-            else:
-                mv = 1e-6
-            data[:egi_info['n_channels']] = data[:egi_info['n_channels']] * mv
+        # only the event channels are needed to create the trigger channel
+        egi_events = _read_event_channels(input_fname, egi_info)
+        if egi_info['value_range'] and egi_info['bits']:
+            mv = egi_info['value_range'] / 2 ** egi_info['bits']
+        else:
+            mv = 1e-6
 
         logger.info('    Assembling measurement info ...')
 
         event_codes = list(egi_info['event_codes'])
-        egi_events = data[-egi_info['n_events']:]
 
         if include is None:
             exclude_list = ['sync', 'TREV'] if exclude is None else exclude
@@ -232,7 +249,6 @@ class _RawEGI(_BaseRaw):
                                    if i not in include_]))
             new_trigger = _combine_triggers(egi_events[include_],
                                             remapping=event_ids)
-            data = np.concatenate([data, new_trigger])
         except RuntimeError:
             logger.info('    Found multiple events at the same time sample. '
                         'Could not create trigger channel.')
@@ -240,7 +256,11 @@ class _RawEGI(_BaseRaw):
 
         self.event_id = dict(zip([e for e in event_codes if e in
                                   include_names], event_ids))
-        self._data = data
+        self._egi_info = egi_info
+        self._new_trigger = new_trigger
+        # calibration of the EEG channels, event channels are not scaled
+        self._cals = np.ones(egi_info['n_channels'] + egi_info['n_events'])
+        self._cals[:egi_info['n_channels']] = mv
         self.verbose = verbose
         self.info = info = Info(dict((k, None) for k in _other_fields))
         info['sfreq'] = egi_info['samp_rate']
@@ -260,7 +280,7 @@ class _RawEGI(_BaseRaw):
         ch_names.extend(list(egi_info['event_codes']))
         if new_trigger is not None:
             ch_names.append('STI 014')  # our new_trigger
-        info['nchan'] = len(data)
+        info['nchan'] = len(ch_names)
         info['chs'] = []
         info['ch_names'] = ch_names
         info['bads'] = []
@@ -287,16 +307,6 @@ class _RawEGI(_BaseRaw):
                 ch_info.update(u)
             info['chs'].append(ch_info)
 
-        self.preload = True
-        self.first_samp, self.last_samp = 0, self._data.shape[1] - 1
-        self._times = np.arange(self.first_samp, self.last_samp + 1,
-                                dtype=np.float64)
-        self._times /= self.info['sfreq']
-        logger.info('    Range : %d ... %d =  %9.3f ... %9.3f secs'
-                    % (self.first_samp, self.last_samp,
-                       float(self.first_samp) / self.info['sfreq'],
-                       float(self.last_samp) / self.info['sfreq']))
-
         # Raw attributes
         self._filenames = list()
         self._projector = None
@@ -312,6 +322,16 @@ class _RawEGI(_BaseRaw):
         # use information from egi
         self.orig_format = {'>f4': 'single', '>f4': 'double',
                             '>i2': 'int'}[egi_info['dtype']]
+        self._dtype = _check_dtype(None)
+        self.preload = False
+        if preload:
+            self.preload = preload
+            logger.info('    Reading data ...')
+            self._data, self._times = self._read_segment()
+        logger.info('    Range : %d ... %d =  %9.3f ... %9.3f secs'
+                    % (self.first_samp, self.last_samp,
+                       float(self.first_samp) / self.info['sfreq'],
+                       float(self.last_samp) / self.info['sfreq']))
         logger.info('Ready.')
 
     def __repr__(self):
@@ -320,3 +340,68 @@ class _RawEGI(_BaseRaw):
         s = ('%r' % os.path.basename(self.info['filename']),
              "n_channels x n_times : %s x %s" % (n_chan, data_range))
         return "<RawEGI  |  %s>" % ', '.join(s)
+
+    @verbose
+    def _read_segment(self, start=0, stop=None, sel=None, verbose=None,
+                      projector=None):
+        """Read a chunk of raw data
+
+        Parameters
+        ----------
+        start : int, (optional)
+            first sample to include (first is 0). If omitted, defaults to the
+            first sample in data.
+        stop : int, (optional)
+            First sample to not include.
+            If omitted, data is included to the end.
+        sel : array, optional
+            Indices of channels to select.
+        projector : array
+            SSP operator to apply to the data.
+        verbose : bool, str, int, or None
+            If not None, override default verbose level (see mne.verbose).
+
+        Returns
+        -------
+        data : array, shape (n_channels, n_samples)
+           The data.
+        times : array, shape (n_samples,)
+            returns the time values corresponding to the samples.
+        """
+        if stop is None:
+            stop = self.last_samp + 1
+        elif stop > self.last_samp + 1:
+            stop = self.last_samp + 1
+
+        #  Initial checks
+        start = int(start)
+        stop = int(stop)
+        if start >= stop:
+            raise ValueError('No data in this range')
+        sfreq = self.info['sfreq']
+        logger.info('Reading %d ... %d  =  %9.3f ... %9.3f secs...' %
+                    (start, stop - 1, start / float(sfreq),
+                     (stop - 1) / float(sfreq)))
+
+        # the synthetic trigger channel (if present) comes last, the
+        # projection needs all the channels
+        if sel is None or projector is not None:
+            read_sel = np.arange(self.info['nchan'])
+        else:
+            read_sel = np.asarray(sel)
+        n_rows = len(self._cals)
+        is_file = read_sel < n_rows
+        data = np.empty((len(read_sel), stop - start), self._dtype)
+        with open(self.info['filename'], 'rb') as fid:
+            raw_data = _read_data(fid, self._egi_info, start, stop)
+        data[is_file] = raw_data[read_sel[is_file]]
+        data[is_file] *= self._cals[read_sel[is_file]][:, np.newaxis]
+        if not np.all(is_file):
+            data[~is_file] = self._new_trigger[:, start:stop]
+        if projector is not None:
+            data = np.dot(projector, data)
+            if sel is not None:
+                data = data[sel]
+        logger.info('[done]')
+        times = np.arange(start, stop, dtype=float) / sfreq
+        return data, times
@@ -51,6 +51,17 @@ def test_io_egi():
     assert_array_almost_equal(data1, data2)
     assert_array_almost_equal(times1, times2)
 
+    # reading only parts of the data
+    raw3 = read_raw_egi(egi_fname, include=include, preload=False)
+    assert_true(raw.preload and not raw3.preload)
+    assert_array_equal(raw3[:, :][0], raw._data)
+    picks = [0, 100, len(raw.ch_names) - 1]
+    assert_array_equal(raw3[picks, 10:50][0], raw[picks, 10:50][0])
+    projector = np.eye(len(raw.ch_names))[::-1]
+    assert_array_equal(raw3._read_segment(10, 50, picks,
+                                          projector=projector)[0],
+                       raw._data[::-1][picks, 10:50])
+
     eeg_chan = [c for c in raw.ch_names if 'EEG' in c]
     assert_equal(len(eeg_chan), 256)
     picks = pick_types(raw.info, eeg=True)
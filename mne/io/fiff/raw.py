@@ -9,6 +9,7 @@ import copy
 import warnings
 import os
 import os.path as op
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
@@ -16,12 +17,13 @@ from ..constants import FIFF
 from ..open import fiff_open, _fiff_get_fid
 from ..meas_info import read_meas_info
 from ..tree import dir_tree_find
-from ..tag import read_tag
+from ..tag import read_tag, _data_buffer_dtypes
 from ..proj import proj_equal
 from ..compensator import get_current_comp, set_current_comp, make_compensator
 from ..base import _BaseRaw
 
-from ...utils import check_fname, logger, verbose
+from ...utils import check_fname, logger, verbose, _check_dtype
+from ...parallel import check_n_jobs
 from ...externals.six import string_types
 
 
@@ -60,6 +62,21 @@ class RawFIFF(_BaseRaw):
     add_eeg_ref : bool
         If True, add average EEG reference projector (if it's not already
         present).
+    mmap : bool
+        If True, the data buffers are accessed through a read-only memory
+        map of the file instead of being read tag by tag. This makes
+        repeated random access to large files (e.g., epoching without
+        preloading) considerably faster. Only available for uncompressed
+        files.
+    n_jobs : int
+        Number of threads used to preload the data. The files (and disjoint
+        sample ranges within them) are read concurrently into the same
+        buffer, which speeds up preloading of large split recordings on fast
+        storage. Only used if preload is not False.
+    dtype : str | np.dtype | None
+        The floating point type of the data, 'float32' or 'float64'.
+        Using 'float32' halves the memory used by the data. If None, the
+        MNE_DATA_DTYPE config value is used (defaults to 'float64').
     verbose : bool, str, int, or None
         If not None, override default verbose level (see mne.verbose).
 
@@ -79,11 +96,14 @@ class RawFIFF(_BaseRaw):
     @verbose
     def __init__(self, fnames, allow_maxshield=False, preload=False,
                  proj=False, compensation=None, add_eeg_ref=True,
-                 verbose=None):
+                 mmap=False, n_jobs=1, dtype=None, verbose=None):
 
         if not isinstance(fnames, list):
             fnames = [fnames]
         fnames = [op.realpath(f) for f in fnames]
+        if mmap and any(op.splitext(f)[1].lower() == '.gz' for f in fnames):
+            raise ValueError('mmap=True cannot be used with compressed '
+                             '(.gz) files')
         split_fnames = []
 
         raws = []
@@ -126,11 +146,15 @@ class RawFIFF(_BaseRaw):
         self.info = copy.deepcopy(raws[0].info)
         self.verbose = verbose
         self.orig_format = raws[0].orig_format
+        self._mmap = mmap
+        self._dtype = _check_dtype(dtype)
+        self._buffer_index = dict()
+        self._mult_cache = list()
         self.proj = False
         self._add_eeg_ref(add_eeg_ref)
 
         if preload:
-            self._preload_data(preload)
+            self._preload_data(preload, n_jobs)
         else:
             self.preload = False
 
@@ -140,7 +164,7 @@ class RawFIFF(_BaseRaw):
         if proj:
             self.apply_proj()
 
-    def _preload_data(self, preload):
+    def _preload_data(self, preload, n_jobs=1):
         """This function actually preloads the data"""
         if isinstance(preload, string_types):
             # we will use a memmap: preload is a filename
@@ -148,11 +172,48 @@ class RawFIFF(_BaseRaw):
         else:
             data_buffer = None
 
-        self._data, self._times = self._read_segment(data_buffer=data_buffer)
+        n_jobs = check_n_jobs(n_jobs)
+        if n_jobs == 1:
+            self._data, self._times = self._read_segment(
+                data_buffer=data_buffer)
+        else:
+            self._data, self._times = self._read_segment_threaded(
+                data_buffer, n_jobs)
         self.preload = True
         # close files once data are preloaded
         self.close()
 
+    def _read_segment_threaded(self, data_buffer, n_jobs):
+        """Read all data with several threads into a preallocated buffer"""
+        dtype = self._dtype
+        for rawdir in self.rawdirs:
+            if any(r['ent'] is not None and
+                   r['ent'].type in (FIFF.FIFFT_COMPLEX_FLOAT,
+                                     FIFF.FIFFT_COMPLEX_DOUBLE)
+                   for r in rawdir):
+                dtype = np.result_type(self._dtype, np.complex64)
+        data_shape = (self.info['nchan'], self.n_times)
+        data = _allocate_data(None, data_buffer, data_shape, dtype)
+
+        # read each file, split into n_jobs disjoint ranges if needed
+        bounds = np.concatenate([np.cumsum(np.r_[0, self._raw_lengths]),
+                                 np.linspace(0, self.n_times, n_jobs + 1)])
+        bounds = np.unique(bounds.astype(int))
+        logger.info('Reading %d segments using %d threads...'
+                    % (len(bounds) - 1, n_jobs))
+
+        def _read_one(start_stop):
+            start, stop = start_stop
+            self._read_segment(start, stop, data_buffer=data[:, start:stop])
+
+        pool = ThreadPool(n_jobs)
+        try:
+            pool.map(_read_one, zip(bounds[:-1], bounds[1:]))
+        finally:
+            pool.close()
+        times = np.arange(self.n_times) / self.info['sfreq']
+        return data, times
+
     @verbose
     def _read_raw_file(self, fname, allow_maxshield, preload, compensation,
                        do_check_fname=True, verbose=None):
@@ -358,6 +419,63 @@ class RawFIFF(_BaseRaw):
 
         return raw, next_fname
 
+    def _get_buffer_index(self, fi):
+        """Get the first and last samples of the buffers of file fi
+
+        The arrays are cached so that the buffers needed for a read can be
+        located with np.searchsorted instead of scanning the whole rawdir.
+        """
+        rawdir = self.rawdirs[fi]
+        index = self._buffer_index.get(fi)
+        if index is None or index[0] is not rawdir:  # e.g., after crop
+            firsts = np.array([r['first'] for r in rawdir], dtype=np.int64)
+            lasts = np.array([r['last'] for r in rawdir], dtype=np.int64)
+            index = (rawdir, firsts, lasts)
+            self._buffer_index[fi] = index
+        return index[1:]
+
+    def _get_mult(self, sel, projector):
+        """Get the combined calibration, compensation and SSP operator
+
+        The last few operators are memoized by (sel, projector, comp). None
+        is returned if only the calibration factors have to be applied.
+        The operator is restricted to the channels (columns) it uses, which
+        are returned as well so that only those have to be decoded.
+        """
+        if self.comp is None and projector is None:
+            return None, None
+        # tag the key by type so that e.g. slice(0, 2) and [0, 2] differ
+        if sel is None:
+            key = None
+        elif isinstance(sel, slice):
+            key = ('slice', sel.start, sel.stop, sel.step)
+        else:
+            idx = np.asarray(sel)
+            if idx.dtype == bool:
+                idx = np.where(idx)[0]
+            key = ('index', tuple(int(ii) for ii in idx.ravel()))
+        for this_key, this_proj, this_comp, mult, cols in self._mult_cache:
+            if (this_key == key and this_proj is projector and
+                    this_comp is self.comp):
+                return mult, cols
+        cals = self.cals.ravel()
+        if self.comp is not None:
+            mult = self.comp * cals[np.newaxis, :]
+        else:
+            mult = np.diag(cals)
+        if projector is not None:
+            mult = np.dot(projector, mult)
+        if sel is not None:
+            mult = mult[sel]
+        cols = np.where(np.any(mult != 0, axis=0))[0]
+        if len(cols) == mult.shape[1]:
+            cols = slice(None)
+        else:
+            mult = mult[:, cols]
+        self._mult_cache = ([(key, projector, self.comp, mult, cols)] +
+                            self._mult_cache[:3])
+        return mult, cols
+
     def _read_segment(self, start=0, stop=None, sel=None, data_buffer=None,
                       verbose=None, projector=None):
         """Read a chunk of raw data
@@ -415,14 +533,7 @@ class RawFIFF(_BaseRaw):
         else:
             data = None  # we will allocate it later, once we know the type
 
-        mult = list()
-        for ri in range(len(self._raw_lengths)):
-            mult.append(np.diag(self.cals.ravel()))
-            if self.comp is not None:
-                mult[ri] = np.dot(self.comp, mult[ri])
-            if projector is not None:
-                mult[ri] = np.dot(projector, mult[ri])
-            mult[ri] = mult[ri][idx]
+        mult, cols = self._get_mult(sel, projector)
 
         # deal with having multiple files accessed by the raw object
         cumul_lens = np.concatenate(([0], np.array(self._raw_lengths,
@@ -435,10 +546,6 @@ class RawFIFF(_BaseRaw):
         first_file_used = False
         s_off = 0
         dest = 0
-        if isinstance(idx, slice):
-            cals = self.cals.ravel()[idx][:, np.newaxis]
-        else:
-            cals = self.cals.ravel()[:, np.newaxis]
 
         for fi in np.nonzero(files_used)[0]:
             start_loc = self._first_samps[fi]
@@ -455,97 +562,121 @@ class RawFIFF(_BaseRaw):
             if stop_loc < start_loc:
                 raise ValueError('Bad array indexing, could be a bug')
             len_loc = stop_loc - start_loc + 1
-            fid = _fiff_get_fid(self._filenames[fi])
-
-            for this in self.rawdirs[fi]:
-
-                #  Do we need this buffer
-                if this['last'] >= start_loc:
-                    #  The picking logic is a bit complicated
-                    if stop_loc > this['last'] and start_loc < this['first']:
-                        #    We need the whole buffer
-                        first_pick = 0
-                        last_pick = this['nsamp']
-                        logger.debug('W')
-
-                    elif start_loc >= this['first']:
-                        first_pick = start_loc - this['first']
-                        if stop_loc <= this['last']:
-                            #   Something from the middle
-                            last_pick = this['nsamp'] + stop_loc - this['last']
-                            logger.debug('M')
+            if self._mmap:
+                fid = np.memmap(self._filenames[fi], dtype=np.uint8, mode='r')
+                views = list()
+            else:
+                fid = _fiff_get_fid(self._filenames[fi])
+
+            # only visit the buffers overlapping [start_loc, stop_loc]
+            firsts, lasts = self._get_buffer_index(fi)
+            b_start = np.searchsorted(lasts, start_loc)
+            b_stop = np.searchsorted(firsts, stop_loc, side='right')
+            for this in self.rawdirs[fi][b_start:b_stop]:
+                first_pick = max(start_loc - this['first'], 0)
+                last_pick = min(stop_loc - this['first'] + 1,
+                                this['nsamp'])
+
+                #   Now we are ready to pick
+                picksamp = last_pick - first_pick
+                if picksamp > 0:
+                    # only read data if it exists
+                    if this['ent'] is not None:
+                        if self._mmap:
+                            # keep a view, calibration is done per file
+                            one = _mmap_data_buffer(fid, this['ent'], nchan)
+                            one = one[first_pick:last_pick]
                         else:
-                            #   From the middle to the end
-                            last_pick = this['nsamp']
-                            logger.debug('E')
-                    else:
-                        #    From the beginning to the middle
-                        first_pick = 0
-                        last_pick = stop_loc - this['first'] + 1
-                        logger.debug('B')
-
-                    #   Now we are ready to pick
-                    picksamp = last_pick - first_pick
-                    if picksamp > 0:
-                        # only read data if it exists
-                        if this['ent'] is not None:
-                            one = read_tag(fid, this['ent'].pos,
-                                           shape=(this['nsamp'], nchan),
-                                           rlims=(first_pick, last_pick)).data
-                            if np.isrealobj(one):
-                                dtype = np.float
-                            else:
-                                dtype = np.complex128
-                            one.shape = (picksamp, nchan)
-                            one = one.T.astype(dtype)
-                            # use proj + cal factors in mult
-                            if mult is not None:
-                                one[idx] = np.dot(mult[fi], one)
-                            else:  # apply just the calibration factors
-                                # this logic is designed to limit memory copies
-                                if isinstance(idx, slice):
-                                    # This is a view operation, so it's fast
-                                    one[idx] *= cals
-                                else:
-                                    # Extra operations are actually faster here
-                                    # than creating a new array
-                                    # (fancy indexing)
-                                    one *= cals
-
-                            # if not already done, allocate array with
-                            # right type
-                            data = _allocate_data(data, data_buffer,
-                                                  data_shape, dtype)
-                            if isinstance(idx, slice):
-                                # faster to slice in data than doing
-                                # one = one[idx] sooner
-                                data[:, dest:(dest + picksamp)] = one[idx]
-                            else:
-                                # faster than doing one = one[idx]
-                                data_view = data[:, dest:(dest + picksamp)]
-                                for ii, ix in enumerate(idx):
-                                    data_view[ii] = one[ix]
-                        dest += picksamp
-
-                #   Done?
-                if this['last'] >= stop_loc:
-                    # if not already done, allocate array with float dtype
-                    data = _allocate_data(data, data_buffer, data_shape,
-                                          np.float)
-                    break
-
-            fid.close()  # clean it up
+                            one = _read_data_buffer(fid, this['ent'],
+                                                    this['nsamp'], nchan,
+                                                    first_pick, last_pick)
+                        if np.isrealobj(one):
+                            dtype = self._dtype
+                        else:
+                            dtype = np.result_type(self._dtype,
+                                                   np.complex64)
+                        data = _allocate_data(data, data_buffer,
+                                              data_shape, dtype)
+                        if self._mmap:
+                            views.append((dest, one))
+                        else:
+                            # only the needed channels are decoded
+                            _calibrate_views(data, [(dest, one)], idx,
+                                             self.cals, mult, cols)
+                    dest += picksamp
+
+            if self._mmap:
+                _calibrate_views(data, views, idx, self.cals, mult, cols)
+                del views, fid  # unmap the file
+            else:
+                fid.close()  # clean it up
             s_off += len_loc
             # double-check our math
             if not s_off == dest:
                 raise ValueError('Incorrect file reading')
 
+        # if not already done (only skips were read), allocate float array
+        data = _allocate_data(data, data_buffer, data_shape, self._dtype)
         logger.info('[done]')
         times = np.arange(start, stop) / self.info['sfreq']
 
         return data, times
 
 
+def _mmap_data_buffer(mm, ent, nchan):
+    """Get a (n_samples, n_channels) view of a data buffer in a memmap"""
+    dtype = np.dtype(_data_buffer_dtypes[ent.type])
+    nsamp = ent.size // (dtype.itemsize * nchan)
+    # the tag data start right after the 16-byte tag header
+    return np.ndarray((nsamp, nchan), dtype=dtype, buffer=mm,
+                      offset=ent.pos + 16)
+
+
+def _read_data_buffer(fid, ent, nsamp, nchan, first_pick, last_pick):
+    """Read rows of a data buffer without decoding them
+
+    The returned (n_samples, n_channels) array keeps the on-disk dtype, so
+    that only the channels that are used later have to be converted.
+    """
+    if ent.type not in _data_buffer_dtypes:
+        one = read_tag(fid, ent.pos, shape=(nsamp, nchan),
+                       rlims=(first_pick, last_pick)).data
+        return one.reshape(last_pick - first_pick, nchan)
+    dtype = np.dtype(_data_buffer_dtypes[ent.type])
+    row_size = dtype.itemsize * nchan
+    # skip the 16-byte tag header and the rows before first_pick
+    fid.seek(ent.pos + 16 + first_pick * row_size, 0)
+    n_bytes = (last_pick - first_pick) * row_size
+    one = np.frombuffer(fid.read(n_bytes), dtype=dtype)
+    return one.reshape(last_pick - first_pick, nchan)
+
+
+def _calibrate_views(data, views, idx, cals, mult, cols):
+    """Copy undecoded buffer views of one file into data and calibrate
+
+    Only the channels in idx (or cols when an operator is used) are
+    decoded. The calibration (and compensation / projection in mult) is
+    applied in a single vectorized operation for all views.
+    """
+    if len(views) == 0:
+        return
+    d0 = views[0][0]
+    d1 = views[-1][0] + len(views[-1][1])
+    if mult is None:
+        # copy only the selected channels, then scale them in place
+        for dest, one in views:
+            data[:, dest:dest + len(one)] = one[:, idx].T
+        data[:, d0:d1] *= cals.ravel()[idx][:, np.newaxis]
+    elif len(views) == 1:
+        data[:, d0:d1] = np.dot(mult, views[0][1][:, cols].T)
+    else:
+        # gather the file span, then apply all operators at once
+        block = np.zeros((d1 - d0, mult.shape[1]), dtype=data.dtype)
+        for dest, one in views:
+            block[dest - d0:dest - d0 + len(one)] = one[:, cols]
+        data[:, d0:d1] = np.dot(mult, block.T)
+
+
 def _allocate_data(data, data_buffer, data_shape, dtype):
     if data is None:
         # if not already done, allocate array with right type
@@ -19,7 +19,7 @@ from nose.tools import (assert_true, assert_raises, assert_equal,
 
 from mne import pick_types, pick_channels
 from mne.io.constants import FIFF
-from mne.io import (Raw, concatenate_raws,
+from mne.io import (Raw, concatenate_raws, ConcatenatedRaw,
                     get_chpi_positions, set_eeg_reference)
 from mne import concatenate_events, find_events, equalize_channels
 from mne.utils import (_TempDir, requires_nitime, requires_pandas,
@@ -274,6 +274,65 @@ def test_multiple_files():
     assert_true(len(raw) == raw.last_samp - raw.first_samp + 1)
 
 
+def test_concatenated_raw():
+    """Test virtual concatenation of raw files
+    """
+    raw = Raw(fif_fname).crop(0, 2, copy=False)
+    raw_pre = Raw(fif_fname, preload=True).crop(1, 3, copy=False)
+    raw_combo = concatenate_raws([raw.copy(), raw_pre.copy()], preload=True)
+    data_combo = raw_combo._data
+    n_times = raw.n_times + raw_pre.n_times
+
+    raw_virt = ConcatenatedRaw([raw, raw_pre])
+    assert_true(raw_virt.preload is False)
+    assert_equal(raw_virt.n_times, n_times)
+    assert_equal(raw_virt.first_samp, raw.first_samp)
+    assert_array_equal(raw_virt._first_samps,
+                       [raw.first_samp, raw_pre.first_samp])
+    # the instances are not modified
+    assert_equal(raw.n_times + raw_pre.n_times, n_times)
+    assert_true(raw_pre.preload)
+    data, times = raw_virt[:, :]
+    assert_array_equal(data, data_combo)
+    assert_array_equal(times, raw_combo._times)
+    # reads across the boundary and of a subset of channels
+    picks = [0, 5, 310]
+    start, stop = raw.n_times - 10, raw.n_times + 10
+    assert_array_equal(raw_virt[picks, start:stop][0],
+                       data_combo[picks, start:stop])
+    assert_array_equal(raw_virt[picks, stop:stop + 5][0],
+                       data_combo[picks, stop:stop + 5])
+
+    # crop, preload and append
+    raw_crop = raw_virt.crop(1, 2.5)
+    start, stop = raw_virt.time_as_index([1, 2.5])
+    assert_array_equal(raw_crop[:, :][0], data_combo[:, start:stop + 1])
+    for preload in (True, op.join(tempdir, 'virt_memmap.dat')):
+        raw_virt_pre = ConcatenatedRaw([raw, raw_pre], preload=preload)
+        assert_array_equal(raw_virt_pre._data, data_combo)
+    raw_virt.append(raw)
+    assert_equal(raw_virt.n_times, n_times + raw.n_times)
+    assert_array_equal(raw_virt[:, n_times:][0], raw[:, :][0])
+
+    # projection
+    raw_proj = Raw(fif_fname, proj=True).crop(0, 2, copy=False)
+    raw_virt = ConcatenatedRaw([raw, raw]).apply_proj()
+    assert_allclose(raw_virt[:, :raw.n_times][0], raw_proj[:, :][0],
+                    rtol=1e-6, atol=1e-20)
+    assert_allclose(raw_virt[picks, raw.n_times:][0],
+                    raw_proj[picks, :][0], rtol=1e-6, atol=1e-20)
+
+    # saving
+    fname = op.join(tempdir, 'virt_raw.fif')
+    ConcatenatedRaw([raw, raw_pre]).save(fname)
+    assert_array_almost_equal(Raw(fname)[:, :][0], data_combo)
+
+    raw_bad = Raw(fif_fname)
+    raw_bad.add_proj([], remove_existing=True)
+    assert_raises(ValueError, ConcatenatedRaw, [raw, raw_bad])
+    assert_raises(ValueError, ConcatenatedRaw, [])
+
+
 def test_split_files():
     """Test writing and reading of split raw files
     """
@@ -287,6 +346,31 @@ def test_split_files():
     assert_array_equal(data_1, data_2)
     assert_array_equal(times_1, times_2)
 
+    # threaded preloading
+    for preload in (True, op.join(tempdir, 'split_memmap.dat')):
+        raw_2 = Raw(split_fname, preload=preload, n_jobs=3)
+        assert_array_equal(raw_2._data, data_1)
+        assert_array_equal(raw_2._times, times_1)
+
+    # pipelined writing must produce the same split files
+    pipe_fname = op.join(tempdir, 'split_pipe_raw.fif')
+    raw_1.save(pipe_fname, buffer_size_sec=1.0, split_size='10MB',
+               pipeline=True)
+    pipe_fnames = sorted(glob.glob(op.join(tempdir, 'split_pipe_raw*.fif')))
+    split_fnames = sorted(glob.glob(op.join(tempdir, 'split_raw*.fif')))
+    assert_equal(len(pipe_fnames), len(split_fnames))
+    assert_true(len(pipe_fnames) > 1)
+    # the parts store different file names, compare their contents
+    for fname_1, fname_2 in zip(split_fnames, pipe_fnames):
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            raw_part_1, raw_part_2 = Raw(fname_1), Raw(fname_2)
+        assert_equal(raw_part_1.first_samp, raw_part_2.first_samp)
+        assert_equal(raw_part_1.last_samp, raw_part_2.last_samp)
+        assert_array_equal(raw_part_1[:, :][0], raw_part_2[:, :][0])
+    raw_2 = Raw(pipe_fname)
+    assert_array_equal(raw_2[:, :][0], data_1)
+
     # test the case where the silly user specifies the split files
     fnames = [split_fname]
     fnames.extend(sorted(glob.glob(op.join(tempdir, 'split_raw-*.fif'))))
@@ -504,6 +588,147 @@ def test_getitem():
         assert_array_equal(times, times1)
 
 
+def test_mmap():
+    """Test reading of Raw data through a memory map
+    """
+    for proj, compensation, fname in [(False, None, fif_fname),
+                                      (True, None, fif_fname),
+                                      (False, 1, ctf_comp_fname)]:
+        raw = Raw(fname, proj=proj, compensation=compensation)
+        raw_mm = Raw(fname, proj=proj, compensation=compensation, mmap=True)
+        for sel in [slice(None), [0, 2, 5], slice(3, 10)]:
+            for start, stop in [(0, None), (10, 200), (5, 6)]:
+                data, times = raw[sel, start:stop]
+                data_mm, times_mm = raw_mm[sel, start:stop]
+                assert_allclose(data, data_mm, rtol=1e-12, atol=0)
+                assert_array_equal(times, times_mm)
+        raw = Raw(fname, proj=proj, compensation=compensation, preload=True)
+        raw_mm = Raw(fname, proj=proj, compensation=compensation,
+                     preload=True, mmap=True)
+        assert_allclose(raw._data, raw_mm._data, rtol=1e-12, atol=0)
+
+    # skips (buffers without data) are read as zeros, also with operators
+    for proj in (False, True):
+        raw = Raw(fif_fname, proj=proj)
+        raw_mm = Raw(fif_fname, proj=proj, mmap=True)
+        for r in (raw, raw_mm):
+            r.rawdirs[0][2] = dict(r.rawdirs[0][2], ent=None)
+        skip = raw.rawdirs[0][2]
+        skip = slice(skip['first'] - raw.first_samp,
+                     skip['last'] - raw.first_samp + 1)
+        for sel in [slice(None), [0, 2, 5]]:
+            data, _ = raw[sel, :]
+            data_mm, _ = raw_mm[sel, :]
+            assert_array_equal(data[:, skip], 0.)
+            assert_array_equal(data_mm[:, skip], 0.)
+            assert_allclose(data, data_mm, rtol=1e-12, atol=0)
+
+    # split files
+    raw = Raw(fif_fname, preload=True)
+    split_fname = op.join(tempdir, 'split_mmap_raw.fif')
+    raw.save(split_fname, buffer_size_sec=1.0, split_size='10MB')
+    raw = Raw(split_fname)
+    raw_mm = Raw(split_fname, mmap=True)
+    assert_allclose(raw[:, :][0], raw_mm[:, :][0], rtol=1e-12, atol=0)
+    assert_raises(ValueError, Raw, fif_gz_fname, mmap=True)
+
+
+def test_dtype():
+    """Test reading Raw data in single precision
+    """
+    raw = Raw(ctf_comp_fname, compensation=1)
+    data = raw[:, :][0]
+    for preload, mmap, n_jobs in [(False, False, 1), (False, True, 1),
+                                  (True, False, 1), (True, True, 2)]:
+        raw_32 = Raw(ctf_comp_fname, compensation=1, preload=preload,
+                     mmap=mmap, n_jobs=n_jobs, dtype='float32')
+        data_32 = raw_32[:, :][0]
+        assert_equal(data_32.dtype, np.float32)
+        assert_allclose(data_32, data, rtol=1e-6, atol=0)
+        assert_equal(raw_32[[2, 5], 10:20][0].dtype, np.float32)
+
+    # processing keeps the data type
+    raw_32.filter(None, 40., n_jobs=1)
+    raw_32.resample(600., n_jobs=2)
+    assert_equal(raw_32._data.dtype, np.float32)
+    assert_raises(ValueError, Raw, ctf_comp_fname, dtype=np.int16)
+
+    # the default data type can be changed globally
+    old_value = os.environ.get('MNE_DATA_DTYPE')
+    try:
+        os.environ['MNE_DATA_DTYPE'] = 'float32'
+        assert_equal(Raw(ctf_comp_fname)[:, :][0].dtype, np.float32)
+        assert_equal(Raw(ctf_comp_fname, dtype='float64')[:, :][0].dtype,
+                     np.float64)
+    finally:
+        if old_value is None:
+            os.environ.pop('MNE_DATA_DTYPE', None)
+        else:
+            os.environ['MNE_DATA_DTYPE'] = old_value
+
+
+def test_read_plan():
+    """Test buffer lookup and operator memoization of non-preloaded Raw
+    """
+    raw = Raw(fif_fname)
+    raw_pre = Raw(fif_fname, preload=True)
+    for start, stop in [(0, 1), (100, 5000), (raw.n_times - 3, None)]:
+        assert_allclose(raw[:, start:stop][0], raw_pre[:, start:stop][0])
+    # the buffer index has to follow crop and append
+    raw.crop(1, 5, copy=False)
+    raw_pre.crop(1, 5, copy=False)
+    raw.append(Raw(fif_fname))
+    raw_pre.append(Raw(fif_fname, preload=True))
+    assert_allclose(raw[:, :][0], raw_pre[:, :][0])
+    # the operators are only computed once for the same picks
+    raw.apply_proj()
+    data = raw[:5, 100:200][0]
+    mult = raw._mult_cache[0][3]
+    assert_array_equal(raw[:5, 100:200][0], data)
+    assert_equal(len(raw._mult_cache), 1)
+    assert_true(raw._mult_cache[0][3] is mult)
+    raw[[1, 3], 100:200]
+    assert_equal(len(raw._mult_cache), 2)
+    # only the channels used by the operator are decoded
+    pick = pick_types(raw.info, meg=False, stim=True)[:1]
+    assert_allclose(raw[pick, 100:200][0], raw_pre[pick, 100:200][0])
+    assert_array_equal(raw._mult_cache[0][4], pick)
+    # a list and a slice with the same values must not share operators
+    for kwargs in (dict(fnames=ctf_comp_fname, compensation=1),
+                   dict(fnames=fif_fname, proj=True)):
+        for sels in (([0, 2], slice(0, 2)), (slice(0, 2), [0, 2])):
+            raw = Raw(**kwargs)
+            for sel in sels:
+                assert_array_equal(raw[sel, 0:50][0],
+                                   Raw(**kwargs)[sel, 0:50][0])
+
+
+def test_iter_chunks():
+    """Test iterating over chunks of Raw data with read-ahead
+    """
+    raw = Raw(fif_fname)
+    data, times = raw[:, :]
+    picks = pick_types(raw.info, meg='mag')
+    for preload in (False, True):
+        raw = Raw(fif_fname, preload=preload)
+        chunks = list(raw.iter_chunks(2., overlap=0.5, picks=picks))
+        step = int(round(1.5 * raw.info['sfreq']))
+        for ii, (chunk, chunk_times) in enumerate(chunks):
+            sl = slice(ii * step, ii * step + chunk.shape[1])
+            assert_array_equal(chunk, data[picks, sl])
+            assert_array_equal(chunk_times, times[sl])
+        assert_equal(sl.stop, raw.n_times)
+    # the same data must come out without prefetching and with a range
+    chunks = list(raw.iter_chunks(1., tmin=1., tmax=3., prefetch=False))
+    assert_array_equal(np.concatenate([c[0] for c in chunks], axis=1),
+                       data[:, raw.time_as_index(1.)[0]:
+                            raw.time_as_index(3.)[0] + 1])
+    # invalid arguments raise on call, not on the first iteration
+    assert_raises(ValueError, raw.iter_chunks, 1., overlap=1.)
+    assert_raises(ValueError, raw.iter_chunks, 0.)
+    assert_raises(ValueError, raw.iter_chunks, 1., tmin=3., tmax=1.)
+
+
 def test_proj():
     """Test SSP proj operations
     """
@@ -0,0 +1,5 @@
+"""Module for storing raw data in chunked HDF5 files"""
+
+# License: BSD (3-clause)
+
+from .hdf5 import RawHDF5, read_raw_hdf5, write_raw_hdf5
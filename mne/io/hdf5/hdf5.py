@@ -0,0 +1,326 @@
+"""Chunked and compressed HDF5 storage of continuous data"""
+
+# License: BSD (3-clause)
+
+import copy
+import os.path as op
+from io import BytesIO
+from math import floor
+
+import numpy as np
+
+from ..base import _BaseRaw, _allocate_data, _start_writing_raw
+from ..constants import FIFF
+from ..meas_info import read_meas_info
+from ..open import fiff_open
+from ..proj import setup_proj, activate_proj
+from ..write import end_block
+from ..._hdf5 import _open_hdf5, _create_chunked_array
+from ...utils import (_check_fname, check_fname, logger, verbose,
+                      _check_dtype)
+
+# bump this if the layout of the files changes
+_RAW_HDF5_VERSION = 1
+
+
+class RawHDF5(_BaseRaw):
+    """Raw object from a chunked HDF5 file
+
+    Parameters
+    ----------
+    fname : str
+        The name of the file, as written by ``write_raw_hdf5``. It should
+        end with raw.h5.
+    preload : bool or str (default False)
+        Preload data into memory for data manipulation and faster indexing.
+        If True, the data will be preloaded into memory (fast, requires
+        large amount of memory). If preload is a string, preload is the
+        file name of a memory-mapped file which is used to store the data
+        on the hard drive (slower, requires less memory). If False, only
+        the chunks needed by each indexing operation are read from disk.
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
+
+    See Also
+    --------
+    mne.io.Raw : Documentation of attribute and methods.
+    """
+    @verbose
+    def __init__(self, fname, preload=False, verbose=None):
+        check_fname(fname, 'raw', ('raw.h5',))
+        fname = op.realpath(fname)
+        logger.info('Opening raw data file %s...' % fname)
+        with _open_hdf5(fname, mode='r') as fid:
+            attrs = fid.root._v_attrs
+            if getattr(attrs, 'mne_raw_version', None) is None:
+                raise ValueError('no mne-python raw data found in %s' % fname)
+            if attrs.mne_raw_version > _RAW_HDF5_VERSION:
+                raise ValueError('file %s was written by a newer version of '
+                                 'mne-python' % fname)
+            first_samp = int(attrs.first_samp)
+            info_bytes = fid.root.info.read().tostring()
+            n_chan, n_times = fid.root.data.shape
+            chunkshape = fid.root.data.chunkshape
+
+        ff, tree, _ = fiff_open(BytesIO(info_bytes))
+        with ff as fid:
+            info = read_meas_info(fid, tree)[0]
+        info['filename'] = fname
+        if info['nchan'] != n_chan:
+            raise RuntimeError('number of channels in the measurement info '
+                               'and data do not match')
+        logger.info('    Chunks of %d channels x %d samples'
+                    % tuple(chunkshape))
+
+        cals = np.zeros(info['nchan'])
+        for k in range(info['nchan']):
+            cals[k] = info['chs'][k]['range'] * info['chs'][k]['cal']
+
+        self.verbose = verbose
+        self.info = info
+        self.cals = cals
+        self.rawdir = None
+        self.comp = None
+        self.proj = False
+        self._projector = None
+        self._filenames = [fname]
+        self.first_samp = first_samp
+        self.last_samp = first_samp + n_times - 1
+        self._first_samps = np.array([self.first_samp])
+        self._last_samps = np.array([self.last_samp])
+        self._raw_lengths = np.array([n_times])
+        self.preload = False
+        self._dtype = _check_dtype(None)
+        if preload:
+            self._data, self._times = self._read_segment(data_buffer=preload)
+            self.preload = True
+        logger.info('    Range : %d ... %d =  %9.3f ... %9.3f secs'
+                    % (self.first_samp, self.last_samp,
+                       float(self.first_samp) / info['sfreq'],
+                       float(self.last_samp) / info['sfreq']))
+        logger.info('Ready.')
+
+    def __repr__(self):
+        s = ('%r' % op.basename(self._filenames[0]),
+             "n_channels x n_times : %s x %s" % (self.info['nchan'],
+                                                 self.n_times))
+        return "<RawHDF5  |  %s>" % ', '.join(s)
+
+    @verbose
+    def _read_segment(self, start=0, stop=None, sel=None, data_buffer=None,
+                      verbose=None, projector=None):
+        """Read a chunk of raw data
+
+        Parameters
+        ----------
+        start : int, (optional)
+            first sample to include (first is 0). If omitted, defaults to the
+            first sample in data.
+        stop : int, (optional)
+            First sample to not include.
+            If omitted, data is included to the end.
+        sel : array, optional
+            Indices of channels to select.
+        data_buffer : array or str, optional
+            numpy array to fill with data read, must have the correct shape.
+            If str, a np.memmap with the correct data type will be used
+            to store the data.
+        verbose : bool, str, int, or None
+            If not None, override default verbose level (see mne.verbose).
+        projector : array
+            SSP operator to apply to the data.
+
+        Returns
+        -------
+        data : array, [channels x samples]
+           the data matrix (channels x samples).
+        times : array, [samples]
+            returns the time values corresponding to the samples.
+        """
+        start = int(start)
+        stop = self.n_times if stop is None else min([int(stop), self.n_times])
+        if start >= stop:
+            raise ValueError('No data in this range')
+
+        logger.info('Reading %d ... %d  =  %9.3f ... %9.3f secs...' %
+                    (start, stop - 1, start / float(self.info['sfreq']),
+                     (stop - 1) / float(self.info['sfreq'])))
+
+        # only read the rows (and thus chunks) that are needed
+        rows, idx = slice(None), slice(None)
+        if sel is not None:
+            sel = np.atleast_1d(sel)
+            idx = sel
+            if projector is None:
+                rows = slice(sel.min(), sel.max() + 1)
+                idx = sel - sel.min()
+        with _open_hdf5(self._filenames[0], mode='r') as fid:
+            data = fid.root.data[rows, start:stop]
+        if projector is not None:
+            data = np.dot(projector, data)
+        data = data[idx]
+
+        if isinstance(data_buffer, np.ndarray):
+            if data_buffer.shape != data.shape:
+                raise ValueError('data_buffer has incorrect shape')
+            out = data_buffer
+        else:
+            dtype = self._dtype
+            if np.iscomplexobj(data):
+                dtype = np.result_type(dtype, np.complex64)
+            out = _allocate_data(None, data_buffer, data.shape, dtype)
+        out[...] = data
+        data = out
+        logger.info('[done]')
+        times = np.arange(start, stop) / self.info['sfreq']
+        return data, times
+
+
+@verbose
+def read_raw_hdf5(fname, preload=False, verbose=None):
+    """Reader function for raw data stored in chunked HDF5 files
+
+    Parameters
+    ----------
+    fname : str
+        The name of the file, as written by ``write_raw_hdf5``. It should
+        end with raw.h5.
+    preload : bool or str (default False)
+        Preload data into memory for data manipulation and faster indexing.
+        If True, the data will be preloaded into memory (fast, requires
+        large amount of memory). If preload is a string, preload is the
+        file name of a memory-mapped file which is used to store the data
+        on the hard drive (slower, requires less memory). If False, only
+        the chunks needed by each indexing operation are read from disk.
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
+
+    Returns
+    -------
+    raw : instance of RawHDF5
+        A Raw object containing the data.
+
+    See Also
+    --------
+    mne.io.Raw : Documentation of attribute and methods.
+    """
+    return RawHDF5(fname, preload=preload, verbose=verbose)
+
+
+@verbose
+def write_raw_hdf5(fname, raw, picks=None, tmin=0, tmax=None, proj=False,
+                   format='single', chunk_duration=1., chunk_channels=32,
+                   compression=4, overwrite=False, verbose=None):
+    """Write raw data to a chunked, compressed HDF5 file
+
+    The data are stored in a single array split into blocks of channels x
+    time samples. Each block is compressed separately, so that reading a
+    short time range (or a few channels) only needs to decompress the
+    blocks it overlaps. The measurement info is stored in FIF format
+    alongside the data. Reading the files requires Pytables.
+
+    Parameters
+    ----------
+    fname : str
+        File name of the new dataset. It should end with raw.h5.
+    raw : instance of Raw
+        The raw data to write.
+    picks : array-like of int | None
+        Indices of channels to include. If None all channels are kept.
+    tmin : float | None
+        Time in seconds of first sample to save. If None first sample
+        is used.
+    tmax : float | None
+        Time in seconds of last sample to save. If None last sample
+        is used.
+    proj : bool
+        If True the data is saved with the projections applied (active).
+    format : str
+        Format to use to save the data. Valid options are 'single' and
+        'double' for 32- or 64-bit floats. Complex data are stored as
+        64- or 128-bit complex numbers, respectively.
+    chunk_duration : float
+        Duration of the chunks in seconds.
+    chunk_channels : int | None
+        Number of channels in each chunk. Smaller values make reading a few
+        channels faster. If None, each chunk holds all channels.
+    compression : int
+        The zlib compression level between 0 (no compression) and 9.
+    overwrite : bool
+        If True, the destination file (if it exists) will be overwritten.
+        If False (default), an error will be raised if the file exists.
+    verbose : bool, str, int, or None
+        If not None, override default verbose level (see mne.verbose).
+
+    Notes
+    -----
+    The data are stored in the current CTF compensation grade, with
+    calibrations applied (i.e., in SI units).
+    """
+    check_fname(fname, 'raw', ('raw.h5',))
+    _check_fname(fname, overwrite)
+    fname = op.realpath(fname)
+    if not raw.preload and fname in raw._filenames:
+        raise ValueError('You cannot save data to the same file.'
+                         ' Please use a different filename.')
+    type_dict = dict(single=FIFF.FIFFT_FLOAT, double=FIFF.FIFFT_DOUBLE)
+    if format not in type_dict:
+        raise ValueError('format must be "single" or "double"')
+    if not 0 <= compression <= 9:
+        raise ValueError('compression must be between 0 and 9')
+
+    info = raw.info
+    projector = None
+    if proj:
+        info = copy.deepcopy(info)
+        projector, info = setup_proj(info)
+        activate_proj(info['projs'], copy=False)
+    if picks is None:
+        picks = np.arange(info['nchan'])
+    picks = np.atleast_1d(picks)
+
+    start = 0 if tmin is None else int(floor(tmin * info['sfreq']))
+    stop = raw.n_times
+    if tmax is not None:
+        stop = min(int(floor(tmax * info['sfreq'])) + 1, stop)
+    if start >= stop:
+        raise ValueError('No data in this range')
+
+    # the FIF measurement info of an empty raw file
+    ff = BytesIO()
+    _start_writing_raw(ff, info, picks, type_dict[format], reset_range=True)
+    end_block(ff, FIFF.FIFFB_RAW_DATA)
+    end_block(ff, FIFF.FIFFB_MEAS)
+    info_bytes = np.fromstring(ff.getvalue(), np.uint8)
+    ff.close()
+
+    dtype = np.float32 if format == 'single' else np.float64
+    if np.iscomplexobj(raw[0, 0][0]):
+        dtype = np.complex64 if format == 'single' else np.complex128
+    n_chan = len(picks)
+    chunk_size = max(int(round(chunk_duration * info['sfreq'])), 1)
+    chunk_size = min(chunk_size, stop - start)
+    if chunk_channels is None:
+        chunk_channels = n_chan
+    chunkshape = (min(int(chunk_channels), n_chan), chunk_size)
+    # write several chunks at once to keep the number of reads low
+    buffer_size = chunk_size * max(int(10 * info['sfreq']) // chunk_size, 1)
+
+    logger.info('Writing %s' % fname)
+    with _open_hdf5(fname, mode='w') as fid:
+        attrs = fid.root._v_attrs
+        attrs.mne_raw_version = _RAW_HDF5_VERSION
+        attrs.first_samp = raw.first_samp + start
+        info_node = _create_chunked_array(fid, 'info', info_bytes.shape,
+                                          np.uint8, info_bytes.shape, 0)
+        info_node[:] = info_bytes
+        data_node = _create_chunked_array(fid, 'data', (n_chan, stop - start),
+                                          dtype, chunkshape, compression)
+        for first in range(start, stop, buffer_size):
+            last = min(first + buffer_size, stop)
+            if projector is not None:
+                data = np.dot(projector, raw[:, first:last][0])[picks]
+            else:
+                data = raw[picks, first:last][0]
+            data_node[:, first - start:last - start] = data
+    logger.info('Closing %s [done]' % fname)
@@ -0,0 +1,62 @@
+import os.path as op
+
+from nose.tools import assert_equal, assert_raises, assert_true
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+
+from mne.io import Raw, read_raw_hdf5, write_raw_hdf5
+from mne.utils import _TempDir, requires_pytables
+
+base_dir = op.join(op.dirname(__file__), '..', '..', 'tests', 'data')
+ctf_fname = op.join(base_dir, 'test_ctf_comp_raw.fif')
+
+tempdir = _TempDir()
+
+
+@requires_pytables()
+def test_io_raw_hdf5():
+    """Test IO of raw data in chunked HDF5 files
+    """
+    raw = Raw(ctf_fname, compensation=1)
+    data, times = raw[:, :]
+    fname = op.join(tempdir, 'test_raw.h5')
+    write_raw_hdf5(fname, raw, format='double', chunk_duration=0.05,
+                   chunk_channels=16)
+    assert_raises(IOError, write_raw_hdf5, fname, raw)  # file exists
+    assert_raises(ValueError, write_raw_hdf5, fname, raw, format='short',
+                  overwrite=True)
+
+    for preload in (False, True, op.join(tempdir, 'test_hdf5.dat')):
+        raw_2 = read_raw_hdf5(fname, preload=preload)
+        assert_equal(raw_2.info['ch_names'], raw.info['ch_names'])
+        assert_equal(raw_2.first_samp, raw.first_samp)
+        assert_equal(raw_2.last_samp, raw.last_samp)
+        assert_array_equal(raw_2[:, :][0], data)
+        assert_array_equal(raw_2[:, :][1], times)
+        # partial reads
+        assert_array_equal(raw_2[[2, 7, 40], 100:177][0],
+                           data[[2, 7, 40], 100:177])
+        assert_array_equal(raw_2[5, 200][0], data[5:6, 200:201])
+    assert_true(repr(raw_2))
+
+    # subsets of channels and times without compression
+    raw.info['comps'] = []  # the compensation needs the reference channels
+    write_raw_hdf5(fname, raw, picks=np.arange(10, 30), tmin=0.1, tmax=0.5,
+                   compression=0, overwrite=True)
+    raw_2 = read_raw_hdf5(fname)
+    start, stop = raw.time_as_index([0.1, 0.5])
+    assert_equal(raw_2.first_samp, raw.first_samp + start)
+    assert_equal(raw_2.n_times, stop - start + 1)
+    assert_equal(raw_2.info['ch_names'], raw.info['ch_names'][10:30])
+    assert_allclose(raw_2[:, :][0], data[10:30, start:stop + 1], rtol=1e-6)
+    write_raw_hdf5(fname, raw, picks=[0], tmin=None, tmax=0.5,
+                   overwrite=True)
+    raw_2 = read_raw_hdf5(fname)
+    assert_equal(raw_2.first_samp, raw.first_samp)
+    assert_allclose(raw_2[:, :][0], data[:1, :stop + 1], rtol=1e-6)
+
+    # saving from HDF5 to FIF
+    fif_fname = op.join(tempdir, 'test_raw.fif')
+    raw_2.save(fif_fname, format='double')
+    raw_3 = Raw(fif_fname)
+    assert_allclose(raw_3[:, :][0], raw_2[:, :][0], rtol=1e-10)
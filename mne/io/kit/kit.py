@@ -19,7 +19,7 @@ from scipy import linalg
 from ..pick import pick_types
 from ...coreg import (read_elp, fit_matched_points, _decimate_points,
                       get_ras_to_neuromag_trans)
-from ...utils import verbose, logger
+from ...utils import verbose, logger, _check_dtype
 from ...transforms import apply_trans, als_ras_trans, als_ras_trans_mm
 from ..base import _BaseRaw
 from ..constants import FIFF
@@ -85,6 +85,7 @@ class RawKIT(_BaseRaw):
         # Raw attributes
         self.verbose = verbose
         self.preload = False
+        self._dtype = _check_dtype(None)
         self._projector = None
         self.first_samp = 0
         self.last_samp = self._sqd_params['nsamples'] - 1
@@ -215,20 +216,6 @@ class RawKIT(_BaseRaw):
             self._data, _ = self._read_segment()
             assert len(self._data) == self.info['nchan']
 
-            # Create a synthetic channel
-            stim = self._sqd_params['stim']
-            trig_chs = self._data[stim, :]
-            if slope == '+':
-                trig_chs = trig_chs > stimthresh
-            elif slope == '-':
-                trig_chs = trig_chs < stimthresh
-            else:
-                raise ValueError("slope needs to be '+' or '-'")
-            trig_vals = np.array(2 ** np.arange(len(stim)), ndmin=2).T
-            trig_chs = trig_chs * trig_vals
-            stim_ch = trig_chs.sum(axis=0)
-            self._data[-1, :] = stim_ch
-
             # Add time info
             self.first_samp, self.last_samp = 0, self._data.shape[1] - 1
             self._times = np.arange(self.first_samp, self.last_samp + 1,
@@ -266,16 +253,12 @@ class RawKIT(_BaseRaw):
 
         pick = pick_types(self.info, meg=False, ref_meg=False,
                           stim=True, exclude=[])
-        stim_ch = np.empty((1, stop), dtype=np.int)
-        for b_start in range(start, stop, buffer_size):
-            b_stop = b_start + buffer_size
-            x, _ = self._read_segment(start=b_start, stop=b_stop, sel=pick)
-            stim_ch[:, b_start:b_start + x.shape[1]] = x
-
-        return stim_ch
+        x, _ = self._read_segment(start=start, stop=stop, sel=pick,
+                                  buffer_size=buffer_size)
+        return x.astype(np.int)
 
     def _read_segment(self, start=0, stop=None, sel=None, verbose=None,
-                      projector=None):
+                      projector=None, buffer_size=1e5):
         """Read a chunk of raw data
 
         Parameters
@@ -292,6 +275,8 @@ class RawKIT(_BaseRaw):
             SSP operator to apply to the data.
         verbose : bool, str, int, or None
             If not None, override default verbose level (see mne.verbose).
+        buffer_size : int
+            The number of samples that are converted at a time.
 
         Returns
         -------
@@ -322,42 +307,29 @@ class RawKIT(_BaseRaw):
                     (start, stop - 1, start / float(self.info['sfreq']),
                      (stop - 1) / float(self.info['sfreq'])))
 
-        with open(self._sqd_params['fname'], 'rb', buffering=0) as fid:
-            # extract data
-            fid.seek(KIT.DATA_OFFSET)
-            # data offset info
-            data_offset = unpack('i', fid.read(KIT.INT))[0]
-            nchan = self._sqd_params['nchan']
-            buffer_size = stop - start
-            count = buffer_size * nchan
-            pointer = start * nchan * KIT.SHORT
-            fid.seek(data_offset + pointer)
-            data = np.fromfile(fid, dtype='h', count=count)
-            data = data.reshape((buffer_size, nchan))
-        # amplifier applies only to the sensor channels
-        n_sens = self._sqd_params['n_sens']
-        sensor_gain = np.copy(self._sqd_params['sensor_gain'])
-        sensor_gain[:n_sens] = (sensor_gain[:n_sens] /
-                                self._sqd_params['amp_gain'])
-        conv_factor = np.array((KIT.VOLTAGE_RANGE /
-                                self._sqd_params['DYNAMIC_RANGE'])
-                               * sensor_gain, ndmin=2)
-        data = conv_factor * data
-        data = data.T
-        # Create a synthetic channel
-        trig_chs = data[self._sqd_params['stim'], :]
-        if self._sqd_params['slope'] == '+':
-            trig_chs = trig_chs > self._sqd_params['stimthresh']
-        elif self._sqd_params['slope'] == '-':
-            trig_chs = trig_chs < self._sqd_params['stimthresh']
-        else:
-            raise ValueError("slope needs to be '+' or '-'")
-        trig_vals = np.array(2 ** np.arange(len(self._sqd_params['stim'])),
-                             ndmin=2).T
-        trig_chs = trig_chs * trig_vals
-        stim_ch = np.array(trig_chs.sum(axis=0), ndmin=2)
-        data = np.vstack((data, stim_ch))
-        data = data[sel]
+        # the samples are stored as rows of int16, one column per channel
+        nchan = self._sqd_params['nchan']
+        raw_data = np.memmap(self._sqd_params['fname'], dtype='h', mode='r',
+                             offset=self._sqd_params['data_offset'],
+                             shape=(self._sqd_params['nsamples'], nchan))
+        conv_factor = self._sqd_params['conv_factor']
+
+        # only convert the selected channels (the last one is synthetic)
+        sel = np.asarray(sel)
+        is_data = sel < nchan
+        picks = sel[is_data]
+        data = np.empty((len(sel), stop - start), self._dtype)
+        buffer_size = int(buffer_size)
+        for b_start in range(start, stop, buffer_size):
+            b_stop = min(b_start + buffer_size, stop)
+            block = raw_data[b_start:b_stop]
+            this_data = data[:, b_start - start:b_stop - start]
+            this_data[is_data] = (block[:, picks] * conv_factor[picks]).T
+            if not np.all(is_data):
+                this_data[~is_data] = _make_stim_channel(
+                    block, conv_factor, self._sqd_params['stim'],
+                    self._sqd_params['slope'], self._sqd_params['stimthresh'])
+        del raw_data
 
         logger.info('[done]')
         times = np.arange(start, stop) / self.info['sfreq']
@@ -501,6 +473,8 @@ class RawKIT(_BaseRaw):
             err = "Can't change stim channel after preloading data"
             raise NotImplementedError(err)
 
+        if slope not in ('+', '-'):
+            raise ValueError("slope needs to be '+' or '-'")
         self._sqd_params['slope'] = slope
 
         if isinstance(stim, str):
@@ -521,6 +495,37 @@ class RawKIT(_BaseRaw):
         self._sqd_params['stim'] = stim
 
 
+def _make_stim_channel(data, conv_factor, stim, slope, threshold):
+    """Synthesize the stim channel from the KIT trigger channels
+
+    Parameters
+    ----------
+    data : array of int16, shape (n_samples, n_channels)
+        The raw samples.
+    conv_factor : array, shape (n_channels,)
+        Conversion from raw samples to volts.
+    stim : list of int
+        The trigger channels, the n-th channel codes the value 2 ** n.
+    slope : '+' | '-'
+        Whether values above ('+') or below ('-') threshold are events.
+    threshold : float
+        The threshold in volts.
+
+    Returns
+    -------
+    stim_ch : array, shape (n_samples,)
+        The synthesized stim channel.
+    """
+    trig_chs = data[:, stim] * conv_factor[stim]
+    if slope == '+':
+        trig_chs = trig_chs > threshold
+    elif slope == '-':
+        trig_chs = trig_chs < threshold
+    else:
+        raise ValueError("slope needs to be '+' or '-'")
+    return np.dot(trig_chs, 2 ** np.arange(len(stim)))
+
+
 def get_sqd_params(rawfile):
     """Extracts all the information from the sqd file.
 
@@ -637,6 +642,16 @@ def get_sqd_params(rawfile):
         sqd['nmegchan'] = KIT_SYS.NMEGCHAN
         sqd['nmiscchan'] = KIT_SYS.NMISCCHAN
         sqd['DYNAMIC_RANGE'] = KIT_SYS.DYNAMIC_RANGE
+
+        fid.seek(KIT.DATA_OFFSET)
+        sqd['data_offset'] = unpack('i', fid.read(KIT.INT))[0]
+
+    # conversion from int16 to volts (or tesla), the amplifier gain applies
+    # only to the sensor channels
+    sensor_gain = np.copy(sqd['sensor_gain'])
+    sensor_gain[:sqd['n_sens']] /= sqd['amp_gain']
+    sqd['conv_factor'] = (KIT.VOLTAGE_RANGE / sqd['DYNAMIC_RANGE'] *
+                          sensor_gain)
     return sqd
 
 
@@ -9,6 +9,7 @@ import os.path as op
 import inspect
 import numpy as np
 from numpy.testing import assert_array_almost_equal, assert_array_equal
+from nose.tools import assert_raises
 import scipy.io
 from mne.utils import _TempDir
 from mne import pick_types
@@ -114,3 +115,12 @@ def test_stim_ch():
     stim1, _ = raw[stim_pick]
     stim2 = np.array(raw.read_stim_ch(), ndmin=2)
     assert_array_equal(stim1, stim2)
+
+    # synthesized in chunks when reading from disk
+    raw = read_raw_kit(sqd_path, mrk_path, elp_path, hsp_path, stim='<',
+                       slope='+', preload=False)
+    stim3 = raw.read_stim_ch(buffer_size=333)
+    assert_array_equal(stim1, stim3)
+    data, _ = raw[np.r_[stim_pick, 0], 500:1500]
+    assert_array_equal(data[0], stim1[0, 500:1500])
+    assert_raises(ValueError, read_raw_kit, sqd_path, slope='x')
@@ -5,16 +5,23 @@
 
 from ..externals.six import string_types
 import numpy as np
+import os
 import os.path as op
+import hashlib
 from io import BytesIO
 
 from .tag import read_tag_info, read_tag, read_big, Tag
 from .tree import make_dir_tree
 from .constants import FIFF
-from ..utils import logger, verbose
+from ..utils import logger, verbose, get_config
 from ..externals import six
 from ..fixes import gzip_open
 
+# bump this if the format of the cached directory index changes
+_INDEX_VERSION = 2
+# number of values stored for each node of the directory tree
+_N_NODE = 15
+
 
 def _fiff_get_fid(fname):
     """Helper to open a FIF file with no additional parsing"""
@@ -55,6 +62,15 @@ def fiff_open(fname, preload=False, verbose=None):
         lists and tags.
     directory : list
         A list of tags.
+
+    Notes
+    -----
+    If the config variable (or environment variable) MNE_FIFF_INDEX_DIR
+    is set to an existing directory, the tag directory and tree of each
+    opened file are stored there and reused the next time the same file is
+    opened, as long as its size, modification time and file id are
+    unchanged. This avoids rebuilding the directory of large files that
+    are opened repeatedly.
     """
     fid = _fiff_get_fid(fname)
     # do preloading of entire file
@@ -82,6 +98,17 @@ def fiff_open(fname, preload=False, verbose=None):
     if tag.kind != FIFF.FIFF_DIR_POINTER:
         raise ValueError('file does not have a directory pointer')
 
+    #   Use the cached directory tree if it is still valid
+    index_fname = _get_index_fname(fname)
+    if index_fname is not None:
+        key = _get_index_key(fname, fid)
+        index = _read_index(index_fname, key)
+        if index is not None:
+            logger.debug('    Using cached tag directory %s' % index_fname)
+            tree, directory = index
+            fid.seek(0)
+            return fid, tree, directory
+
     #   Read or create the directory tree
     logger.debug('    Creating tag directory for %s...' % fname)
 
@@ -105,12 +132,155 @@ def fiff_open(fname, preload=False, verbose=None):
 
     logger.debug('[done]')
 
+    if index_fname is not None:
+        _write_index(index_fname, key, tree, directory)
+
     #   Back to the beginning
     fid.seek(0)
 
     return fid, tree, directory
 
 
+def _get_index_fname(fname):
+    """Helper to get the name of the cached directory index of a file"""
+    index_dir = get_config('MNE_FIFF_INDEX_DIR', None)
+    if index_dir is None or not isinstance(fname, string_types):
+        return None
+    if not op.isdir(index_dir):
+        logger.warning('MNE_FIFF_INDEX_DIR %s does not exist, not using it'
+                       % index_dir)
+        return None
+    name = hashlib.sha1(op.realpath(fname).encode('utf-8')).hexdigest()
+    return op.join(index_dir, name + '-dir.idx')
+
+
+def _get_index_key(fname, fid):
+    """Helper to get the size, mtime and file id used to validate an index"""
+    stat = os.stat(fname)
+    file_id = read_tag(fid, 0).data
+    return (_INDEX_VERSION, stat.st_size, stat.st_mtime, file_id['version'],
+            int(file_id['machid'][0]), int(file_id['machid'][1]),
+            file_id['secs'], file_id['usecs'])
+
+
+def _id_to_list(this_id):
+    """Helper to store an id struct (or None) as 6 integers"""
+    if this_id is None:
+        return [0] * 6
+    return ([1, this_id['version']] + [int(m) for m in this_id['machid']] +
+            [this_id['secs'], this_id['usecs']])
+
+
+def _list_to_id(values):
+    """Helper to get an id struct (or None) from 6 integers"""
+    if values[0] == 0:
+        return None
+    return dict(version=int(values[1]),
+                machid=np.array(values[2:4], dtype='>i4'),
+                secs=int(values[4]), usecs=int(values[5]))
+
+
+def _flatten_tree(tree, tag_idx, nodes, entries):
+    """Helper to store a directory tree as rows of integers (preorder)"""
+    directory = tree['directory']
+    nent = 0 if directory is None else len(directory)
+    nodes.append([tree['block'], tree['nchild'], nent] +
+                 _id_to_list(tree['id']) + _id_to_list(tree['parent_id']))
+    if directory is not None:
+        entries.extend(tag_idx[id(tag)] for tag in directory)
+    for child in tree['children']:
+        _flatten_tree(child, tag_idx, nodes, entries)
+
+
+def _unflatten_tree(nodes, entries, directory, pos):
+    """Helper to rebuild a directory tree stored by _flatten_tree"""
+    node = nodes[pos[0]]
+    pos[0] += 1
+    block, nchild, nent = [int(v) for v in node[:3]]
+    tree = dict(block=block, id=_list_to_id(node[3:9]),
+                parent_id=_list_to_id(node[9:15]), nent=nent, nchild=nchild)
+    if nent == 0:
+        tree['directory'] = None
+    else:
+        tree['directory'] = [directory[k]
+                             for k in entries[pos[1]:pos[1] + nent]]
+        pos[1] += nent
+    tree['children'] = [_unflatten_tree(nodes, entries, directory, pos)
+                        for _ in range(nchild)]
+    return tree
+
+
+def _read_index(index_fname, key):
+    """Helper to read a cached directory index, None if invalid
+
+    The index only holds integers (and the file key) in a plain binary
+    layout, it is never unpickled or otherwise evaluated.
+    """
+    if not op.isfile(index_fname):
+        return None
+    key = np.array(key, dtype='<f8')
+    try:
+        with open(index_fname, 'rb') as fid:
+            this_key = np.fromfile(fid, dtype='<f8', count=len(key))
+            if len(this_key) != len(key) or not np.all(this_key == key):
+                logger.debug('    Directory index %s is outdated'
+                             % index_fname)
+                return None
+            counts = np.fromfile(fid, dtype='<i8', count=3)
+            if len(counts) != 3 or np.any(counts < 0):
+                raise ValueError('invalid counts')
+            n_tags, n_nodes, n_entries = [int(c) for c in counts]
+            tags = np.fromfile(fid, dtype='<i8', count=5 * n_tags)
+            nodes = np.fromfile(fid, dtype='<i8', count=_N_NODE * n_nodes)
+            entries = np.fromfile(fid, dtype='<i8', count=n_entries)
+        if (len(tags) != 5 * n_tags or len(nodes) != _N_NODE * n_nodes or
+                len(entries) != n_entries or n_nodes == 0):
+            raise ValueError('truncated index')
+        if n_entries > 0 and (entries.min() < 0 or entries.max() >= n_tags):
+            raise ValueError('invalid directory entries')
+        directory = [Tag(*t) for t in tags.reshape(n_tags, 5)]
+        pos = [0, 0]
+        tree = _unflatten_tree(nodes.reshape(n_nodes, _N_NODE), entries,
+                               directory, pos)
+        if pos != [n_nodes, n_entries]:
+            raise ValueError('inconsistent tree')
+    except Exception:
+        logger.warning('Could not read directory index %s, rebuilding it'
+                       % index_fname)
+        return None
+    return tree, directory
+
+
+def _write_index(index_fname, key, tree, directory):
+    """Helper to write a directory index, atomically replacing old ones"""
+    tag_idx = dict((id(tag), k) for k, tag in enumerate(directory))
+    nodes, entries = list(), list()
+    try:
+        _flatten_tree(tree, tag_idx, nodes, entries)
+    except KeyError:
+        logger.warning('Could not index the directory tree, not writing %s'
+                       % index_fname)
+        return
+    arrays = [np.array(key, dtype='<f8'),
+              np.array([len(directory), len(nodes), len(entries)],
+                       dtype='<i8'),
+              np.array([[t.kind, t.type, t.size, t.next, t.pos]
+                        for t in directory], dtype='<i8'),
+              np.array(nodes, dtype='<i8'),
+              np.array(entries, dtype='<i8')]
+    temp_fname = '%s.%d.tmp' % (index_fname, os.getpid())
+    try:
+        with open(temp_fname, 'wb') as fid:
+            for arr in arrays:
+                arr.tofile(fid)
+        if os.name == 'nt' and op.isfile(index_fname):
+            os.remove(index_fname)  # Windows cannot rename onto a file
+        os.rename(temp_fname, index_fname)
+    except (IOError, OSError) as exp:
+        logger.warning('Could not write directory index %s (%s)'
+                       % (index_fname, exp))
+
+
 def show_fiff(fname, indent='    ', read_limit=np.inf, max_str=30,
               output=str, verbose=None):
     """Show FIFF information
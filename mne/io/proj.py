@@ -15,6 +15,7 @@ from .tag import find_tag
 from .constants import FIFF
 from .pick import pick_types
 from ..utils import logger, verbose
+from ..fixes import astype_no_copy
 
 
 class Projection(dict):
@@ -131,7 +132,9 @@ class ProjMixin(object):
                 else:  # get data knows what to do.
                     data = data()
             else:
-                data = np.dot(self._projector, data)
+                # keep the data type (e.g., single precision data)
+                data = astype_no_copy(np.dot(self._projector, data),
+                                      data.dtype)
             break
         logger.info('SSP projectors applied...')
         if hasattr(self, '_data'):
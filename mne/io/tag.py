@@ -15,6 +15,22 @@ from ..externals.six import text_type
 from ..externals.jdcal import jd2jcal
 
 
+# Big-endian numpy types of the FIF types that can hold raw data buffers
+_data_buffer_dtypes = {FIFF.FIFFT_DAU_PACK16: '>i2',
+                       FIFF.FIFFT_SHORT: '>i2',
+                       FIFF.FIFFT_INT: '>i4',
+                       FIFF.FIFFT_FLOAT: '>f4',
+                       FIFF.FIFFT_DOUBLE: '>f8',
+                       FIFF.FIFFT_COMPLEX_FLOAT: '>c8',
+                       FIFF.FIFFT_COMPLEX_DOUBLE: '>c16'}
+
+# Big-endian numpy types of the real-valued dense matrices
+_matrix_dtypes = {FIFF.FIFFT_INT: '>i4',
+                  FIFF.FIFFT_JULIAN: '>i4',
+                  FIFF.FIFFT_FLOAT: '>f4',
+                  FIFF.FIFFT_DOUBLE: '>f8'}
+
+
 class Tag(object):
     """Tag in FIF tree structure
 
@@ -202,8 +218,9 @@ def read_tag(fid, pos=None, shape=None, rlims=None):
         data stored as a vector (not implemented for matrices yet).
     rlims : tuple | None
         If tuple, the first and last rows to retrieve. Note that data are
-        assumed to be stored row-major in the file. Only to be used with
-        data stored as a vector (not implemented for matrices yet).
+        assumed to be stored row-major in the file. To be used with data
+        stored as a vector, or with dense real-valued matrices, for which
+        the rows are taken along the first dimension.
 
     Returns
     -------
@@ -255,7 +272,22 @@ def read_tag(fid, pos=None, shape=None, rlims=None):
 
                 matrix_type = data_type & tag.type
 
-                if matrix_type == FIFF.FIFFT_INT:
+                if rlims is not None:
+                    # only read the requested rows of the first dimension
+                    if matrix_type not in _matrix_dtypes:
+                        raise ValueError('Row reading not implemented for '
+                                         'matrices of type %d' % matrix_type)
+                    if not 0 <= rlims[0] < rlims[1] <= dims[0]:
+                        raise ValueError('rlims must be within the %d rows'
+                                         % dims[0])
+                    dtype = np.dtype(_matrix_dtypes[matrix_type])
+                    row_size = dtype.itemsize * int(np.prod(dims[1:]))
+                    n_row_out = rlims[1] - rlims[0]
+                    fid.seek(int(rlims[0] * row_size), 1)
+                    tag.data = np.fromstring(
+                        read_big(fid, int(n_row_out * row_size)),
+                        dtype=dtype).reshape((n_row_out,) + tuple(dims[1:]))
+                elif matrix_type == FIFF.FIFFT_INT:
                     tag.data = np.fromstring(read_big(fid, 4 * dims.prod()),
                                              dtype='>i4').reshape(dims)
                 elif matrix_type == FIFF.FIFFT_JULIAN:
@@ -0,0 +1,78 @@
+import os
+import os.path as op
+import shutil
+import time
+import warnings
+
+from nose.tools import assert_equal, assert_true
+
+from mne.io import fiff_open, Raw
+from mne.utils import _TempDir
+
+base_dir = op.join(op.dirname(__file__), 'data')
+fif_fname = op.join(base_dir, 'test_ctf_comp_raw.fif')
+cov_fname = op.join(base_dir, 'test-cov.fif')
+
+tempdir = _TempDir()
+
+
+def _tree_summary(tree):
+    """Helper to summarize a directory tree for comparisons"""
+    out = [tree['block'], tree['nent'], tree['nchild'], str(tree['id'])]
+    if tree['directory'] is not None:
+        out += [(t.kind, t.type, t.size, t.pos) for t in tree['directory']]
+    return [out] + [_tree_summary(child) for child in tree['children']]
+
+
+def test_directory_index():
+    """Test caching of FIF directory trees
+    """
+    index_dir = op.join(tempdir, 'index')
+    os.mkdir(index_dir)
+    fname = op.join(tempdir, 'test_raw.fif')
+    shutil.copyfile(fif_fname, fname)
+    old_value = os.environ.get('MNE_FIFF_INDEX_DIR')
+    try:
+        for this_fname in (fname, cov_fname):
+            os.environ.pop('MNE_FIFF_INDEX_DIR', None)
+            fid, tree, directory = fiff_open(this_fname)
+            fid.close()
+            os.environ['MNE_FIFF_INDEX_DIR'] = index_dir
+            for _ in range(2):  # create and reuse the index
+                fid, tree_2, directory_2 = fiff_open(this_fname)
+                fid.close()
+                assert_equal(_tree_summary(tree), _tree_summary(tree_2))
+                assert_equal([(t.kind, t.pos) for t in directory],
+                             [(t.kind, t.pos) for t in directory_2])
+        assert_equal(len(os.listdir(index_dir)), 2)
+
+        # corrupted or truncated indices must be ignored and rebuilt
+        index_fname = op.join(index_dir, os.listdir(index_dir)[0])
+        with open(index_fname, 'rb') as fid:
+            contents = fid.read()
+        for bad in (b'garbage', contents[:len(contents) // 2],
+                    contents[:64] + b'\xff' * (len(contents) - 64)):
+            with open(index_fname, 'wb') as fid:
+                fid.write(bad)
+            with warnings.catch_warnings(record=True):
+                warnings.simplefilter('always')
+                for this_fname in (fname, cov_fname):
+                    fid, tree_2, _ = fiff_open(this_fname)
+                    fid.close()
+            with open(index_fname, 'rb') as fid:
+                assert_equal(fid.read(), contents)
+
+        # a modified file must not use the outdated index
+        raw = Raw(fname, preload=True)
+        raw.crop(0, 0.2, copy=False)
+        raw.save(fname, overwrite=True)
+        mtime = time.time() + 10
+        os.utime(fname, (mtime, mtime))
+        raw_2 = Raw(fname)
+        assert_equal(raw.n_times, raw_2.n_times)
+        assert_true(raw_2[:, :][0].shape == raw._data.shape)
+    finally:
+        if old_value is None:
+            os.environ.pop('MNE_FIFF_INDEX_DIR', None)
+        else:
+            os.environ['MNE_FIFF_INDEX_DIR'] = old_value
@@ -6,9 +6,15 @@
 # License: Simplified BSD
 
 from .externals.six import string_types
+import atexit
 import inspect
 import logging
 import os
+import os.path as op
+import tempfile
+import weakref
+
+import numpy as np
 
 from . import get_config
 from .utils import logger, verbose
@@ -48,6 +54,12 @@ def parallel_func(func, n_jobs, verbose=None, max_nbytes='auto'):
         func if not parallel or delayed(func)
     n_jobs: int
         Number of jobs >= 0
+
+    Notes
+    -----
+    Arrays created with ``to_shared_memory`` (and thus the data of Raw or
+    Epochs instances after ``share_memory()``) and views of them are passed
+    to the workers by file name, without copying the data.
     """
     # for a single job, we don't need joblib
     if n_jobs == 1:
@@ -146,3 +158,98 @@ def check_n_jobs(n_jobs, allow_cuda=False):
                 n_jobs = 1
 
     return n_jobs
+
+
+###############################################################################
+# Shared memory
+
+# file names of the shared arrays created by this process
+_shared_fnames = dict()
+
+
+def _get_shared_dir():
+    """Helper to get the directory used for shared-memory arrays"""
+    shared_dir = get_config('MNE_SHARED_MEMORY_DIR', None)
+    if shared_dir is None:
+        shared_dir = '/dev/shm' if op.isdir('/dev/shm') else None
+    return shared_dir
+
+
+def _remove_shared(fname, pid):
+    """Helper to delete the file of a shared array"""
+    if pid != os.getpid():  # only the creating process cleans up
+        return
+    _shared_fnames.pop(fname, None)
+    try:
+        os.remove(fname)
+    except OSError:
+        pass
+
+
+@atexit.register
+def _remove_all_shared():
+    for fname, (ref, pid) in list(_shared_fnames.items()):
+        _remove_shared(fname, pid)
+
+
+def _attach_shared(fname, dtype, shape, strides, offset):
+    """Helper to map an existing shared array in a worker process"""
+    buf = np.memmap(fname, dtype=np.uint8, mode='r+')
+    return np.ndarray(shape, dtype, buffer=buf, offset=offset,
+                      strides=strides)
+
+
+class _SharedMemmap(np.memmap):
+    """Memory-mapped array that is pickled by file name instead of by value
+    """
+    def __reduce__(self):
+        root = self
+        while isinstance(root.base, np.ndarray):
+            root = root.base
+        if (getattr(self, '_mmap', None) is None or
+                self.filename is None or root.filename != self.filename):
+            # not backed by the file (e.g., the result of an operation)
+            return np.asarray(self).__reduce__()
+        offset = (self.__array_interface__['data'][0] -
+                  root.__array_interface__['data'][0])
+        return (_attach_shared, (self.filename, self.dtype.str, self.shape,
+                                 self.strides, offset))
+
+
+def to_shared_memory(data):
+    """Copy an array to shared memory for use by parallel workers
+
+    The array is stored in a memory-mapped file (by default in /dev/shm,
+    which can be changed with the config variable MNE_SHARED_MEMORY_DIR).
+    When the returned array, or a view of it, is passed to a function run
+    in parallel (see ``parallel_func``), the workers map the same file
+    instead of receiving a pickled copy of the data. The file is deleted
+    once the array is garbage collected or when the interpreter exits.
+
+    Parameters
+    ----------
+    data : array
+        The data to share.
+
+    Returns
+    -------
+    shared : instance of numpy.memmap
+        A shared copy of data.
+    """
+    if isinstance(data, _SharedMemmap):
+        return data
+    data = np.asarray(data)
+    if data.size == 0:
+        return data
+    fd, fname = tempfile.mkstemp(prefix='mne-shared-', suffix='.dat',
+                                 dir=_get_shared_dir())
+    os.close(fd)
+    shared = _SharedMemmap(fname, dtype=data.dtype, mode='w+',
+                           shape=data.shape)
+    pid = os.getpid()
+    ref = weakref.ref(shared, lambda ref: _remove_shared(fname, pid))
+    _shared_fnames[fname] = (ref, pid)
+    shared[...] = data
+    logger.info('Moved %0.1f MB of data to shared memory %s'
+                % (data.nbytes / float(2 ** 20), fname))
+    return shared
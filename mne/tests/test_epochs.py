@@ -3,6 +3,7 @@
 #
 # License: BSD (3-clause)
 
+import os
 import os.path as op
 from copy import deepcopy
 
@@ -19,12 +20,14 @@ from mne import (io, Epochs, read_events, pick_events, read_epochs,
                  equalize_channels, pick_types, pick_channels, read_evokeds,
                  write_evokeds)
 from mne.epochs import (bootstrap, equalize_epoch_counts, combine_event_ids,
-                        add_channels_epochs, EpochsArray)
+                        add_channels_epochs, EpochsArray, _is_good,
+                        _is_good_batch)
 from mne.utils import (_TempDir, requires_pandas, requires_nitime,
                        clean_warning_registry)
 
 from mne.io.meas_info import create_info
 from mne.io.proj import _has_eeg_average_ref_proj
+from mne.io.pick import channel_indices_by_type
 from mne.event import merge_events
 from mne.io.constants import FIFF
 from mne.externals.six.moves import zip
@@ -229,6 +232,68 @@ def test_read_write_epochs():
     assert_true(len(w) == 2)
 
 
+def test_read_epochs_lazy_split():
+    """Test lazy reading of epochs and epochs saved in split files
+    """
+    epochs = Epochs(raw, events, event_id, tmin, tmax, picks=picks,
+                    baseline=(None, 0), reject=reject)
+    data = epochs.get_data()
+    fname = op.join(tempdir, 'test-epo.fif')
+    epochs.save(fname)
+    epochs_read = read_epochs(fname, preload=False)
+    assert_true(not epochs_read.preload)
+    assert_array_equal(epochs_read.events, epochs.events)
+    assert_array_equal(epochs_read.selection, epochs.selection)
+    assert_array_almost_equal(epochs_read.get_data(), data)
+    assert_array_almost_equal(np.array([e for e in epochs_read]), data)
+    assert_array_almost_equal(epochs_read[::2].get_data(), data[::2])
+    assert_array_almost_equal(epochs_read[[3, 1]].get_data(), data[[3, 1]])
+    assert_array_almost_equal(epochs_read.average().data,
+                              epochs.average().data)
+    epochs_read.drop_epochs([0])
+    assert_array_almost_equal(epochs_read.get_data(), data[1:])
+
+    # split files
+    epoch_size = 4 * data[0].size
+    split_size = 2 ** 20 + 3 * epoch_size + 50000
+    assert_raises(ValueError, epochs.save, fname, split_size=2 ** 20)
+    epochs.save(fname, split_size=split_size)
+    assert_true(op.isfile(op.join(tempdir, 'test-epo-1.fif')))
+    assert_true(os.path.getsize(fname) <= split_size)
+    for preload in (True, False, op.join(tempdir, 'test-epo.dat')):
+        epochs_read = read_epochs(fname, preload=preload)
+        assert_equal(epochs_read.preload, preload is not False)
+        assert_array_equal(epochs_read.events, epochs.events)
+        assert_array_equal(epochs_read.selection, epochs.selection)
+        assert_equal(epochs_read.drop_log, epochs.drop_log)
+        assert_array_almost_equal(epochs_read.get_data(), data)
+        assert_array_almost_equal(epochs_read[1:6].get_data(), data[1:6])
+
+    # repeated epochs
+    epochs_boot = epochs[[0, 0, 2]]
+    epochs_boot.save(fname)
+    epochs_read = read_epochs(fname, preload=False)
+    assert_array_almost_equal(epochs_read.get_data(), data[[0, 0, 2]])
+
+    # projections applied after reading
+    epochs = Epochs(raw, events[:5], event_id, tmin, tmax, picks=picks,
+                    baseline=(None, 0), proj=False)
+    epochs.save(fname)
+    epochs_pre, epochs_lazy = [read_epochs(fname, proj=False, preload=p)
+                               for p in (True, False)]
+    assert_array_almost_equal(epochs_lazy.get_data(), epochs_pre.get_data())
+    for this_epochs in (epochs_pre, epochs_lazy):
+        this_epochs.apply_proj()
+        assert_true(all(p['active'] for p in this_epochs.info['projs']))
+    assert_true(not epochs_lazy.preload)
+    data_proj = epochs_pre.get_data()
+    assert_true(np.abs(data_proj - epochs.get_data()).max() > 0)
+    assert_array_almost_equal(epochs_lazy.get_data(), data_proj)
+    assert_array_almost_equal(epochs_lazy[1:3].get_data(), data_proj[1:3])
+    assert_array_almost_equal(epochs_lazy.average().data,
+                              epochs_pre.average().data)
+
+
 def test_epochs_proj():
     """Test handling projection (apply proj in Raw or in Epochs)
     """
@@ -323,6 +388,31 @@ def test_evoked_io_from_epochs():
     assert_allclose(evoked.times, evoked2.times, rtol=1e-4, atol=1e-20)
 
 
+def test_average_all():
+    """Test averaging several conditions in one pass
+    """
+    event_ids = dict(a=1, b=2, c=3, d=4)
+    for preload in (True, False):
+        epochs = Epochs(raw, events, event_ids, tmin, tmax, picks=picks,
+                        baseline=(None, 0), reject=reject, preload=preload)
+        evokeds, stderrs = epochs.average_all(return_std=True)
+        assert_equal(sorted(evokeds.keys()), ['a', 'b', 'c', 'd'])
+        for cond in event_ids:
+            evoked = epochs[cond].average()
+            stderr = epochs[cond].standard_error()
+            for ev, ev_all in [(evoked, evokeds[cond]),
+                               (stderr, stderrs[cond])]:
+                assert_equal(ev.nave, ev_all.nave)
+                assert_equal(ev.kind, ev_all.kind)
+                assert_equal(ev.comment, ev_all.comment)
+                assert_equal(ev.ch_names, ev_all.ch_names)
+                assert_allclose(ev.data, ev_all.data, rtol=1e-7, atol=1e-20)
+        evokeds = epochs.average_all(['b', 'a'], picks=[0, 1])
+        assert_equal(sorted(evokeds.keys()), ['a', 'b'])
+        assert_equal(len(evokeds['a'].ch_names), 2)
+        assert_raises(KeyError, epochs.average_all, ['e'])
+
+
 def test_evoked_standard_error():
     """Test calculation and read/write of standard error
     """
@@ -409,6 +499,126 @@ def test_preload_epochs():
                               epochs.average().data, 18)
 
 
+def test_preload_memmap():
+    """Test preload of epochs into a memory-mapped file
+    """
+    kwargs = dict(picks=picks, baseline=(None, 0), reject=reject, flat=flat)
+    epochs = Epochs(raw, events[:16], event_id, tmin, tmax, preload=True,
+                    **kwargs)
+    fname_mm = op.join(tempdir, 'test-epo.dat')
+    epochs_mm = Epochs(raw, events[:16], event_id, tmin, tmax,
+                       preload=fname_mm, **kwargs)
+    assert_true(epochs_mm.preload is True)
+    assert_true(isinstance(epochs_mm._data, np.memmap))
+    assert_equal(epochs_mm.drop_log, epochs.drop_log)
+    assert_array_equal(epochs_mm.get_data(), epochs.get_data())
+    # the file only holds the kept epochs
+    data = epochs.get_data()
+    assert_equal(op.getsize(fname_mm), data.nbytes)
+    data_disk = np.memmap(fname_mm, dtype=data.dtype, mode='r',
+                          shape=data.shape)
+    assert_array_equal(data_disk, data)
+    del data_disk
+    assert_array_almost_equal(epochs_mm.average().data,
+                              epochs.average().data, 18)
+    assert_array_equal(epochs_mm[1:3].get_data(), epochs[1:3].get_data())
+    assert_array_equal(epochs_mm[:2].average().data,
+                       epochs[:2].average().data)
+    epochs_mm.crop(0., 0.1)
+    epochs.crop(0., 0.1)
+    assert_true(isinstance(epochs_mm._data, np.memmap))
+    assert_array_equal(epochs_mm.get_data(), epochs.get_data())
+    epochs_mm.resample(100, npad=0)
+    epochs.resample(100, npad=0)
+    assert_array_almost_equal(epochs_mm.get_data(), epochs.get_data())
+
+
+def test_epochs_cache():
+    """Test the cache of processed epochs
+    """
+    kwargs = dict(picks=picks, baseline=(None, 0))
+    events_ = events[:12]
+    n_events = len(events_)
+    epochs_ref = Epochs(raw, events_, None, tmin, tmax, **kwargs)
+    assert_true(epochs_ref.cache_info() is None)
+    data_ref = epochs_ref.get_data()
+    n_epochs = len(data_ref)
+    epochs = Epochs(raw, events_, None, tmin, tmax, cache_size=1e8,
+                    **kwargs)
+    assert_array_equal(epochs.get_data(), data_ref)
+    info = epochs.cache_info()
+    assert_equal(info['hits'], 0)
+    assert_equal(info['misses'], n_events)
+    assert_equal(info['n_epochs'], n_epochs)
+    assert_equal(info['size'], data_ref.nbytes)
+    # the second pass and the iteration are read from the cache
+    assert_array_equal(epochs.get_data(), data_ref)
+    assert_equal(epochs.cache_info()['hits'], n_epochs)
+    assert_array_equal(np.array([e for e in epochs]), data_ref)
+    info = epochs.cache_info()
+    assert_equal(info['hits'], 2 * n_epochs)
+    assert_equal(info['misses'], n_events)
+    # modifying the returned epochs does not modify the cache
+    data = epochs.get_data()
+    data[:] = 0.
+    assert_array_equal(epochs.get_data(), data_ref)
+    # subsets share the cache
+    assert_array_equal(epochs[:2].get_data(), data_ref[:2])
+    assert_equal(epochs.cache_info()['misses'], n_events)
+    assert_array_almost_equal(epochs.average().data,
+                              epochs_ref.average().data, 18)
+
+    # the least recently used epochs are evicted
+    epochs = Epochs(raw, events_, None, tmin, tmax,
+                    cache_size=3 * data_ref[0].nbytes, **kwargs)
+    assert_array_equal(epochs.get_data(), data_ref)
+    info = epochs.cache_info()
+    assert_equal(info['n_epochs'], 3)
+    assert_equal(info['size'], 3 * data_ref[0].nbytes)
+    assert_true(info['size'] <= info['max_size'])
+    # the last three epochs are cached, a sequential pass evicts them all
+    assert_array_equal(epochs.get_data(), data_ref)
+    info = epochs.cache_info()
+    assert_equal(info['hits'], 0)
+    assert_equal(info['misses'], n_events + n_epochs)
+    last = n_epochs - 1
+    assert_array_equal(epochs[last - 2].get_data(), data_ref[[last - 2]])
+    assert_equal(epochs.cache_info()['hits'], 1)  # now most recently used
+    assert_array_equal(epochs[0].get_data(), data_ref[[0]])  # evicts last-1
+    assert_array_equal(epochs[last - 2].get_data(), data_ref[[last - 2]])
+    assert_array_equal(epochs[last].get_data(), data_ref[[last]])
+    assert_equal(epochs.cache_info()['hits'], 3)
+    assert_array_equal(epochs[last - 1].get_data(), data_ref[[last - 1]])
+    info = epochs.cache_info()
+    assert_equal(info['hits'], 3)
+    assert_equal(info['misses'], n_events + n_epochs + 2)
+    assert_equal(info['n_epochs'], 3)
+
+    # the cache is cleared when the projector changes
+    epochs = Epochs(raw, events_, None, tmin, tmax, cache_size=1e8,
+                    **kwargs)
+    epochs.get_data()
+    epochs._projector = np.eye(len(epochs.ch_names))
+    data_noproj = Epochs(raw, events_, None, tmin, tmax, proj=False,
+                         **kwargs).get_data()
+    assert_true(np.abs(data_noproj - data_ref).max() > 0)
+    assert_allclose(epochs.get_data(), data_noproj, rtol=1e-10, atol=1e-20)
+    info = epochs.cache_info()
+    assert_equal(info['hits'], 0)
+    assert_equal(info['misses'], n_events + n_epochs)
+    assert_equal(info['n_epochs'], n_epochs)
+
+    # the cache follows changes of the processing
+    epochs = Epochs(raw, events_, None, tmin, tmax, cache_size=1e8,
+                    **kwargs)
+    epochs_ref.subtract_evoked()
+    epochs.get_data()
+    epochs.subtract_evoked()
+    assert_array_equal(epochs.get_data(), epochs_ref.get_data())
+    assert_raises(ValueError, Epochs, raw, events, event_id, tmin, tmax,
+                  cache_size=-1)
+
+
 def test_indexing_slicing():
     """Test of indexing and slicing operations
     """
@@ -605,6 +815,111 @@ def test_epochs_copy():
     assert_array_equal(data, copied_data)
 
 
+def test_batched_read():
+    """Test reading all epochs from disk with few reads
+    """
+    # overlapping, adjacent, unordered and truncated epochs
+    first, last = raw.first_samp, raw.last_samp
+    samps = [first + 20, first + 400, first + 150, first + 170, first + 820,
+             first + 5000, first + 5000, last - 200, last - 50]
+    events_b = np.array([[s, 0, 1] for s in samps])
+    for kwargs in [dict(), dict(detrend=1, decim=3, baseline=(None, None)),
+                   dict(proj='delayed', reject=dict(grad=4000e-13)),
+                   dict(reject=reject, flat=flat)]:
+        epochs = Epochs(raw, events_b, event_id, tmin, tmax, picks=picks,
+                        **kwargs)
+        data_iter = np.array([e for e in epochs])
+        data = epochs.get_data()
+        epochs_pre = Epochs(raw, events_b, event_id, tmin, tmax,
+                            picks=picks, preload=True, **kwargs)
+        assert_equal(epochs.drop_log, epochs_pre.drop_log)
+        assert_array_equal(epochs.selection, epochs_pre.selection)
+        if len(data_iter) > 0:
+            assert_allclose(epochs_pre.get_data(), data_iter, rtol=1e-10,
+                            atol=1e-20)
+            assert_allclose(data, data_iter, rtol=1e-10, atol=1e-20)
+        assert_equal(epochs.drop_log[0], ['NO_DATA'])
+        assert_equal(epochs.drop_log[-1], ['TOO_SHORT'])
+
+
+def test_batched_reject():
+    """Test rejection of all epochs at once
+    """
+    epochs = Epochs(raw, events, event_id, tmin, tmax, picks=picks,
+                    preload=True)
+    data = epochs.get_data()
+    ch_names = epochs.ch_names
+    idx = channel_indices_by_type(epochs.info)
+    reject_ = dict(grad=1000e-13, mag=4e-12, eeg=80e-6, eog=150e-6)
+    flat_ = dict(grad=1e-13, mag=1e-15)
+    for kwargs in [dict(reject=reject_, flat=None),
+                   dict(reject=None, flat=flat_),
+                   dict(reject=reject_, flat=flat_,
+                        ignore_chs=['MEG 2443', 'EEG 053'])]:
+        bad_lists = _is_good_batch(data, ch_names, idx, **kwargs)
+        assert_equal(len(bad_lists), len(data))
+        if kwargs['reject'] is not None:
+            assert_true(any(b is not None for b in bad_lists))
+        for epoch, bad_list in zip(data, bad_lists):
+            is_good, offenders = _is_good(epoch, ch_names, idx,
+                                          full_report=True, **kwargs)
+            assert_equal(is_good, bad_list is None)
+            assert_equal(offenders, bad_list)
+
+    # same drop log with and without preload, with a rejection window
+    for reject_tmin, reject_tmax in [(None, None), (0., .1)]:
+        kwargs = dict(reject=reject_, reject_tmin=reject_tmin,
+                      reject_tmax=reject_tmax)
+        epochs = Epochs(raw, events, event_id, tmin, tmax, picks=picks,
+                        **kwargs)
+        epochs.drop_bad_epochs()
+        epochs_pre = Epochs(raw, events, event_id, tmin, tmax, picks=picks,
+                            preload=True, **kwargs)
+        assert_equal(epochs.drop_log, epochs_pre.drop_log)
+        goods = [epochs._is_good_epoch(e) for e in epochs_pre.get_data()]
+        assert_equal(epochs_pre._is_good_epochs(epochs_pre.get_data()),
+                     goods)
+
+
+def test_epochs_dtype():
+    """Test single precision epochs
+    """
+    raw_32 = io.Raw(raw_fname, add_eeg_ref=False, dtype='float32')
+    epochs = Epochs(raw, events[:5], event_id, tmin, tmax, picks=picks,
+                    detrend=1, preload=True)
+    data = epochs.get_data()
+    for preload in (False, True):
+        epochs_32 = Epochs(raw_32, events[:5], event_id, tmin, tmax,
+                           picks=picks, detrend=1, preload=preload)
+        data_32 = epochs_32.get_data()
+        assert_equal(data_32.dtype, np.float32)
+        assert_allclose(data_32, data, rtol=1e-4,
+                        atol=1e-4 * np.abs(data).max())
+        evoked_32 = epochs_32.average()
+        assert_equal(evoked_32.data.dtype, np.float32)
+        assert_allclose(evoked_32.data, epochs.average().data, rtol=1e-4,
+                        atol=1e-4 * np.abs(evoked_32.data).max())
+        for evoked in epochs_32.iter_evoked():
+            assert_equal(evoked.data.dtype, np.float32)
+    # the data type can be given explicitly
+    epochs_64 = Epochs(raw_32, events[:5], event_id, tmin, tmax, picks=picks,
+                       dtype='float64')
+    assert_equal(epochs_64.get_data().dtype, np.float64)
+    assert_raises(ValueError, Epochs, raw, events, event_id, tmin, tmax,
+                  dtype=int)
+
+    # single precision I/O
+    temp_fname = op.join(tempdir, 'test-epo.fif')
+    epochs.save(temp_fname)
+    epochs_read = read_epochs(temp_fname, dtype='float32')
+    assert_equal(epochs_read.get_data().dtype, np.float32)
+    assert_equal(epochs_read.average().data.dtype, np.float32)
+    epochs_arr = EpochsArray(data, epochs.info, epochs.events,
+                             tmin=epochs.tmin, dtype=np.float32)
+    assert_equal(epochs_arr.get_data().dtype, np.float32)
+    assert_allclose(epochs_arr.get_data(), data, rtol=1e-6)
+
+
 def test_iter_evoked():
     """Test the iterator for epochs -> evoked
     """
@@ -1193,4 +1508,28 @@ def test_array_epochs():
                          reject_tmin=0.1, reject_tmax=0.2)
     assert_equal(len(epochs), len(events) - 2)
     assert_equal(epochs.drop_log[0], ['EEG 006'])
-    assert_equal(len(events), len(epochs.selection))
+    assert_equal(len(epochs), len(epochs.selection))
+    assert_equal(len(events), len(epochs.drop_log))
+
+    # zero-copy construction
+    epochs = EpochsArray(data, info, events=events, event_id=event_id,
+                         tmin=-.2, copy=False)
+    assert_true(epochs._data is data)
+    epochs = EpochsArray(data, info, events=events, event_id=event_id)
+    assert_true(epochs._data is not data)
+    assert_array_equal(epochs._data, data)
+    data_mmap = np.memmap(op.join(tempdir, 'epochs.dat'), dtype=np.float32,
+                          mode='w+', shape=data.shape)
+    data_mmap[:] = data
+    epochs = EpochsArray(data_mmap, info, events=events, event_id=event_id,
+                         copy=False)
+    assert_true(epochs._data is data_mmap)
+    assert_equal(epochs._dtype, np.float32)
+    assert_raises(ValueError, EpochsArray, data_mmap, info, events,
+                  dtype='float64', copy=False)
+    assert_raises(ValueError, EpochsArray, data[:, :, ::2], info, events,
+                  copy=False)
+    assert_raises(ValueError, EpochsArray, data.astype(int), info, events,
+                  copy=False)
+    assert_raises(TypeError, EpochsArray, data.tolist(), info, events,
+                  copy=False)
@@ -13,8 +13,9 @@ from numpy.testing import (assert_array_almost_equal, assert_equal,
                            assert_array_equal, assert_allclose)
 from nose.tools import assert_true, assert_raises, assert_not_equal
 
-from mne import equalize_channels, pick_types, read_evokeds, write_evokeds
-from mne.evoked import _get_peak, EvokedArray
+from mne import (equalize_channels, pick_types, read_evokeds, write_evokeds,
+                 Evoked, EvokedIndex, grand_average_evokeds)
+from mne.evoked import _get_peak, EvokedArray, merge_evoked
 from mne.epochs import EpochsArray
 
 from mne.utils import _TempDir, requires_pandas, requires_nitime
@@ -101,6 +102,97 @@ def test_io_evoked():
     assert_true(len(w) == 2)
 
 
+def test_evoked_index():
+    """Test reading evoked datasets on demand from an index
+    """
+    types = ['Left Auditory', 'Right Auditory', 'Left visual', 'Right visual']
+    aves = read_evokeds(fname)
+    for this_fname in (fname, fname_gz):
+        index = EvokedIndex(this_fname)
+        assert_equal(len(index), 4)
+        assert_equal(index.comments, types)
+        assert_equal(index.kinds, ['average'] * 4)
+        assert_equal(index.naves, [ave.nave for ave in aves])
+        assert_true(this_fname in repr(index))
+        for ave, ave2, ave3 in zip(aves, index.read(), index.read(types)):
+            for this_ave in (ave2, ave3):
+                assert_array_almost_equal(ave.data, this_ave.data)
+                assert_array_almost_equal(ave.times, this_ave.times)
+                assert_equal(ave.comment, this_ave.comment)
+                assert_equal(ave.nave, this_ave.nave)
+                assert_equal(ave.kind, this_ave.kind)
+            # the info is parsed once but not shared between datasets
+            assert_true(ave2.info is not index.info)
+            assert_equal(ave2.info['ch_names'], ave.info['ch_names'])
+    ave = index.read('Right visual', baseline=(None, 0), proj=False)
+    ave2 = Evoked(index, 'Right visual', baseline=(None, 0), proj=False)
+    ave3 = read_evokeds(fname, 3, baseline=(None, 0), proj=False)
+    assert_array_almost_equal(ave.data, ave3.data)
+    assert_array_almost_equal(ave2.data, ave3.data)
+    assert_true(not ave.proj)
+    assert_raises(ValueError, index.read, 'foo')
+    assert_raises(ValueError, index.read, 'Left Auditory', kind='stderr')
+    assert_raises(ValueError, index.read, 4)
+    assert_raises(ValueError, EvokedIndex, None)
+
+
+def test_grand_average_evokeds():
+    """Test streaming grand average of evoked files
+    """
+    ave = read_evokeds(fname, 'Left Auditory')
+    rng = np.random.RandomState(0)
+    naves = [3, 10, 1, 7]
+    fnames, aves = list(), list()
+    for ii, nave in enumerate(naves):
+        ave2 = ave.copy()
+        ave2.data = rng.randn(*ave.data.shape)
+        ave2.nave = nave
+        ave2.info['bads'] = [ave.ch_names[ii]]
+        aves.append(ave2)
+        fnames.append(op.join(tempdir, 'ga%d-ave.fif' % ii))
+        write_evokeds(fnames[-1], ave2)
+    aves = [read_evokeds(f, 0, proj=False) for f in fnames]
+    data = np.array([a.data for a in aves])
+    weights = np.array(naves, float)[:, np.newaxis, np.newaxis]
+    mean = np.sum(weights * data, axis=0) / np.sum(weights)
+    var = np.sum(weights * (data - mean) ** 2, axis=0) / np.sum(weights)
+    n_eff = np.sum(weights) ** 2 / np.sum(weights ** 2)
+    std_err = np.sqrt(var / n_eff)
+    for n_jobs in (1, 2):
+        ga, se = grand_average_evokeds(fnames, proj=False, return_std=True,
+                                       n_jobs=n_jobs)
+        assert_allclose(ga.data, mean, rtol=1e-6, atol=1e-20)
+        assert_allclose(se.data, std_err, rtol=1e-6, atol=1e-20)
+        assert_equal(ga.nave, sum(naves))
+        assert_equal(se.kind, 'standard_error')
+        assert_equal(ga.kind, 'average')
+        assert_equal(sorted(ga.info['bads']), sorted(ave.ch_names[:4]))
+    ga2 = merge_evoked(aves)
+    assert_allclose(ga2.data, mean, rtol=1e-6, atol=1e-20)
+    assert_equal(ga2.nave, sum(naves))
+
+    # channels are matched by name
+    ave2 = aves[1].copy()
+    ave2.info['chs'] = ave2.info['chs'][::-1]
+    ave2.info['ch_names'] = ave2.info['ch_names'][::-1]
+    ave2.data = ave2.data[::-1].copy()
+    assert_allclose(merge_evoked([aves[0], ave2]).data,
+                    merge_evoked(aves[:2]).data)
+    write_evokeds(fnames[1], ave2)
+    ga = grand_average_evokeds(fnames, condition='Left Auditory', proj=False)
+    assert_allclose(ga.data, mean, rtol=1e-6, atol=1e-20)
+
+    ave2.drop_channels(ave2.ch_names[:1])
+    assert_raises(ValueError, merge_evoked, [aves[0], ave2])
+    write_evokeds(fnames[1], ave2)
+    assert_raises(ValueError, grand_average_evokeds, fnames)
+    ave2 = aves[1].copy()
+    ave2.crop(0, None)
+    assert_raises(ValueError, merge_evoked, [aves[0], ave2])
+    assert_raises(ValueError, grand_average_evokeds, [])
+    assert_raises(ValueError, grand_average_evokeds, fnames, None)
+
+
 def test_shift_time_evoked():
     """ Test for shifting of time scale
     """
@@ -0,0 +1,68 @@
+import gc
+import os.path as op
+import pickle
+
+from nose.tools import assert_equal, assert_raises, assert_true
+import numpy as np
+from numpy.testing import assert_array_equal, assert_allclose
+
+from mne import create_info, EpochsArray
+from mne.io import RawArray
+from mne.parallel import parallel_func, to_shared_memory
+
+
+def _set_row(data, ii):
+    """Helper to modify data in a worker"""
+    data[ii] = ii
+    return data[ii].sum()
+
+
+def test_to_shared_memory():
+    """Test sharing of arrays with parallel workers
+    """
+    data = np.random.RandomState(0).randn(10, 1000)
+    shared = to_shared_memory(data)
+    assert_true(to_shared_memory(shared) is shared)
+    assert_array_equal(shared, data)
+    fname = shared.filename
+    assert_true(op.isfile(fname))
+
+    # views are pickled by reference, not by value
+    view = shared[2:5, ::2]
+    assert_true(len(pickle.dumps(view, 2)) < 1000)
+    view_2 = pickle.loads(pickle.dumps(view, 2))
+    assert_array_equal(view_2, data[2:5, ::2])
+    # results of operations are pickled by value
+    assert_array_equal(pickle.loads(pickle.dumps(shared * 2, 2)), data * 2)
+    view_2[0, 0] = 1e3
+    assert_equal(shared[2, 0], 1e3)
+
+    # modifications done by the workers are visible
+    parallel, p_fun, _ = parallel_func(_set_row, 2)
+    sums = parallel([p_fun(shared, ii) for ii in range(len(shared))])
+    assert_array_equal(sums, np.arange(10) * 1000)
+    del shared, view, view_2
+    gc.collect()
+    assert_true(not op.isfile(fname))
+
+
+def test_share_memory():
+    """Test moving Raw and Epochs data to shared memory
+    """
+    info = create_info(['EEG %03d' % ii for ii in range(4)], 1000.,
+                       ['eeg'] * 4)
+    data = np.random.RandomState(0).randn(4, 2000)
+    raw = RawArray(data.copy(), info)
+    raw_2 = raw.copy().share_memory()
+    raw.filter(None, 40., n_jobs=1)
+    raw_2.filter(None, 40., n_jobs=2)
+    assert_allclose(raw_2._data, raw._data)
+
+    epochs = EpochsArray(data.reshape(4, 4, 500), info,
+                         np.array([[0, 0, 1], [500, 0, 1],
+                                   [1000, 0, 1], [1500, 0, 1]]))
+    data_2 = epochs.get_data().copy()
+    assert_true(epochs.share_memory() is epochs)
+    assert_array_equal(epochs.get_data(), data_2)
+    epochs.preload = False
+    assert_raises(RuntimeError, epochs.share_memory)
@@ -1091,6 +1091,7 @@ known_config_types = [
     'MNE_BROWSE_RAW_SIZE',
     'MNE_CUDA_IGNORE_PRECISION',
     'MNE_DATA',
+    'MNE_DATA_DTYPE',
     'MNE_DATASETS_MEGSIM_PATH',
     'MNE_DATASETS_SAMPLE_PATH',
     'MNE_DATASETS_SPM_FACE_PATH',
@@ -1100,6 +1101,8 @@ known_config_types = [
     'SUBJECTS_DIR',
     'MNE_CACHE_DIR',
     'MNE_MEMMAP_MIN_SIZE',
+    'MNE_FIFF_INDEX_DIR',
+    'MNE_SHARED_MEMORY_DIR',
     'MNE_SKIP_SAMPLE_DATASET_TESTS',
     'MNE_DATASETS_SPM_FACE_DATASETS_TESTS'
     ]
@@ -1557,6 +1560,53 @@ def _check_fname(fname, overwrite):
             logger.info('Overwriting existing file.')
 
 
+def _check_dtype(dtype):
+    """Helper to get the floating point type used to store data
+
+    If dtype is None, the MNE_DATA_DTYPE config value is used (float64 if
+    it is not set).
+    """
+    if dtype is None:
+        dtype = get_config('MNE_DATA_DTYPE', 'float64')
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError('dtype must be float32 or float64, got %s' % dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError('dtype must be float32 or float64, got %s' % dtype)
+    return dtype
+
+
+def _check_data_array(data, dtype=None, copy=True):
+    """Helper to get the array stored by RawArray and EpochsArray
+
+    With copy=True, data are copied (and cast to dtype, promoted to complex
+    if needed). With copy=False, data must already be a C-contiguous
+    float32/float64 (or complex64/complex128) ndarray or np.memmap, which
+    is then returned as is.
+    """
+    if copy:
+        dtype = _check_dtype(dtype)
+        if np.any(np.iscomplex(data)):
+            dtype = np.result_type(dtype, np.complex64)
+        return np.array(data, dtype=dtype)
+    if not isinstance(data, np.ndarray):
+        raise TypeError('data must be an ndarray or np.memmap when '
+                        'copy=False, got %s' % type(data))
+    if data.dtype not in (np.float32, np.float64,
+                          np.complex64, np.complex128):
+        raise ValueError('data must be of type float32, float64, complex64 '
+                         'or complex128 when copy=False, got %s'
+                         % data.dtype)
+    if dtype is not None and _check_dtype(dtype) != data.real.dtype:
+        raise ValueError('dtype %s does not match the data type %s, use '
+                         'copy=True to cast the data'
+                         % (np.dtype(dtype), data.dtype))
+    if not data.flags['C_CONTIGUOUS']:
+        raise ValueError('data must be C-contiguous when copy=False')
+    return data
+
+
 def _check_subject(class_subject, input_subject, raise_error=True):
     """Helper to get subject name from class"""
     if input_subject is not None:
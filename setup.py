@@ -76,6 +76,7 @@ if __name__ == "__main__":
                     'mne.io.edf', 'mne.io.edf.tests',
                     'mne.io.egi', 'mne.io.egi.tests',
                     'mne.io.fiff', 'mne.io.fiff.tests',
+                    'mne.io.hdf5', 'mne.io.hdf5.tests',
                     'mne.io.kit', 'mne.io.kit.tests',
                     'mne.forward', 'mne.forward.tests',
                     'mne.viz', 'mne.viz.tests',